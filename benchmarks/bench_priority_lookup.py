@@ -0,0 +1,74 @@
+"""
+Compara el cálculo de prioridad por tablas precalculadas con la versión
+original basada en comparaciones.
+
+Uso: python -m benchmarks.bench_priority_lookup
+"""
+import timeit
+
+import numpy as np
+
+from src.simulator import RiskSimulator
+
+
+def branchy_calculate_priority(probability: int, impact: int):
+    """Implementación original de `calculate_priority`, como referencia."""
+    if not (1 <= probability <= 10) or not (1 <= impact <= 10):
+        raise ValueError("Probabilidad e impacto deben estar entre 1 y 10")
+    
+    priority_value = probability * impact
+    if priority_value <= 30:
+        return priority_value, "bajo"
+    elif 31 <= priority_value <= 70:
+        return priority_value, "medio"
+    else:
+        return priority_value, "alto"
+
+
+def main(num_pairs: int = 1_000_000, repeat: int = 5):
+    simulator = RiskSimulator()
+    rng = np.random.default_rng(0)
+    probabilities = rng.integers(1, 11, size=num_pairs)
+    impacts = rng.integers(1, 11, size=num_pairs)
+    pairs = list(zip(probabilities.tolist(), impacts.tolist()))
+    
+    def run_branchy():
+        for p, i in pairs:
+            branchy_calculate_priority(p, i)
+    
+    def run_lookup():
+        calculate = simulator.calculate_priority
+        for p, i in pairs:
+            calculate(p, i)
+    
+    def run_array_branchy():
+        priority = probabilities * impacts
+        return priority, (priority > 30).astype(np.intp) + (priority > 70)
+    
+    def run_array_lookup():
+        return simulator._lookup_priorities(probabilities, impacts)
+    
+    def run_array_validated():
+        return simulator.calculate_priorities(probabilities, impacts)
+    
+    results = [
+        ("escalar, comparaciones", run_branchy),
+        ("escalar, tabla", run_lookup),
+        ("vectorizado, comparaciones", run_array_branchy),
+        ("vectorizado, tabla", run_array_lookup),
+        ("vectorizado, tabla validada", run_array_validated)
+    ]
+    
+    print(f"Pares evaluados: {num_pairs:,}")
+    timings = {}
+    for name, func in results:
+        best = min(timeit.repeat(func, number=1, repeat=repeat))
+        timings[name] = best
+        print(f"{name:<28} {best:8.4f} s  {num_pairs / best:14,.0f} pares/s")
+    
+    print(f"\nMejora escalar: {timings['escalar, comparaciones'] / timings['escalar, tabla']:.2f}x")
+    print(f"Mejora vectorizada: {timings['vectorizado, comparaciones'] / timings['vectorizado, tabla']:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
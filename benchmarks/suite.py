@@ -0,0 +1,212 @@
+"""
+Suite de benchmarks de las rutas críticas del simulador.
+
+Mide riesgos por segundo y memoria pico de la generación escalar y
+vectorizada, el cálculo de prioridad, la agregación de estadísticas, la
+exportación y la distribución exacta de la suma de prioridades. No usa
+la interfaz gráfica, por lo que corre sin display.
+
+Uso:
+    python -m benchmarks.suite                            # solo muestra resultados
+    python -m benchmarks.suite --save baseline.json       # guarda una línea base
+    python -m benchmarks.suite --compare baseline.json    # falla si hay regresiones
+"""
+import argparse
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import Callable, Dict, List
+
+import numpy as np
+
+from src.analytic import EXACT_SUM_LIMIT
+from src.export import export_columnar, export_csv
+from src.simulator import RiskSimulator, RiskStatistics
+
+# Las rutas escalares son lentas: no se miden por encima de este tamaño
+MAX_SCALAR_SIZE = 10 ** 5
+
+# Caída de throughput tolerada antes de marcar una regresión (15 %)
+DEFAULT_THRESHOLD = 0.15
+
+# Tamaño máximo de los casos que solo tienen sentido hasta cierto tamaño
+CASE_SIZE_LIMITS = {"priority_sum_pmf": EXACT_SUM_LIMIT}
+
+
+def _cases(workdir: str) -> List[tuple]:
+    """Casos de benchmark: (nombre, es_escalar, fábrica que recibe el tamaño)."""
+    def generate_risk(size):
+        simulator = RiskSimulator(rng=0)
+        def run():
+            for _ in range(size):
+                simulator.generate_risk()
+        return run
+    
+    def calculate_priority(size):
+        simulator = RiskSimulator(rng=0)
+        pairs = list(zip(*(np.random.default_rng(0).integers(1, 11, size=(2, size)).tolist())))
+        def run():
+            for p, i in pairs:
+                simulator.calculate_priority(p, i)
+        return run
+    
+    def calculate_priorities(size):
+        simulator = RiskSimulator(rng=0)
+        probabilities, impacts = np.random.default_rng(0).integers(1, 11, size=(2, size))
+        return lambda: simulator.calculate_priorities(probabilities, impacts)
+    
+    def run_sprint_simulation(size):
+        simulator = RiskSimulator(rng=0)
+        return lambda: simulator.run_sprint_simulation(size)
+    
+    def run_sprint_simulation_batch(size):
+        simulator = RiskSimulator(rng=0)
+        return lambda: simulator.run_sprint_simulation_batch(size)
+    
+    def statistics(size):
+        batches = list(RiskSimulator(rng=0).iter_risk_batches(size))
+        def run():
+            stats = RiskStatistics()
+            for batch in batches:
+                stats.update(batch)
+        return run
+    
+    def csv_export(size):
+        simulator = RiskSimulator(rng=0)
+        path = os.path.join(workdir, "bench.csv")
+        return lambda: export_csv(path, simulator.iter_risk_batches(size))
+    
+    def columnar_export(size):
+        simulator = RiskSimulator(rng=0)
+        path = os.path.join(workdir, "bench.rskcol")
+        return lambda: export_columnar(path, simulator.iter_risk_batches(size))
+    
+    def priority_sum_pmf(size):
+        model = RiskSimulator(rng=0).analytic()
+        return lambda: model.priority_sum_pmf(size)
+    
+    return [
+        ("generate_risk", True, generate_risk),
+        ("calculate_priority", True, calculate_priority),
+        ("calculate_priorities", False, calculate_priorities),
+        ("run_sprint_simulation", True, run_sprint_simulation),
+        ("run_sprint_simulation_batch", False, run_sprint_simulation_batch),
+        ("statistics", False, statistics),
+        ("export_csv", True, csv_export),
+        ("export_columnar", False, columnar_export),
+        ("priority_sum_pmf", False, priority_sum_pmf)
+    ]
+
+
+def measure(func: Callable[[], object], size: int, repeat: int = 3) -> Dict:
+    """Mejor tiempo de `repeat` ejecuciones y memoria pico de una ejecución aparte."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    
+    # tracemalloc ralentiza la ejecución, por eso se mide por separado
+    tracemalloc.start()
+    try:
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    
+    return {
+        "size": size,
+        "seconds": best,
+        "risks_per_sec": size / best if best > 0 else float("inf"),
+        "peak_memory_bytes": peak
+    }
+
+
+def run_suite(sizes: List[int], repeat: int = 3, only: List[str] = None,
+              max_scalar_size: int = MAX_SCALAR_SIZE, report: Callable[[str, Dict], None] = None) -> Dict:
+    """Ejecuta los casos y devuelve los resultados indexados por 'caso[tamaño]'."""
+    results = {}
+    with tempfile.TemporaryDirectory() as workdir:
+        for name, scalar, factory in _cases(workdir):
+            if only and name not in only:
+                continue
+            for size in sizes:
+                if scalar and size > max_scalar_size or size > CASE_SIZE_LIMITS.get(name, size):
+                    continue
+                key = f"{name}[{size}]"
+                results[key] = measure(factory(size), size, repeat)
+                if report is not None:
+                    report(key, results[key])
+    return results
+
+
+def compare_results(baseline: Dict, current: Dict, threshold: float = DEFAULT_THRESHOLD) -> List[Dict]:
+    """
+    Lista los casos cuyo throughput cayó más de `threshold` respecto de la línea base.
+    
+    Solo se comparan los casos presentes en ambos resultados.
+    """
+    regressions = []
+    for key, result in current.items():
+        reference = baseline.get(key)
+        if reference is None:
+            continue
+        ratio = result["risks_per_sec"] / reference["risks_per_sec"]
+        if ratio < 1 - threshold:
+            regressions.append({
+                "case": key,
+                "baseline_risks_per_sec": reference["risks_per_sec"],
+                "risks_per_sec": result["risks_per_sec"],
+                "ratio": ratio
+            })
+    return regressions
+
+
+def _print_result(key: str, result: Dict):
+    print(f"{key:<40} {result['seconds']:10.4f} s {result['risks_per_sec']:16,.0f} riesgos/s "
+          f"{result['peak_memory_bytes'] / 2 ** 20:10.1f} MiB")
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmarks del simulador de riesgos")
+    parser.add_argument("--min-exp", type=int, default=2, help="Tamaño mínimo como potencia de 10")
+    parser.add_argument("--max-exp", type=int, default=7, help="Tamaño máximo como potencia de 10")
+    parser.add_argument("--repeat", type=int, default=3, help="Repeticiones por caso")
+    parser.add_argument("--only", nargs="*", help="Casos a ejecutar")
+    parser.add_argument("--save", help="Guarda los resultados como línea base en este JSON")
+    parser.add_argument("--compare", help="Línea base JSON contra la que comparar")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="Caída de throughput tolerada (0.15 = 15 %%)")
+    args = parser.parse_args(argv)
+    
+    sizes = [10 ** e for e in range(args.min_exp, args.max_exp + 1)]
+    results = run_suite(sizes, args.repeat, args.only, report=_print_result)
+    
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as f:
+            json.dump({
+                "python": platform.python_version(),
+                "numpy": np.__version__,
+                "machine": platform.machine(),
+                "results": results
+            }, f, indent=2)
+    
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)["results"]
+        regressions = compare_results(baseline, results, args.threshold)
+        for regression in regressions:
+            print(f"REGRESIÓN {regression['case']}: {regression['risks_per_sec']:,.0f} riesgos/s "
+                  f"({regression['ratio']:.0%} de la línea base)", file=sys.stderr)
+        if regressions:
+            return 1
+    
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
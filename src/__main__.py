@@ -0,0 +1,6 @@
+"""Permite ejecutar la línea de comandos con `python -m src`."""
+import sys
+
+from src.cli import main
+
+sys.exit(main())
@@ -0,0 +1,235 @@
+"""
+Monte Carlo con parada adaptativa.
+
+En lugar de fijar de antemano la cantidad de sprints, `run_adaptive`
+simula en lotes crecientes y, después de cada lote, calcula intervalos
+de confianza para la prioridad promedio y para la proporción de cada
+categoría. Se detiene en cuanto todos los semianchos están por debajo de
+la precisión pedida, cuando se agota el tiempo disponible o al llegar a
+`max_sprints`.
+
+Los riesgos son independientes entre sí, así que los intervalos se
+calculan sobre los riesgos: aproximación normal para la prioridad
+promedio y Agresti-Coull para las proporciones, que no colapsa a ancho
+cero mientras una categoría todavía no apareció.
+
+Los lotes son bloques completos de SPRINTS_PER_STREAM sprints con los
+mismos flujos que `run_monte_carlo`: los primeros `n` sprints de una
+corrida adaptativa son exactamente los de `run_monte_carlo(n, seed=...)`.
+"""
+import math
+import os
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor
+from contextlib import nullcontext
+from statistics import NormalDist
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from src.simulator import (PRIORITY_CATEGORIES, SPRINTS_PER_STREAM, RiskSimulator, RiskStatistics,
+                           SprintAggregates, _simulate_block_range)
+
+# Semiancho objetivo del intervalo de la prioridad promedio (en puntos de prioridad)
+DEFAULT_PRIORITY_PRECISION = 0.5
+
+# Semiancho objetivo de los intervalos de las proporciones por categoría
+DEFAULT_RATE_PRECISION = 0.005
+
+DEFAULT_INITIAL_SPRINTS = 4 * SPRINTS_PER_STREAM
+DEFAULT_MAX_SPRINTS = 10_000_000
+
+# Cada lote lleva el total simulado a `growth` veces el anterior
+DEFAULT_GROWTH = 2.0
+
+# Motivos de parada
+STOP_REASONS = {
+    "precision": "precisión alcanzada",
+    "tiempo": "tiempo agotado",
+    "maximo": "máximo de sprints"
+}
+
+
+def confidence_intervals(stats: RiskStatistics, confidence: float = 0.95) -> Dict[str, Tuple[float, float]]:
+    """Intervalos de la prioridad promedio y de la proporción de cada categoría."""
+    z = NormalDist().inv_cdf(0.5 + confidence / 2)
+    count = stats.count
+    half_width = z * stats.std / math.sqrt(count) if count else math.inf
+    intervals = {"prioridad_promedio": (stats.mean - half_width, stats.mean + half_width)}
+    
+    adjusted_count = count + z * z
+    for k, category in enumerate(PRIORITY_CATEGORIES):
+        center = (int(stats.category_counts[k]) + z * z / 2) / adjusted_count
+        half_width = z * math.sqrt(center * (1 - center) / adjusted_count)
+        intervals[category] = (center - half_width, center + half_width)
+    return intervals
+
+
+def _half_widths(intervals: Dict[str, Tuple[float, float]]) -> Tuple[float, float]:
+    """Semiancho de la prioridad promedio y el mayor de las categorías."""
+    low, high = intervals["prioridad_promedio"]
+    rates = max((intervals[c][1] - intervals[c][0]) / 2 for c in PRIORITY_CATEGORIES)
+    return (high - low) / 2, rates
+
+
+class AdaptiveResult:
+    """Resultado de `run_adaptive`: los agregados simulados y cómo se llegó a ellos."""
+    
+    def __init__(self, aggregates: SprintAggregates, max_sprints: int, reason: str,
+                 seconds: float, confidence: float, history: List[Dict]):
+        self.aggregates = aggregates
+        self.max_sprints = max_sprints
+        # Una clave de STOP_REASONS
+        self.reason = reason
+        self.seconds = seconds
+        self.confidence = confidence
+        # Un registro por lote: sprints acumulados, segundos y semianchos
+        self.history = history
+    
+    @property
+    def statistics(self) -> RiskStatistics:
+        return self.aggregates.statistics
+    
+    @property
+    def num_sprints(self) -> int:
+        return len(self.aggregates)
+    
+    @property
+    def saved_sprints(self) -> int:
+        """Sprints que no hizo falta simular respecto de `max_sprints`."""
+        return self.max_sprints - self.num_sprints
+    
+    @property
+    def converged(self) -> bool:
+        return self.reason == "precision"
+    
+    def intervals(self) -> Dict[str, Tuple[float, float]]:
+        return confidence_intervals(self.statistics, self.confidence)
+    
+    def summary(self) -> Dict:
+        """Resumen serializable a JSON."""
+        intervals = self.intervals()
+        priority_width, rate_width = _half_widths(intervals)
+        return {
+            "sprints": self.num_sprints,
+            "sprints_maximos": self.max_sprints,
+            "sprints_ahorrados": self.saved_sprints,
+            "riesgos": self.statistics.count,
+            "motivo": self.reason,
+            "segundos": self.seconds,
+            "confianza": self.confidence,
+            "semiancho_prioridad": priority_width,
+            "semiancho_categorias": rate_width,
+            "intervalos": {name: list(interval) for name, interval in intervals.items()},
+            "lotes": self.history
+        }
+
+
+def run_adaptive(simulator: RiskSimulator, num_risks: int = 5,
+                 priority_precision: Optional[float] = DEFAULT_PRIORITY_PRECISION,
+                 rate_precision: Optional[float] = DEFAULT_RATE_PRECISION,
+                 confidence: float = 0.95, time_budget: Optional[float] = None,
+                 max_sprints: int = DEFAULT_MAX_SPRINTS,
+                 initial_sprints: int = DEFAULT_INITIAL_SPRINTS, growth: float = DEFAULT_GROWTH,
+                 seed=None, max_workers: Optional[int] = None,
+                 executor: Optional[Executor] = None) -> AdaptiveResult:
+    """
+    Simula sprints de `num_risks` riesgos en lotes crecientes hasta que
+    el semiancho del intervalo de la prioridad promedio es a lo sumo
+    `priority_precision` y el de cada proporción por categoría a lo sumo
+    `rate_precision` (None ignora ese criterio).
+    
+    `time_budget` (segundos) acota la duración: el último lote se achica
+    para no pasarse según el ritmo medido hasta entonces. `seed`,
+    `max_workers` y `executor` funcionan como en `run_monte_carlo`.
+    """
+    if num_risks < 1:
+        raise ValueError("La parada adaptativa necesita al menos un riesgo por sprint")
+    if max_sprints < 1 or initial_sprints < 1:
+        raise ValueError("Las cantidades de sprints deben ser positivas")
+    if growth <= 1.0:
+        raise ValueError("El factor de crecimiento de los lotes debe ser mayor que 1")
+    if not 0.0 < confidence < 1.0:
+        raise ValueError("El nivel de confianza debe estar entre 0 y 1")
+    for name, value in (("precisión", priority_precision), ("precisión por categoría", rate_precision),
+                        ("tiempo disponible", time_budget)):
+        if value is not None and value <= 0:
+            raise ValueError(f"La {name} debe ser positiva")
+    
+    seed_seq = simulator._run_seed_sequence(seed)
+    total_blocks = -(-max_sprints // SPRINTS_PER_STREAM)
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    max_workers = max(1, min(max_workers, total_blocks))
+    
+    statistics = RiskStatistics()
+    parts: List[SprintAggregates] = []
+    history: List[Dict] = []
+    done_blocks = 0
+    target_blocks = -(-initial_sprints // SPRINTS_PER_STREAM)
+    seconds_per_block = 0.0
+    start = time.perf_counter()
+    
+    # Un mismo pool para todos los lotes
+    if executor is None and max_workers == 1:
+        pool = nullcontext(None)
+    else:
+        pool = ProcessPoolExecutor(max_workers=max_workers) if executor is None else nullcontext(executor)
+    with pool as pool_executor:
+        while True:
+            next_blocks = min(total_blocks, max(done_blocks + 1, target_blocks))
+            if time_budget is not None and done_blocks:
+                # Con el ritmo medido, solo los bloques que caben en el tiempo restante
+                remaining = time_budget - (time.perf_counter() - start)
+                next_blocks = min(next_blocks, done_blocks + max(1, int(remaining / seconds_per_block)))
+            
+            num_sprints = (min(next_blocks * SPRINTS_PER_STREAM, max_sprints)
+                           - done_blocks * SPRINTS_PER_STREAM)
+            with simulator.instrumentation.stage("montecarlo", num_sprints * num_risks):
+                part = _simulate_blocks(simulator, seed_seq, done_blocks, next_blocks, max_sprints,
+                                        num_risks, pool_executor, max_workers)
+            parts.append(part)
+            statistics.merge(part.statistics)
+            done_blocks = next_blocks
+            
+            elapsed = time.perf_counter() - start
+            seconds_per_block = elapsed / done_blocks
+            priority_width, rate_width = _half_widths(confidence_intervals(statistics, confidence))
+            history.append({
+                "sprints": min(done_blocks * SPRINTS_PER_STREAM, max_sprints),
+                "segundos": elapsed,
+                "semiancho_prioridad": priority_width,
+                "semiancho_categorias": rate_width
+            })
+            
+            if ((priority_precision is not None or rate_precision is not None)
+                    and (priority_precision is None or priority_width <= priority_precision)
+                    and (rate_precision is None or rate_width <= rate_precision)):
+                reason = "precision"
+                break
+            if done_blocks == total_blocks:
+                reason = "maximo"
+                break
+            if time_budget is not None and elapsed + seconds_per_block > time_budget:
+                reason = "tiempo"
+                break
+            target_blocks = math.ceil(done_blocks * growth)
+    
+    aggregates = SprintAggregates.concatenate(parts)
+    simulator.instrumentation.count("riesgos", len(aggregates) * num_risks)
+    return AdaptiveResult(aggregates, max_sprints, reason, time.perf_counter() - start, confidence, history)
+
+
+def _simulate_blocks(simulator: RiskSimulator, seed_seq: np.random.SeedSequence, first_block: int,
+                     last_block: int, max_sprints: int, num_risks: int,
+                     executor: Optional[Executor], max_workers: int) -> SprintAggregates:
+    """Simula los bloques [first_block, last_block), repartidos entre los procesos si hay pool."""
+    if executor is None:
+        return _simulate_block_range(simulator, seed_seq, first_block, last_block, max_sprints, num_risks)
+    blocks_per_task = max(1, -(-(last_block - first_block) // max_workers))
+    futures = [
+        executor.submit(_simulate_block_range, simulator, seed_seq, block,
+                        min(block + blocks_per_task, last_block), max_sprints, num_risks)
+        for block in range(first_block, last_block, blocks_per_task)
+    ]
+    return SprintAggregates.concatenate([future.result() for future in futures])
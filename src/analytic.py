@@ -0,0 +1,213 @@
+"""
+Distribución exacta de los riesgos de un sprint, sin muestreo.
+
+La probabilidad y el impacto son independientes sobre 1..10, así que la
+distribución de `valor_prioridad` se obtiene sumando las 100 celdas de
+la grilla. Los conteos por categoría de un sprint de n riesgos son
+binomiales (multinomiales en conjunto) y la suma de prioridades es la
+convolución n-veces de la distribución de un riesgo.
+"""
+import math
+from statistics import NormalDist
+from typing import Dict, Tuple
+
+import numpy as np
+
+from src.simulator import MAX_PRIORITY, PRIORITY_CATEGORIES, PRIORITY_GRID_SIZE
+
+# Hasta este número de riesgos la suma de prioridades se calcula por convolución exacta
+# (con FFT, unos milisegundos); por encima se usa la aproximación normal
+EXACT_SUM_LIMIT = 500
+
+
+class AnalyticRiskModel:
+    """
+    Modelo analítico de un RiskSimulator.
+    
+    Responde valores esperados, probabilidades de cola e intervalos de
+    confianza en forma cerrada. Admite distribuciones no uniformes de
+    probabilidad e impacto mediante pesos sobre 1..10.
+    """
+    
+    def __init__(self, simulator, probability_weights=None, impact_weights=None):
+        self.probability_pmf = _normalize(probability_weights, "probabilidad")
+        self.impact_pmf = _normalize(impact_weights, "impacto")
+        
+        # Masa de cada celda de la grilla, acumulada por valor de prioridad y por categoría
+        size = PRIORITY_GRID_SIZE + 1
+        cell_mass = np.zeros((size, size))
+        cell_mass[1:, 1:] = np.outer(self.probability_pmf, self.impact_pmf)
+        cell_mass = cell_mass.ravel()
+        self.priority_pmf = np.bincount(simulator._priority_table, weights=cell_mass,
+                                        minlength=MAX_PRIORITY + 1)
+        self._category_probabilities = np.bincount(simulator._category_code_table, weights=cell_mass,
+                                                   minlength=len(PRIORITY_CATEGORIES))
+        
+        # Tipos, descripciones y mitigaciones siguen los pesos del catálogo
+        catalog = simulator.catalog
+        self._type_probabilities = {t: float(p) for t, p in
+                                    zip(catalog.risk_types, catalog.type_probabilities)}
+        description_mass = (np.repeat(catalog.type_probabilities,
+                                      [len(g) for g in catalog.tables.description_groups])
+                            * catalog.description_probabilities)
+        self._description_probabilities = _accumulate(catalog.tables.descriptions, description_mass)
+        mitigation_mass = (np.repeat(self._category_probabilities,
+                                     [len(g) for g in catalog.tables.mitigation_groups])
+                           * catalog.mitigation_probabilities)
+        self._mitigation_probabilities = _accumulate(catalog.tables.mitigations, mitigation_mass)
+        
+        values = np.arange(MAX_PRIORITY + 1)
+        self.mean = float(values @ self.priority_pmf)
+        self.variance = float((values - self.mean) ** 2 @ self.priority_pmf)
+        self._sum_pmf_cache = {}
+    
+    @property
+    def std(self) -> float:
+        return math.sqrt(self.variance)
+    
+    def category_probabilities(self) -> Dict[str, float]:
+        """Probabilidad de que un riesgo caiga en cada categoría."""
+        return {c: float(p) for c, p in zip(PRIORITY_CATEGORIES, self._category_probabilities)}
+    
+    def type_probabilities(self) -> Dict[str, float]:
+        return dict(self._type_probabilities)
+    
+    def description_probabilities(self) -> Dict[str, float]:
+        return dict(self._description_probabilities)
+    
+    def mitigation_probabilities(self) -> Dict[str, float]:
+        return dict(self._mitigation_probabilities)
+    
+    def expected_counts(self, num_risks: int) -> Dict[str, float]:
+        """Cantidad esperada de riesgos de cada categoría en un sprint."""
+        _check_count(num_risks)
+        return {c: num_risks * p for c, p in self.category_probabilities().items()}
+    
+    def count_distribution(self, category: str, num_risks: int) -> np.ndarray:
+        """Distribución binomial exacta del número de riesgos de `category` en un sprint."""
+        _check_count(num_risks)
+        return _binomial_pmf(num_risks, self._category_probability(category))
+    
+    def prob_at_least(self, category: str, k: int, num_risks: int) -> float:
+        """P(al menos `k` riesgos de `category` en un sprint de `num_risks` riesgos)."""
+        if k <= 0:
+            return 1.0
+        if k > num_risks:
+            return 0.0
+        return float(min(1.0, self.count_distribution(category, num_risks)[k:].sum()))
+    
+    def count_interval(self, category: str, num_risks: int,
+                       confidence: float = 0.95) -> Tuple[int, int]:
+        """Intervalo central que contiene el conteo de `category` con al menos `confidence`."""
+        cdf = np.cumsum(self.count_distribution(category, num_risks))
+        return _central_interval(cdf, confidence)
+    
+    def prob_max_at_least(self, priority_value: int, num_risks: int) -> float:
+        """P(el riesgo más crítico del sprint tenga prioridad >= `priority_value`)."""
+        _check_count(num_risks)
+        below = float(self.priority_pmf[:max(0, min(priority_value, MAX_PRIORITY + 1))].sum())
+        return 1.0 - below ** num_risks
+    
+    def priority_sum_pmf(self, num_risks: int) -> np.ndarray:
+        """
+        Distribución exacta de la suma de prioridades de un sprint (índice = suma).
+        
+        La potencia de la convolución se calcula con una sola FFT de
+        longitud 100·n + 1, en O(n log n): menos de 10 ms para 500 riesgos.
+        Los errores de redondeo quedan cerca de 1e-16 por valor.
+        """
+        _check_count(num_risks)
+        if num_risks not in self._sum_pmf_cache:
+            length = MAX_PRIORITY * num_risks + 1
+            size = 1 << (length - 1).bit_length()
+            spectrum = np.fft.rfft(self.priority_pmf, size) ** num_risks
+            result = np.fft.irfft(spectrum, size)[:length]
+            # El redondeo de la FFT puede dejar valores apenas negativos
+            np.clip(result, 0.0, None, out=result)
+            self._sum_pmf_cache[num_risks] = result / result.sum()
+        return self._sum_pmf_cache[num_risks]
+    
+    def mean_priority_interval(self, num_risks: int, confidence: float = 0.95) -> Tuple[float, float]:
+        """
+        Intervalo para la prioridad promedio de un sprint.
+        
+        Es exacto (a partir de la suma convolucionada) hasta
+        EXACT_SUM_LIMIT riesgos y usa la aproximación normal por encima.
+        """
+        _check_count(num_risks)
+        if num_risks == 0:
+            return (0.0, 0.0)
+        if num_risks <= EXACT_SUM_LIMIT:
+            low, high = _central_interval(np.cumsum(self.priority_sum_pmf(num_risks)), confidence)
+            return (low / num_risks, high / num_risks)
+        
+        z = NormalDist().inv_cdf(0.5 + confidence / 2)
+        half_width = z * self.std / math.sqrt(num_risks)
+        return (self.mean - half_width, self.mean + half_width)
+    
+    def summary(self, num_risks: int, confidence: float = 0.95) -> Dict:
+        """Resumen serializable a JSON de un sprint de `num_risks` riesgos."""
+        return {
+            "riesgos": num_risks,
+            "prioridad_promedio": self.mean,
+            "varianza_prioridad": self.variance,
+            "intervalo_prioridad_promedio": list(self.mean_priority_interval(num_risks, confidence)),
+            "probabilidades": self.category_probabilities(),
+            "esperados": self.expected_counts(num_risks),
+            "intervalos": {c: list(self.count_interval(c, num_risks, confidence))
+                           for c in PRIORITY_CATEGORIES},
+            "prob_al_menos_un_alto": self.prob_at_least("alto", 1, num_risks)
+        }
+    
+    def _category_probability(self, category: str) -> float:
+        if category not in PRIORITY_CATEGORIES:
+            raise ValueError(f"Categoría desconocida: {category}")
+        return float(self._category_probabilities[PRIORITY_CATEGORIES.index(category)])
+
+
+def _normalize(weights, name: str) -> np.ndarray:
+    """Convierte pesos sobre 1..10 en una distribución de probabilidad."""
+    if weights is None:
+        return np.full(PRIORITY_GRID_SIZE, 1 / PRIORITY_GRID_SIZE)
+    weights = np.asarray(weights, dtype=float)
+    if weights.shape != (PRIORITY_GRID_SIZE,) or np.any(weights < 0) or weights.sum() <= 0:
+        raise ValueError(f"Los pesos de {name} deben ser {PRIORITY_GRID_SIZE} valores no negativos "
+                         "con suma positiva")
+    return weights / weights.sum()
+
+
+def _accumulate(texts, masses) -> Dict[str, float]:
+    """Suma la masa de los textos repetidos en distintos grupos del catálogo."""
+    result = {}
+    for text, mass in zip(texts, masses.tolist()):
+        result[text] = result.get(text, 0.0) + mass
+    return result
+
+
+def _check_count(num_risks: int):
+    if num_risks < 0:
+        raise ValueError("El número de riesgos no puede ser negativo")
+
+
+def _binomial_pmf(n: int, p: float) -> np.ndarray:
+    """PMF binomial calculada en escala logarítmica para evitar desbordes."""
+    k = np.arange(n + 1)
+    if p <= 0.0 or p >= 1.0:
+        pmf = np.zeros(n + 1)
+        pmf[0 if p <= 0.0 else n] = 1.0
+        return pmf
+    log_factorial = np.concatenate(([0.0], np.cumsum(np.log(np.arange(1, n + 1)))))
+    log_pmf = (log_factorial[n] - log_factorial[k] - log_factorial[n - k]
+               + k * math.log(p) + (n - k) * math.log1p(-p))
+    return np.exp(log_pmf)
+
+
+def _central_interval(cdf: np.ndarray, confidence: float) -> Tuple[int, int]:
+    """Cuantiles (1-c)/2 y (1+c)/2 de una distribución discreta dada su CDF."""
+    if not 0 < confidence < 1:
+        raise ValueError("La confianza debe estar entre 0 y 1")
+    tail = (1 - confidence) / 2
+    low = int(np.searchsorted(cdf, tail, side="right"))
+    high = int(np.searchsorted(cdf, 1 - tail - 1e-12, side="left"))
+    return low, min(high, len(cdf) - 1)
+
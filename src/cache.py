@@ -0,0 +1,264 @@
+"""
+Caché de resultados de escenarios Monte Carlo.
+
+Un escenario queda determinado por el catálogo, los umbrales, la cantidad
+de sprints y de riesgos y la semilla; con la misma semilla
+`run_monte_carlo` es determinista (e independiente del número de
+procesos), así que su resultado puede reutilizarse. La clave es un hash
+de todos esos datos, por lo que cambiar el catálogo o los umbrales da
+una clave nueva y nunca devuelve resultados viejos.
+
+ScenarioCache guarda los últimos escenarios en memoria (LRU, limitada
+por cantidad y por bytes de los arrays) y, opcionalmente, en un
+directorio: los arrays por sprint como .npy que se abren con memory-map
+y las estadísticas como JSON. El directorio se recorta por tamaño,
+borrando primero los escenarios usados hace más tiempo; una entrada
+dañada se borra al leerla, y la próxima simulación la vuelve a escribir.
+"""
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import threading
+from collections import OrderedDict
+from concurrent.futures import Executor
+from typing import Optional
+
+import numpy as np
+
+from src.simulator import RiskSimulator, RiskStatistics, SprintAggregates
+
+# Cambia cuando cambia el contenido de los resultados guardados
+CACHE_FORMAT_VERSION = 1
+
+# Escenarios y bytes de arrays por sprint que se conservan en memoria (256 MiB)
+DEFAULT_MEMORY_ENTRIES = 64
+DEFAULT_MEMORY_BYTES = 256 << 20
+
+# Tamaño máximo del directorio de caché (1 GiB)
+DEFAULT_DISK_BYTES = 1 << 30
+
+_ARRAYS = ("category_counts", "priority_sum", "priority_max")
+_STATISTICS_FILE = "statistics.json"
+
+
+def scenario_key(simulator: RiskSimulator, num_sprints: int, num_risks: int, seed) -> str:
+    """Hash que identifica un escenario; `seed` es un entero o una SeedSequence."""
+    if isinstance(seed, np.random.SeedSequence):
+        seed_data = {"entropia": str(seed.entropy), "spawn_key": list(seed.spawn_key),
+                     "pool_size": seed.pool_size}
+    elif isinstance(seed, (int, np.integer)) and not isinstance(seed, bool):
+        seed_data = int(seed)
+    else:
+        raise ValueError("Solo se pueden cachear escenarios con semilla entera o SeedSequence")
+    scenario = {
+        "version": CACHE_FORMAT_VERSION,
+        "catalogo": simulator.catalog.fingerprint,
+        "umbrales": list(simulator.thresholds),
+        "sprints": num_sprints,
+        "riesgos": num_risks,
+        "semilla": seed_data
+    }
+    return hashlib.sha256(json.dumps(scenario, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+class ScenarioCache:
+    """
+    Caché LRU en memoria, con almacenamiento opcional en disco, delante
+    de `RiskSimulator.run_monte_carlo`.
+    
+    Los SprintAggregates devueltos se comparten entre llamadas: sus
+    arrays son de solo lectura y no deben modificarse. Los arrays
+    abiertos con memory-map no cuentan para `max_memory_bytes`: los
+    respalda el disco. Puede usarse desde varios hilos a la vez.
+    """
+    
+    def __init__(self, max_entries: int = DEFAULT_MEMORY_ENTRIES, directory: Optional[str] = None,
+                 max_disk_bytes: int = DEFAULT_DISK_BYTES,
+                 max_memory_bytes: int = DEFAULT_MEMORY_BYTES):
+        if max_entries < 0 or max_disk_bytes < 0 or max_memory_bytes < 0:
+            raise ValueError("Los límites de la caché no pueden ser negativos")
+        self.max_entries = max_entries
+        self.directory = directory
+        self.max_disk_bytes = max_disk_bytes
+        self.max_memory_bytes = max_memory_bytes
+        self._memory = OrderedDict()
+        self._memory_bytes = 0
+        self._lock = threading.RLock()
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        if directory is not None:
+            os.makedirs(directory, exist_ok=True)
+    
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._memory)
+    
+    def __contains__(self, key: str) -> bool:
+        with self._lock:
+            if key in self._memory:
+                return True
+        return self.directory is not None and os.path.isdir(self._entry_path(key))
+    
+    def run_monte_carlo(self, simulator: RiskSimulator, num_sprints: int, num_risks: int = 5,
+                        seed=None, max_workers: Optional[int] = None,
+                        executor: Optional[Executor] = None) -> SprintAggregates:
+        """
+        Igual que `simulator.run_monte_carlo`, pero reutiliza el resultado
+        si el escenario ya se simuló. Sin semilla el resultado no es
+        reproducible y se simula siempre, sin cachear.
+        """
+        if seed is None:
+            return simulator.run_monte_carlo(num_sprints, num_risks, max_workers=max_workers,
+                                             executor=executor)
+        
+        key = scenario_key(simulator, num_sprints, num_risks, seed)
+        result = self.get(key)
+        if result is None:
+            with self._lock:
+                self.misses += 1
+            result = simulator.run_monte_carlo(num_sprints, num_risks, seed=seed,
+                                               max_workers=max_workers, executor=executor)
+            result = self.put(key, result)
+        return result
+    
+    def get(self, key: str) -> Optional[SprintAggregates]:
+        """Resultado guardado para `key`, o None si no está en memoria ni en disco."""
+        with self._lock:
+            result = self._memory.get(key)
+            if result is not None:
+                self._memory.move_to_end(key)
+                self.hits += 1
+                return result
+        if self.directory is None:
+            return None
+        
+        result = self._load(key)
+        if result is not None:
+            with self._lock:
+                self.disk_hits += 1
+            self._remember(key, result)
+        return result
+    
+    def put(self, key: str, result: SprintAggregates) -> SprintAggregates:
+        """
+        Guarda un resultado en memoria y, si hay directorio, en disco.
+        
+        Devuelve la versión guardada, que puede ser la abierta con
+        memory-map si el resultado no entra en memoria.
+        """
+        for name in _ARRAYS:
+            getattr(result, name).flags.writeable = False
+        if self.directory is not None:
+            self._store(key, result)
+            self._evict_disk(keep=self._entry_path(key))
+            if _resident_bytes(result) > self.max_memory_bytes:
+                # No entra en memoria: se conserva la versión con memory-map del disco
+                mapped = self._load(key)
+                if mapped is not None:
+                    result = mapped
+        self._remember(key, result)
+        return result
+    
+    def clear(self):
+        """Vacía la memoria y borra los escenarios guardados en disco."""
+        with self._lock:
+            self._memory.clear()
+            self._memory_bytes = 0
+        if self.directory is not None:
+            for name in os.listdir(self.directory):
+                shutil.rmtree(os.path.join(self.directory, name), ignore_errors=True)
+    
+    def disk_usage(self) -> int:
+        """Bytes ocupados por los escenarios guardados en disco."""
+        if self.directory is None:
+            return 0
+        return sum(size for _, _, size in self._disk_entries())
+    
+    @property
+    def memory_usage(self) -> int:
+        """Bytes de los arrays por sprint que la caché mantiene en memoria."""
+        return self._memory_bytes
+    
+    def _remember(self, key: str, result: SprintAggregates):
+        with self._lock:
+            previous = self._memory.pop(key, None)
+            if previous is not None:
+                self._memory_bytes -= _resident_bytes(previous)
+            self._memory[key] = result
+            self._memory_bytes += _resident_bytes(result)
+            while self._memory and (len(self._memory) > self.max_entries
+                                    or self._memory_bytes > self.max_memory_bytes):
+                _, evicted = self._memory.popitem(last=False)
+                self._memory_bytes -= _resident_bytes(evicted)
+    
+    def _entry_path(self, key: str) -> str:
+        return os.path.join(self.directory, key)
+    
+    def _store(self, key: str, result: SprintAggregates):
+        path = self._entry_path(key)
+        if os.path.isdir(path):
+            return
+        # Se escribe en un directorio temporal y se renombra, para que otro
+        # proceso nunca vea un escenario a medio guardar
+        staging = tempfile.mkdtemp(dir=self.directory, prefix=".tmp-")
+        try:
+            for name in _ARRAYS:
+                np.save(os.path.join(staging, name + ".npy"), getattr(result, name))
+            with open(os.path.join(staging, _STATISTICS_FILE), "w", encoding="utf-8") as f:
+                json.dump(result.statistics.to_dict(), f, ensure_ascii=False)
+            os.replace(staging, path)
+        except OSError:
+            shutil.rmtree(staging, ignore_errors=True)
+            if not os.path.isdir(path):
+                raise
+    
+    def _load(self, key: str) -> Optional[SprintAggregates]:
+        path = self._entry_path(key)
+        try:
+            arrays = [np.load(os.path.join(path, name + ".npy"), mmap_mode="r") for name in _ARRAYS]
+            with open(os.path.join(path, _STATISTICS_FILE), encoding="utf-8") as f:
+                statistics = RiskStatistics.from_dict(json.load(f))
+        except (OSError, ValueError, KeyError):
+            # Entrada ausente o dañada: se trata como un fallo de caché y,
+            # si está dañada, se borra para que `_store` la vuelva a escribir
+            if os.path.isdir(path):
+                shutil.rmtree(path, ignore_errors=True)
+            return None
+        # Marca el escenario como usado recientemente para la expulsión por tamaño
+        os.utime(path)
+        return SprintAggregates(*arrays, statistics)
+    
+    def _disk_entries(self):
+        """(mtime, ruta, bytes) de cada escenario guardado en disco."""
+        entries = []
+        for name in os.listdir(self.directory):
+            path = os.path.join(self.directory, name)
+            if name.startswith(".") or not os.path.isdir(path):
+                continue
+            try:
+                size = sum(entry.stat().st_size for entry in os.scandir(path))
+                entries.append((os.stat(path).st_mtime, path, size))
+            except OSError:
+                continue
+        return entries
+    
+    def _evict_disk(self, keep: str):
+        """Borra los escenarios más antiguos hasta respetar max_disk_bytes, salvo `keep`."""
+        entries = sorted(self._disk_entries())
+        total = sum(size for _, _, size in entries)
+        for _, path, size in entries:
+            if total <= self.max_disk_bytes:
+                break
+            if path == keep:
+                continue
+            shutil.rmtree(path, ignore_errors=True)
+            total -= size
+
+
+def _resident_bytes(result: SprintAggregates) -> int:
+    """Bytes en memoria de los arrays por sprint; los de memory-map no cuentan."""
+    return sum(getattr(result, name).nbytes for name in _ARRAYS
+               if not isinstance(getattr(result, name), np.memmap))
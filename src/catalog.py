@@ -0,0 +1,432 @@
+"""
+Catálogo de tipos de riesgo, descripciones y estrategias de mitigación.
+
+Un RiskCatalog se construye una sola vez (desde las tablas por defecto o
+desde un archivo JSON/CSV) y es inmutable, por lo que todos los
+simuladores lo comparten sin copiarlo. Los textos se internan y se
+indexan en tablas planas; cada descripción y cada estrategia puede tener
+un peso relativo, y el muestreo ponderado es una búsqueda binaria sobre
+pesos acumulados, de costo O(log n) en el tamaño del catálogo.
+
+Formato JSON:
+
+    {
+      "tipos": [
+        {"nombre": "Técnico", "peso": 2,
+         "riesgos": ["Dependencias obsoletas", {"descripcion": "...", "peso": 3}]}
+      ],
+      "mitigaciones": {"bajo": ["..."], "medio": ["..."], "alto": ["..."]}
+    }
+
+Formato CSV: columnas `tipo`, `descripcion` y, opcionales, `peso` y
+`peso_tipo`. Las mitigaciones se leen de un segundo CSV con columnas
+`categoria`, `estrategia` y `peso` opcional.
+
+Si se omiten, los pesos valen 1 y las mitigaciones son las por defecto.
+"""
+import csv
+import hashlib
+import json
+import sys
+from bisect import bisect_right
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+
+# Categorías de prioridad en el orden de sus códigos numéricos
+PRIORITY_CATEGORIES = ("bajo", "medio", "alto")
+
+# Los códigos de tipo, descripción y mitigación de un RiskBatch son uint16
+MAX_CATALOG_ENTRIES = np.iinfo(np.uint16).max + 1
+
+DEFAULT_RISK_TYPES = [
+    "Técnico",
+    "Organizacional",
+    "Externo",
+    "Requisitos",
+    "Planificación"
+]
+
+DEFAULT_RISK_DESCRIPTIONS = {
+    "Técnico": [
+        "Dependencias obsoletas",
+        "Problemas de integración",
+        "Dificultades técnicas imprevistas",
+        "Falta de expertise técnico",
+        "Tecnología no probada"
+    ],
+    "Organizacional": [
+        "Cambio en los recursos asignados",
+        "Problemas de comunicación",
+        "Falta de compromiso del equipo",
+        "Conflictos internos",
+        "Rotación de personal"
+    ],
+    "Externo": [
+        "Cambios en regulaciones",
+        "Problemas con proveedores",
+        "Factores del mercado",
+        "Condiciones económicas",
+        "Problemas legales"
+    ],
+    "Requisitos": [
+        "Cambios en los requisitos",
+        "Requisitos ambiguos",
+        "Sobre-ingeniería",
+        "Falta de claridad en objetivos",
+        "Expectativas no realistas"
+    ],
+    "Planificación": [
+        "Estimaciones incorrectas",
+        "Sobrecompromiso",
+        "Falta de priorización",
+        "Dependencias externas no consideradas",
+        "Plazos irreales"
+    ]
+}
+
+DEFAULT_MITIGATION_STRATEGIES = {
+    "bajo": [
+        "Monitorear el riesgo",
+        "Documentar el riesgo",
+        "Revisar en siguiente sprint",
+        "Asignar responsable para seguimiento",
+        "Incluir en backlog para revisión futura"
+    ],
+    "medio": [
+        "Asignar responsable",
+        "Plan de acción específico",
+        "Revisión semanal",
+        "Asignar recursos adicionales",
+        "Realizar análisis de impacto detallado"
+    ],
+    "alto": [
+        "Acción inmediata requerida",
+        "Involucrar a stakeholders",
+        "Replanificar sprint si es necesario",
+        "Convocar reunión de emergencia",
+        "Reasignar recursos prioritariamente"
+    ]
+}
+
+# Entrada ponderada del catálogo: (texto, peso)
+WeightedEntry = Tuple[str, float]
+
+
+class RiskTables:
+    """Tablas de textos a las que apuntan los códigos de un RiskBatch."""
+    
+    def __init__(self, types: List[str], descriptions: List[List[str]],
+                 mitigations: List[List[str]]):
+        # descriptions y mitigations vienen agrupadas por tipo y por categoría
+        self.types = tuple(types)
+        self.description_groups = tuple(tuple(group) for group in descriptions)
+        self.mitigation_groups = tuple(tuple(group) for group in mitigations)
+        self.descriptions = tuple(d for group in descriptions for d in group)
+        self.mitigations = tuple(m for group in mitigations for m in group)
+        
+        self._type_codes = {t: i for i, t in enumerate(self.types)}
+        self._description_codes = {}
+        for type_code, group in enumerate(descriptions):
+            for description in group:
+                self._description_codes.setdefault(
+                    (type_code, description), len(self._description_codes))
+        self._mitigation_codes = {}
+        for category_code, group in enumerate(mitigations):
+            for mitigation in group:
+                self._mitigation_codes.setdefault(
+                    (category_code, mitigation), len(self._mitigation_codes))
+        self._arrays = {}
+    
+    def decode(self, table: str, codes: np.ndarray) -> np.ndarray:
+        """Traduce un array de códigos a los textos de `table`."""
+        if table not in self._arrays:
+            self._arrays[table] = np.array(getattr(self, table))
+        return self._arrays[table][codes]
+    
+    def encode(self, risk: Dict) -> Tuple[int, int, int, int]:
+        """Devuelve los códigos (tipo, descripción, categoría, mitigación) de un riesgo."""
+        type_code = self._type_codes[risk["tipo"]]
+        category_code = PRIORITY_CATEGORIES.index(risk["categoria_prioridad"])
+        return (
+            type_code,
+            self._description_codes[(type_code, risk["descripcion"])],
+            category_code,
+            self._mitigation_codes[(category_code, risk["mitigacion"])]
+        )
+
+
+class RiskCatalog:
+    """
+    Catálogo inmutable e indexado de riesgos y mitigaciones.
+    
+    `types` es una secuencia de (tipo, peso, [(descripción, peso), ...])
+    y `mitigations` asocia cada categoría de PRIORITY_CATEGORIES a su
+    lista de (estrategia, peso). Los pesos son relativos dentro de su
+    grupo: primero se elige el tipo y después la descripción del tipo.
+    """
+    
+    def __init__(self, types: Sequence[Tuple[str, float, Sequence[WeightedEntry]]],
+                 mitigations: Mapping[str, Sequence[WeightedEntry]]):
+        if not types:
+            raise ValueError("El catálogo debe tener al menos un tipo de riesgo")
+        names = [sys.intern(str(name)) for name, _, _ in types]
+        if len(set(names)) != len(names):
+            raise ValueError("El catálogo tiene tipos de riesgo repetidos")
+        missing = [c for c in PRIORITY_CATEGORIES if not mitigations.get(c)]
+        if missing:
+            raise ValueError(f"Faltan estrategias de mitigación para: {', '.join(missing)}")
+        
+        description_groups = [_intern_group(entries, f"el tipo '{name}'")
+                              for name, (_, _, entries) in zip(names, types)]
+        mitigation_groups = [_intern_group(mitigations[c], f"la categoría '{c}'")
+                             for c in PRIORITY_CATEGORIES]
+        for label, groups in (("descripciones", description_groups),
+                              ("mitigaciones", mitigation_groups)):
+            if sum(len(group) for group in groups) > MAX_CATALOG_ENTRIES:
+                raise ValueError(f"El catálogo admite como mucho {MAX_CATALOG_ENTRIES} {label}")
+        
+        self.tables = RiskTables(names, [[text for text, _ in group] for group in description_groups],
+                                 [[text for text, _ in group] for group in mitigation_groups])
+        self.risk_types = self.tables.types
+        self.risk_descriptions = MappingProxyType(dict(zip(names, self.tables.description_groups)))
+        self.mitigation_strategies = MappingProxyType(
+            dict(zip(PRIORITY_CATEGORIES, self.tables.mitigation_groups)))
+        
+        # Probabilidades normalizadas: del tipo y, dentro de su grupo, de cada texto
+        self.type_probabilities = _probabilities([weight for _, weight, _ in types], "los tipos")
+        self.description_probabilities = np.concatenate(
+            [_probabilities([w for _, w in group], f"el tipo '{name}'")
+             for name, group in zip(names, description_groups)])
+        self.mitigation_probabilities = np.concatenate(
+            [_probabilities([w for _, w in group], f"la categoría '{c}'")
+             for c, group in zip(PRIORITY_CATEGORIES, mitigation_groups)])
+        
+        self._type_cumulative = _cumulative(self.type_probabilities)
+        self._description_cumulative, self._description_last = _grouped_cumulative(
+            self.description_probabilities, [len(g) for g in description_groups])
+        self._mitigation_cumulative, self._mitigation_last = _grouped_cumulative(
+            self.mitigation_probabilities, [len(g) for g in mitigation_groups])
+        # Copias en listas de Python para la búsqueda escalar con bisect
+        self._type_cumulative_list = self._type_cumulative.tolist()
+        self._description_cumulative_list = self._description_cumulative.tolist()
+        self._description_last_list = self._description_last.tolist()
+        self._mitigation_cumulative_list = self._mitigation_cumulative.tolist()
+        self._mitigation_last_list = self._mitigation_last.tolist()
+        
+        self.fingerprint = hashlib.sha256(
+            json.dumps(self.to_dict(), ensure_ascii=False, sort_keys=True).encode("utf-8")
+        ).hexdigest()
+    
+    def __getstate__(self) -> Dict:
+        # MappingProxyType no se puede serializar; se reconstruye al deserializar
+        state = dict(self.__dict__)
+        state["risk_descriptions"] = dict(self.risk_descriptions)
+        state["mitigation_strategies"] = dict(self.mitigation_strategies)
+        return state
+    
+    def __setstate__(self, state: Dict):
+        self.__dict__.update(state)
+        self.risk_descriptions = MappingProxyType(state["risk_descriptions"])
+        self.mitigation_strategies = MappingProxyType(state["mitigation_strategies"])
+    
+    def __len__(self) -> int:
+        return len(self.tables.descriptions)
+    
+    def __repr__(self) -> str:
+        return (f"RiskCatalog({len(self.risk_types)} tipos, {len(self)} descripciones, "
+                f"{len(self.tables.mitigations)} mitigaciones)")
+    
+    @classmethod
+    def from_tables(cls, risk_types: Sequence[str], risk_descriptions: Mapping[str, Sequence[str]],
+                    mitigation_strategies: Mapping[str, Sequence[str]]) -> "RiskCatalog":
+        """Catálogo de pesos uniformes a partir de tablas como las por defecto."""
+        types = [(t, 1.0, [(d, 1.0) for d in risk_descriptions[t]]) for t in risk_types]
+        mitigations = {c: [(m, 1.0) for m in strategies]
+                       for c, strategies in mitigation_strategies.items()}
+        return cls(types, mitigations)
+    
+    @classmethod
+    def from_dict(cls, data: Mapping) -> "RiskCatalog":
+        """Construye el catálogo desde el formato JSON descrito en el módulo."""
+        try:
+            types = [(entry["nombre"], entry.get("peso", 1.0),
+                      [_weighted_entry(risk, "descripcion") for risk in entry["riesgos"]])
+                     for entry in data["tipos"]]
+        except KeyError as e:
+            raise ValueError(f"Catálogo inválido: falta el campo {e}") from e
+        except (TypeError, AttributeError) as e:
+            raise ValueError(f"Catálogo inválido: la sección 'tipos' está mal formada ({e})") from e
+        mitigations = data.get("mitigaciones")
+        if mitigations is None:
+            mitigations = DEFAULT_MITIGATION_STRATEGIES
+        try:
+            mitigations = {c: [_weighted_entry(m, "estrategia") for m in strategies]
+                           for c, strategies in mitigations.items()}
+        except KeyError as e:
+            raise ValueError(f"Catálogo inválido: falta el campo {e} en las mitigaciones") from e
+        except (TypeError, AttributeError) as e:
+            raise ValueError(f"Catálogo inválido: la sección 'mitigaciones' está mal formada ({e})") from e
+        return cls(types, mitigations)
+    
+    @classmethod
+    def from_json(cls, path: str) -> "RiskCatalog":
+        with open(path, encoding="utf-8") as f:
+            return cls.from_dict(json.load(f))
+    
+    @classmethod
+    def from_csv(cls, path: str, mitigations_path: Optional[str] = None) -> "RiskCatalog":
+        """
+        Construye el catálogo desde un CSV de riesgos y, opcionalmente,
+        otro de mitigaciones (ver el formato en la documentación del módulo).
+        """
+        groups: Dict[str, List[WeightedEntry]] = {}
+        type_weights: Dict[str, float] = {}
+        for row in _read_csv(path, ("tipo", "descripcion")):
+            groups.setdefault(row["tipo"], []).append((row["descripcion"], _csv_weight(row, "peso")))
+            # El peso del tipo se toma de su primera fila
+            type_weights.setdefault(row["tipo"], _csv_weight(row, "peso_tipo"))
+        types = [(name, type_weights[name], entries) for name, entries in groups.items()]
+        
+        if mitigations_path is None:
+            return cls(types, {c: [(m, 1.0) for m in strategies]
+                               for c, strategies in DEFAULT_MITIGATION_STRATEGIES.items()})
+        mitigations: Dict[str, List[WeightedEntry]] = {}
+        for row in _read_csv(mitigations_path, ("categoria", "estrategia")):
+            mitigations.setdefault(row["categoria"], []).append(
+                (row["estrategia"], _csv_weight(row, "peso")))
+        return cls(types, mitigations)
+    
+    @classmethod
+    def load(cls, path: str) -> "RiskCatalog":
+        """Carga un catálogo JSON o CSV según la extensión del archivo."""
+        if path.lower().endswith(".csv"):
+            return cls.from_csv(path)
+        return cls.from_json(path)
+    
+    def to_dict(self) -> Dict:
+        """Representación en el formato JSON de `from_dict`, con los pesos normalizados."""
+        return {
+            "tipos": [
+                {"nombre": name, "peso": float(weight),
+                 "riesgos": [{"descripcion": d, "peso": float(w)} for d, w in zip(
+                     group, self.description_probabilities[start:start + len(group)])]}
+                for name, weight, group, start in zip(
+                    self.risk_types, self.type_probabilities, self.tables.description_groups,
+                    _group_starts(self.tables.description_groups))
+            ],
+            "mitigaciones": {
+                c: [{"estrategia": m, "peso": float(w)} for m, w in zip(
+                    group, self.mitigation_probabilities[start:start + len(group)])]
+                for c, group, start in zip(PRIORITY_CATEGORIES, self.tables.mitigation_groups,
+                                           _group_starts(self.tables.mitigation_groups))
+            }
+        }
+    
+    # Muestreo: cada método traduce uniformes en [0, 1) a códigos de las tablas.
+    # Las versiones escalares usan bisect sobre los mismos acumulados que
+    # np.searchsorted, por lo que ambas rutas eligen exactamente lo mismo.
+    
+    def sample_types(self, u: np.ndarray) -> np.ndarray:
+        codes = np.searchsorted(self._type_cumulative, u, side="right")
+        return np.minimum(codes, len(self.risk_types) - 1)
+    
+    def sample_descriptions(self, type_codes: np.ndarray, u: np.ndarray) -> np.ndarray:
+        codes = np.searchsorted(self._description_cumulative, type_codes + u, side="right")
+        return np.minimum(codes, self._description_last[type_codes])
+    
+    def sample_mitigations(self, category_codes: np.ndarray, u: np.ndarray) -> np.ndarray:
+        codes = np.searchsorted(self._mitigation_cumulative, category_codes + u, side="right")
+        return np.minimum(codes, self._mitigation_last[category_codes])
+    
+    def sample_type(self, u: float) -> int:
+        return min(bisect_right(self._type_cumulative_list, u), len(self.risk_types) - 1)
+    
+    def sample_description(self, type_code: int, u: float) -> int:
+        return min(bisect_right(self._description_cumulative_list, type_code + u),
+                   self._description_last_list[type_code])
+    
+    def sample_mitigation(self, category_code: int, u: float) -> int:
+        return min(bisect_right(self._mitigation_cumulative_list, category_code + u),
+                   self._mitigation_last_list[category_code])
+
+
+def _intern_group(entries: Sequence[WeightedEntry], owner: str) -> List[WeightedEntry]:
+    if not entries:
+        raise ValueError(f"El catálogo no tiene entradas para {owner}")
+    group = [(sys.intern(str(text)), weight) for text, weight in entries]
+    if len({text for text, _ in group}) != len(group):
+        raise ValueError(f"El catálogo tiene entradas repetidas para {owner}")
+    return group
+
+
+def _probabilities(weights: Sequence[float], owner: str) -> np.ndarray:
+    """Normaliza los pesos de un grupo; deben ser no negativos y de suma positiva."""
+    weights = np.asarray(weights, dtype=float)
+    if np.any(~np.isfinite(weights)) or np.any(weights < 0) or weights.sum() <= 0:
+        raise ValueError(f"Los pesos de {owner} deben ser no negativos y de suma positiva")
+    return weights / weights.sum()
+
+
+def _cumulative(probabilities: np.ndarray) -> np.ndarray:
+    cumulative = np.cumsum(probabilities)
+    cumulative[-1] = 1.0
+    return cumulative
+
+
+def _grouped_cumulative(probabilities: np.ndarray,
+                        sizes: Sequence[int]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Acumulados de todos los grupos en un solo array creciente.
+    
+    El grupo g ocupa el intervalo [g, g + 1]: su acumulado es g más la
+    fracción acumulada dentro del grupo, así que el código de un
+    uniforme u del grupo g es la búsqueda de g + u en todo el array.
+    Devuelve también el último código de cada grupo, que acota el
+    resultado frente a errores de redondeo.
+    """
+    sizes = np.asarray(sizes)
+    ends = np.cumsum(sizes)
+    starts = ends - sizes
+    cumulative = np.empty(len(probabilities))
+    for group, (start, end) in enumerate(zip(starts, ends)):
+        cumulative[start:end] = group + _cumulative(probabilities[start:end])
+    return cumulative, ends - 1
+
+
+def _group_starts(groups: Sequence[Sequence]) -> List[int]:
+    starts, start = [], 0
+    for group in groups:
+        starts.append(start)
+        start += len(group)
+    return starts
+
+
+def _weighted_entry(entry, key: str) -> WeightedEntry:
+    """Acepta un texto (peso 1) o un objeto {key: texto, "peso": peso}."""
+    if isinstance(entry, str):
+        return entry, 1.0
+    return entry[key], entry.get("peso", 1.0)
+
+
+def _read_csv(path: str, required: Tuple[str, ...]) -> List[Dict[str, str]]:
+    with open(path, newline="", encoding="utf-8") as f:
+        reader = csv.DictReader(f)
+        missing = [column for column in required if column not in (reader.fieldnames or ())]
+        if missing:
+            raise ValueError(f"{path}: faltan las columnas {', '.join(missing)}")
+        return list(reader)
+
+
+def _csv_weight(row: Dict[str, str], column: str) -> float:
+    value = (row.get(column) or "").strip()
+    try:
+        return float(value) if value else 1.0
+    except ValueError:
+        raise ValueError(f"Peso inválido en la columna {column}: {value!r}") from None
+
+
+# Catálogo por defecto, construido una sola vez y compartido por todos los simuladores
+DEFAULT_CATALOG = RiskCatalog.from_tables(DEFAULT_RISK_TYPES, DEFAULT_RISK_DESCRIPTIONS,
+                                          DEFAULT_MITIGATION_STRATEGIES)
@@ -0,0 +1,349 @@
+"""
+Línea de comandos del simulador, sin interfaz gráfica.
+
+    python -m src sprint --riesgos 5
+    python -m src lote --riesgos 1000000 --csv riesgos.csv
+    python -m src montecarlo --sprints 100000 --riesgos 5 --json
+    python -m src montecarlo --adaptativo --precision 0.1 --tiempo 10
+    python -m src evolucion --lineas 10000 --sprints 50 --persistencia 0.7
+    python -m src sensibilidad --riesgos 5 10 --grafico sensibilidad.png
+    python -m src servicio --puerto 8080
+
+Los módulos del simulador (y NumPy) se importan recién al ejecutar un
+comando, para que `--help` y los errores de argumentos respondan rápido.
+"""
+import argparse
+import json
+import sys
+from typing import List, Optional
+
+
+def _add_common_arguments(parser: argparse.ArgumentParser):
+    parser.add_argument("--riesgos", type=int, default=5, help="Riesgos por sprint (por defecto 5)")
+    parser.add_argument("--semilla", type=int, help="Semilla para resultados reproducibles")
+    parser.add_argument("--umbrales", type=int, nargs=2, metavar=("BAJO", "ALTO"),
+                        help="Umbrales de categoría (por defecto 30 70)")
+    parser.add_argument("--catalogo", help="Catálogo de riesgos en JSON o CSV")
+    parser.add_argument("--json", action="store_true", help="Muestra las estadísticas en JSON")
+    parser.add_argument("--diagnostico", nargs="?", const="-", metavar="ARCHIVO",
+                        help="Mide el tiempo de cada etapa; lo muestra por stderr o lo guarda en JSON")
+    parser.add_argument("--memoria", action="store_true",
+                        help="Con --diagnostico, mide también la memoria con tracemalloc")
+    parser.add_argument("--perfil", metavar="ARCHIVO", help="Guarda un perfil de cProfile de la ejecución")
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m src",
+        description="Simulador de riesgos en sprints ágiles (modo consola)"
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+    
+    sprint = commands.add_parser("sprint", help="Simula un único sprint y lista sus riesgos")
+    _add_common_arguments(sprint)
+    sprint.add_argument("--csv", help="Exporta los riesgos a este archivo CSV")
+    
+    batch = commands.add_parser("lote", help="Simula muchos riesgos en bloques")
+    _add_common_arguments(batch)
+    batch.add_argument("--bloque", type=int, default=100_000, help="Riesgos por bloque")
+    output = batch.add_mutually_exclusive_group()
+    output.add_argument("--csv", help="Exporta los riesgos a este archivo CSV")
+    output.add_argument("--columnar", help="Exporta los riesgos en formato binario columnar")
+    
+    monte_carlo = commands.add_parser("montecarlo", help="Simula muchos sprints en paralelo")
+    _add_common_arguments(monte_carlo)
+    monte_carlo.add_argument("--sprints", type=int,
+                             help="Número de sprints (por defecto 1000); con --adaptativo, el máximo")
+    monte_carlo.add_argument("--procesos", type=int, help="Procesos trabajadores (por defecto, todos los núcleos)")
+    monte_carlo.add_argument("--cache", metavar="DIRECTORIO",
+                             help="Reutiliza resultados guardados en este directorio (requiere --semilla)")
+    monte_carlo.add_argument("--adaptativo", action="store_true",
+                             help="Simula en lotes crecientes hasta alcanzar la precisión o el tiempo pedidos")
+    monte_carlo.add_argument("--precision", type=float, default=0.5,
+                             help="Con --adaptativo, semiancho máximo del intervalo de la prioridad promedio")
+    monte_carlo.add_argument("--precision-categorias", type=float, default=0.005,
+                             help="Con --adaptativo, semiancho máximo de las proporciones por categoría")
+    monte_carlo.add_argument("--tiempo", type=float, metavar="SEGUNDOS",
+                             help="Con --adaptativo, tiempo máximo de simulación")
+    monte_carlo.add_argument("--confianza", type=float, default=0.95, help="Nivel de los intervalos")
+    
+    timelines = commands.add_parser("evolucion",
+                                    help="Evolución de riesgos persistentes a lo largo de varios sprints")
+    _add_common_arguments(timelines)
+    timelines.add_argument("--sprints", type=int, default=20, help="Sprints por línea temporal")
+    timelines.add_argument("--lineas", type=int, default=1000, help="Líneas temporales simuladas")
+    timelines.add_argument("--persistencia", type=float, default=0.6,
+                           help="Probabilidad de que un riesgo siga abierto en el sprint siguiente")
+    timelines.add_argument("--correlacion", type=float, default=0.0,
+                           help="Correlación entre las probabilidades de dos riesgos del mismo tipo")
+    
+    sweep = commands.add_parser("sensibilidad",
+                                help="Compara umbrales y cantidades de riesgos sobre una misma muestra")
+    sweep.add_argument("--riesgos", type=int, nargs="+", default=[5], help="Riesgos por sprint a comparar")
+    sweep.add_argument("--sprints", type=int, default=10_000, help="Sprints de la muestra compartida")
+    sweep.add_argument("--bajos", type=int, nargs=3, default=[1, 50, 1], metavar=("DESDE", "HASTA", "PASO"),
+                       help="Umbrales bajos a evaluar (por defecto 1 50 1)")
+    sweep.add_argument("--altos", type=int, nargs=3, default=[51, 100, 1], metavar=("DESDE", "HASTA", "PASO"),
+                       help="Umbrales altos a evaluar (por defecto 51 100 1)")
+    sweep.add_argument("--semilla", type=int, help="Semilla para resultados reproducibles")
+    sweep.add_argument("--metrica", choices=["bajo", "medio", "alto", "prob_algun_alto"], default="alto",
+                       help="Métrica del mapa de calor")
+    sweep.add_argument("--grafico", metavar="IMAGEN", help="Guarda el mapa de calor (PNG, SVG, PDF)")
+    sweep.add_argument("--csv", help="Exporta la tabla de combinaciones a este archivo CSV")
+    sweep.add_argument("--json", action="store_true", help="Muestra la tabla en JSON")
+    
+    analytic = commands.add_parser("analitico", help="Distribución exacta de un sprint, sin muestreo")
+    analytic.add_argument("--riesgos", type=int, default=5, help="Riesgos por sprint (por defecto 5)")
+    analytic.add_argument("--umbrales", type=int, nargs=2, metavar=("BAJO", "ALTO"),
+                          help="Umbrales de categoría (por defecto 30 70)")
+    analytic.add_argument("--catalogo", help="Catálogo de riesgos en JSON o CSV")
+    analytic.add_argument("--confianza", type=float, default=0.95, help="Nivel de los intervalos")
+    
+    service = commands.add_parser("servicio", help="Servicio HTTP/JSON local del simulador")
+    service.add_argument("--host", default="127.0.0.1", help="Dirección de escucha (por defecto 127.0.0.1)")
+    service.add_argument("--puerto", type=int, default=8080, help="Puerto de escucha (por defecto 8080)")
+    service.add_argument("--procesos", type=int,
+                         help="Procesos del pool Monte Carlo (por defecto, todos los núcleos)")
+    service.add_argument("--ventana", type=float, default=2.0,
+                         help="Milisegundos que se esperan para agrupar solicitudes de sprint")
+    
+    return parser
+
+
+def format_statistics(stats, title: str = "Resumen") -> str:
+    """Resumen en texto de un RiskStatistics, con el formato de la interfaz gráfica."""
+    from src.simulator import PRIORITY_CATEGORIES
+    
+    lines = [f"=== {title} ===", f"Total de riesgos identificados: {stats.count}", "",
+             "Distribución de riesgos:"]
+    # De mayor a menor categoría, como en la interfaz gráfica
+    for category, count in reversed(list(zip(PRIORITY_CATEGORIES, stats.category_counts))):
+        share = count / stats.count if stats.count else 0
+        lines.append(f"• {category.capitalize()}: {count} ({share:.0%})")
+    lines += ["", f"Prioridad promedio: {stats.mean:.1f} (desvío {stats.std:.1f})"]
+    
+    max_risk = stats.most_critical
+    if max_risk is not None:
+        lines += [
+            "", "Riesgo más crítico:",
+            f"• Descripción: {max_risk['descripcion']}",
+            f"• Prioridad: {max_risk['valor_prioridad']} ({max_risk['categoria_prioridad'].upper()})",
+            f"• Mitigación sugerida: {max_risk['mitigacion']}"
+        ]
+    return "\n".join(lines)
+
+
+def _make_simulator(args):
+    from src.simulator import DEFAULT_THRESHOLDS, RiskCatalog, RiskSimulator
+    thresholds = tuple(args.umbrales) if args.umbrales else DEFAULT_THRESHOLDS
+    catalog = RiskCatalog.load(args.catalogo) if args.catalogo else None
+    return RiskSimulator(thresholds=thresholds, rng=getattr(args, "semilla", None), catalog=catalog,
+                         instrumentation=getattr(args, "instrumentation", None))
+
+
+def _run_sprint(args) -> dict:
+    from src.export import export_csv
+    from src.simulator import RiskStatistics
+    
+    simulator = _make_simulator(args)
+    batch = simulator.run_sprint_simulation_batch(args.riesgos)
+    if args.csv:
+        export_csv(args.csv, [batch])
+    
+    stats = RiskStatistics().update(batch)
+    if not args.json:
+        for risk in batch:
+            print(f"[{risk['categoria_prioridad']:>5}] {risk['valor_prioridad']:>3}  "
+                  f"{risk['tipo']}: {risk['descripcion']} → {risk['mitigacion']}")
+        print()
+    return {"statistics": stats}
+
+
+def _run_batch(args) -> dict:
+    from src.export import export_columnar, export_csv
+    from src.simulator import RiskStatistics
+    
+    simulator = _make_simulator(args)
+    stats = RiskStatistics()
+    
+    def batches():
+        # Las estadísticas se acumulan en la misma pasada que la exportación
+        for batch in simulator.iter_risk_batches(args.riesgos, args.bloque):
+            with simulator.instrumentation.stage("estadisticas", len(batch)):
+                stats.update(batch)
+            yield batch
+    
+    if args.csv:
+        export_csv(args.csv, batches())
+    elif args.columnar:
+        export_columnar(args.columnar, batches(), simulator.catalog.tables)
+    else:
+        for _ in batches():
+            pass
+    return {"statistics": stats}
+
+
+def _run_monte_carlo(args) -> dict:
+    simulator = _make_simulator(args)
+    if args.adaptativo:
+        return _run_adaptive(args, simulator)
+    num_sprints = 1000 if args.sprints is None else args.sprints
+    if args.cache:
+        from src.cache import ScenarioCache
+        result = ScenarioCache(directory=args.cache).run_monte_carlo(
+            simulator, num_sprints, args.riesgos, seed=args.semilla, max_workers=args.procesos)
+    else:
+        result = simulator.run_monte_carlo(num_sprints, args.riesgos, seed=args.semilla,
+                                           max_workers=args.procesos)
+    return {"statistics": result.statistics, "extra": result.high_risk_summary()}
+
+
+def _run_adaptive(args, simulator) -> dict:
+    from src.adaptive import DEFAULT_MAX_SPRINTS
+    
+    if args.cache:
+        raise ValueError("--cache no se puede combinar con --adaptativo")
+    result = simulator.run_adaptive(
+        args.riesgos, priority_precision=args.precision, rate_precision=args.precision_categorias,
+        confidence=args.confianza, time_budget=args.tiempo,
+        max_sprints=DEFAULT_MAX_SPRINTS if args.sprints is None else args.sprints,
+        seed=args.semilla, max_workers=args.procesos
+    )
+    summary = result.summary()
+    extra = result.aggregates.high_risk_summary()
+    extra.update({key: summary[key] for key in ("sprints_ahorrados", "semiancho_prioridad",
+                                                "semiancho_categorias", "segundos", "motivo")})
+    return {"statistics": result.statistics, "extra": extra}
+
+
+def _run_timelines(args) -> int:
+    model = _make_simulator(args).timelines(persistence=args.persistencia,
+                                            type_correlation=args.correlacion)
+    if args.lineas < 0:
+        raise ValueError("El número de líneas temporales no puede ser negativo")
+    summary = model.simulate(args.lineas, args.sprints, args.riesgos, seed=args.semilla).summary()
+    if args.json:
+        print(json.dumps(summary, ensure_ascii=False, indent=2))
+        return 0
+    
+    print("Sprint  Abiertos  Prioridad  P(algún alto)")
+    for sprint, values in enumerate(zip(summary["riesgos_abiertos"], summary["prioridad_promedio"],
+                                        summary["prob_algun_alto"]), start=1):
+        print("{:>6}  {:>8.2f}  {:>9.1f}  {:>13.1%}".format(sprint, *values))
+    if summary["riesgos_descartados"]:
+        print(f"Riesgos descartados por capacidad: {summary['riesgos_descartados']}")
+    return 0
+
+
+def _run_sensitivity(args) -> int:
+    from src.sensitivity import run_sweep, threshold_range
+    from src.simulator import RiskSimulator
+    
+    result = run_sweep(RiskSimulator(), threshold_range(*args.bajos), threshold_range(*args.altos),
+                       args.riesgos, args.sprints, seed=args.semilla)
+    if args.csv:
+        result.to_csv(args.csv)
+    if args.grafico:
+        for num_risks in result.risk_counts:
+            # Un gráfico por cantidad de riesgos: imagen.png, imagen_10.png, ...
+            path = args.grafico
+            if num_risks != result.risk_counts[0]:
+                stem, dot, extension = args.grafico.rpartition(".")
+                path = f"{stem}_{num_risks}.{extension}" if dot else f"{args.grafico}_{num_risks}"
+            result.heatmap(args.metrica, num_risks, path)
+    
+    table = result.to_table()
+    if args.json:
+        print(json.dumps(table, ensure_ascii=False, indent=2))
+        return 0
+    
+    # Resumen: las combinaciones con menor y mayor valor de la métrica
+    for num_risks in result.risk_counts:
+        rows = sorted((row for row in table if row["riesgos"] == num_risks), key=lambda row: row[args.metrica])
+        print(f"=== {num_risks} riesgos por sprint ({args.metrica}) ===")
+        for label, row in (("Mínimo", rows[0]), ("Máximo", rows[-1])):
+            print(f"{label}: {row[args.metrica]:.3f} con umbrales {row['umbral_bajo']}/{row['umbral_alto']}")
+    print(f"Combinaciones evaluadas: {len(table)}")
+    return 0
+
+
+def _run_analytic(args) -> int:
+    model = _make_simulator(args).analytic()
+    print(json.dumps(model.summary(args.riesgos, args.confianza), ensure_ascii=False, indent=2))
+    return 0
+
+
+COMMANDS = {
+    "sprint": _run_sprint,
+    "lote": _run_batch,
+    "montecarlo": _run_monte_carlo
+}
+
+
+def _finish_instrumentation(args):
+    """Detiene la instrumentación y entrega el informe y el perfil pedidos."""
+    instrumentation = args.instrumentation
+    instrumentation.stop()
+    if args.perfil:
+        instrumentation.dump_profile(args.perfil)
+    if args.diagnostico == "-":
+        print(instrumentation.format_report(), file=sys.stderr)
+    elif args.diagnostico:
+        instrumentation.to_json(args.diagnostico)
+
+
+def _run_service(args) -> int:
+    from src.service import serve
+    
+    if args.procesos is not None and args.procesos < 0:
+        raise ValueError("El número de procesos no puede ser negativo")
+    print(f"Escuchando en http://{args.host}:{args.puerto} (Ctrl+C para terminar)", file=sys.stderr)
+    serve(args.host, args.puerto, args.procesos, args.ventana / 1000)
+    return 0
+
+
+def _run_command(args) -> int:
+    try:
+        # Estos comandos no resumen un RiskStatistics y tienen su propia salida
+        if args.command == "analitico":
+            return _run_analytic(args)
+        if args.command == "evolucion":
+            return _run_timelines(args)
+        if args.command == "sensibilidad":
+            return _run_sensitivity(args)
+        if args.command == "servicio":
+            return _run_service(args)
+        outcome = COMMANDS[args.command](args)
+    except (ValueError, OSError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    
+    stats, extra = outcome["statistics"], outcome.get("extra", {})
+    if args.json:
+        print(json.dumps({**stats.to_dict(), **extra}, ensure_ascii=False, indent=2))
+    else:
+        print(format_statistics(stats))
+        for key, value in extra.items():
+            print(f"{key.replace('_', ' ').capitalize()}: "
+                  f"{format(value, 'g') if isinstance(value, float) else value}")
+    return 0
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+    risk_counts = getattr(args, "riesgos", 0)
+    risk_counts = risk_counts if isinstance(risk_counts, list) else [risk_counts]
+    if min(risk_counts) < 0 or (getattr(args, "sprints", 0) or 0) < 0:
+        print("Error: los números de riesgos y sprints no pueden ser negativos", file=sys.stderr)
+        return 2
+    
+    args.instrumentation = None
+    if getattr(args, "diagnostico", None) or getattr(args, "perfil", None):
+        from src.instrumentation import Instrumentation
+        args.instrumentation = Instrumentation(track_allocations=getattr(args, "memoria", False), profile=bool(args.perfil))
+        args.instrumentation.start()
+    try:
+        return _run_command(args)
+    finally:
+        if args.instrumentation is not None:
+            _finish_instrumentation(args)
@@ -0,0 +1,131 @@
+"""Exportación en streaming de resultados de simulación a CSV y formato columnar."""
+import csv
+import itertools
+import json
+import struct
+from typing import BinaryIO, Iterable, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from src.simulator import RISK_FIELDS, RiskBatch, RiskTables
+
+# Cabecera de las columnas al exportar a CSV, en el orden de RISK_FIELDS
+CSV_HEADER = ['Tipo', 'Descripción', 'Probabilidad', 'Impacto', 'Prioridad', 'Categoría', 'Mitigación']
+
+# Firma de los archivos binarios columnares de riesgos
+COLUMNAR_MAGIC = b"RSKCOL1\n"
+
+
+def iter_csv_rows(batches: Iterable[RiskBatch]) -> Iterator[List[tuple]]:
+    """Convierte cada RiskBatch en una lista de filas listas para `writerows`."""
+    for batch in batches:
+        yield list(zip(*(batch.column_list(field) for field in RISK_FIELDS)))
+
+
+def export_csv(path: str, batches: Iterable[RiskBatch]) -> int:
+    """
+    Escribe los riesgos en un archivo CSV bloque a bloque.
+    
+    Devuelve la cantidad de filas escritas. Solo un bloque está en
+    memoria a la vez.
+    """
+    written = 0
+    with open(path, 'w', newline='', encoding='utf-8') as csvfile:
+        writer = csv.writer(csvfile)
+        writer.writerow(CSV_HEADER)
+        for rows in iter_csv_rows(batches):
+            writer.writerows(rows)
+            written += len(rows)
+    return written
+
+
+def export_columnar(path: str, batches: Iterable[RiskBatch], tables: Optional[RiskTables] = None) -> int:
+    """
+    Escribe los riesgos en el formato binario columnar del simulador.
+    
+    El archivo empieza con COLUMNAR_MAGIC y una cabecera JSON con las
+    tablas de textos; después, cada bloque guarda su número de filas
+    (uint64) seguido de los bytes de cada columna. Devuelve la cantidad
+    de filas escritas.
+    
+    La cabecera usa `tables` (las del simulador) o, si no se indican, las
+    del primer bloque; con `tables` y sin bloques queda un archivo válido
+    sin riesgos, como el CSV con solo la cabecera.
+    """
+    batches = iter(batches)
+    if tables is None:
+        first = next(batches, None)
+        if first is None:
+            raise ValueError("No hay riesgos para exportar ni tablas para la cabecera")
+        tables = first.tables
+        batches = itertools.chain([first], batches)
+    
+    written = 0
+    with open(path, 'wb') as f:
+        header = _columnar_header(tables)
+        f.write(COLUMNAR_MAGIC)
+        f.write(struct.pack("<I", len(header)))
+        f.write(header)
+        for batch in batches:
+            f.write(struct.pack("<Q", len(batch)))
+            for column in batch._columns():
+                f.write(column.tobytes())
+            written += len(batch)
+    return written
+
+
+def iter_columnar(path: str) -> Iterator[RiskBatch]:
+    """Lee un archivo columnar bloque a bloque sin cargarlo completo."""
+    with open(path, 'rb') as f:
+        tables, dtypes = _read_columnar_header(f, path)
+        while True:
+            size = f.read(8)
+            if not size:
+                break
+            if len(size) != 8:
+                raise ValueError(f"{path} está truncado")
+            (rows,) = struct.unpack("<Q", size)
+            columns = []
+            for dtype in dtypes:
+                data = f.read(rows * dtype.itemsize)
+                if len(data) != rows * dtype.itemsize:
+                    raise ValueError(f"{path} está truncado")
+                columns.append(np.frombuffer(data, dtype=dtype))
+            yield RiskBatch(tables, *columns)
+
+
+def load_columnar(path: str) -> RiskBatch:
+    """Carga un archivo columnar completo en un único RiskBatch."""
+    batches = list(iter_columnar(path))
+    if batches:
+        return RiskBatch.concatenate(batches)
+    # Archivo sin riesgos: un RiskBatch vacío con las tablas de la cabecera
+    with open(path, 'rb') as f:
+        tables, dtypes = _read_columnar_header(f, path)
+    return RiskBatch(tables, *(np.empty(0, dtype=dtype) for dtype in dtypes))
+
+
+def _read_columnar_header(f: BinaryIO, path: str) -> Tuple[RiskTables, List[np.dtype]]:
+    """Valida la firma y lee las tablas y los tipos de columna de la cabecera."""
+    if f.read(len(COLUMNAR_MAGIC)) != COLUMNAR_MAGIC:
+        raise ValueError(f"{path} no es un archivo columnar de riesgos")
+    size = f.read(4)
+    if len(size) != 4:
+        raise ValueError(f"{path} está truncado")
+    (header_size,) = struct.unpack("<I", size)
+    header = json.loads(f.read(header_size).decode("utf-8"))
+    tables = RiskTables(header["types"], header["descriptions"], header["mitigations"])
+    return tables, [np.dtype(dtype) for dtype in header["dtypes"]]
+
+
+def _columnar_header(tables: RiskTables) -> bytes:
+    """Cabecera JSON con las tablas y los tipos de cada columna."""
+    dtypes = [np.dtype(np.uint16), np.dtype(np.uint16), np.dtype(np.uint8), np.dtype(np.uint8),
+              np.dtype(np.uint8), np.dtype(np.uint8), np.dtype(np.uint16)]
+    return json.dumps({
+        "version": 1,
+        "types": tables.types,
+        "descriptions": tables.description_groups,
+        "mitigations": tables.mitigation_groups,
+        "dtypes": [dtype.str for dtype in dtypes]
+    }, ensure_ascii=False).encode("utf-8")
@@ -0,0 +1,455 @@
+"""Interfaz gráfica Tk del simulador de riesgos."""
+import tkinter as tk
+from tkinter import ttk, messagebox, scrolledtext
+from typing import List, Tuple
+from datetime import datetime
+
+from src.export import export_csv
+from src.instrumentation import Instrumentation
+from src.jobs import SimulationJob
+from src.simulator import (DEFAULT_CHUNK_SIZE, PRIORITY_CATEGORIES, RISK_FIELDS, PriorityCategory,
+                           RiskBatch, RiskSimulator, RiskStatistics)
+from src.table_model import RiskTableModel
+
+# Máximo de riesgos que se pueden simular desde la interfaz gráfica
+MAX_GUI_RISKS = 1_000_000
+
+# Intervalo en milisegundos con el que la GUI revisa los bloques recibidos
+POLL_INTERVAL_MS = 50
+
+# Intervalo en milisegundos con el que se refresca el panel de diagnóstico
+DIAGNOSTICS_REFRESH_MS = 1000
+
+
+class RiskSimulatorGUI:
+    def __init__(self, root):
+        self.root = root
+        self.root.title("Simulador de Riesgos en Sprints Ágiles")
+        self.root.geometry("1000x750")
+        self.current_results = None
+        self.statistics = RiskStatistics()
+        self.job = None
+        self.diagnostics_window = None
+        self.setup_ui()
+        
+        # Inicializar el simulador; la instrumentación se activa desde el panel de diagnóstico
+        self.instrumentation = Instrumentation(enabled=False)
+        self.simulator = RiskSimulator(instrumentation=self.instrumentation)
+        
+    def setup_ui(self):
+        """Configura todos los elementos de la interfaz gráfica."""
+        # Frame principal
+        main_frame = ttk.Frame(self.root, padding="10")
+        main_frame.pack(fill=tk.BOTH, expand=True)
+        
+        # Panel de configuración
+        config_frame = ttk.LabelFrame(main_frame, text="Configuración del Sprint", padding="10")
+        config_frame.pack(fill=tk.X, pady=5)
+        
+        # Controles de configuración
+        ttk.Label(config_frame, text="Número de Riesgos:").grid(row=0, column=0, sticky=tk.W)
+        self.risk_count = tk.IntVar(value=5)
+        ttk.Spinbox(config_frame, from_=1, to=MAX_GUI_RISKS, textvariable=self.risk_count, width=9).grid(row=0, column=1, sticky=tk.W)
+        
+        ttk.Label(config_frame, text="Filtrar categoría:").grid(row=1, column=0, sticky=tk.W, pady=(5, 0))
+        self.category_filter = tk.StringVar(value="todas")
+        filter_box = ttk.Combobox(config_frame, textvariable=self.category_filter, state="readonly", width=9,
+                                  values=("todas",) + PRIORITY_CATEGORIES)
+        filter_box.grid(row=1, column=1, sticky=tk.W, pady=(5, 0))
+        filter_box.bind("<<ComboboxSelected>>", self.apply_filter)
+        
+        # Progreso de la simulación en segundo plano
+        self.progress = ttk.Progressbar(config_frame, orient=tk.HORIZONTAL, mode='determinate', length=300)
+        self.progress.grid(row=1, column=2, columnspan=4, padx=(20, 0), pady=(5, 0), sticky=tk.E)
+        
+        # Botones de acción
+        button_frame = ttk.Frame(config_frame)
+        button_frame.grid(row=0, column=2, columnspan=4, padx=(20,0), sticky=tk.E)
+        
+        self.simulate_button = ttk.Button(button_frame, text="Simular Sprint", command=self.run_simulation)
+        self.simulate_button.pack(side=tk.LEFT, padx=5)
+        self.cancel_button = ttk.Button(button_frame, text="Cancelar", command=self.cancel_simulation, state=tk.DISABLED)
+        self.cancel_button.pack(side=tk.LEFT, padx=5)
+        ttk.Button(button_frame, text="Pruebas Unitarias", command=self.run_unit_tests).pack(side=tk.LEFT, padx=5)
+        ttk.Button(button_frame, text="Exportar CSV", command=self.export_to_csv).pack(side=tk.LEFT, padx=5)
+        ttk.Button(button_frame, text="Limpiar", command=self.clear_results).pack(side=tk.LEFT, padx=5)
+        ttk.Button(button_frame, text="Diagnóstico", command=self.show_diagnostics).pack(side=tk.LEFT, padx=5)
+        
+        # Panel de resultados
+        results_frame = ttk.LabelFrame(main_frame, text="Resultados de la Simulación", padding="10")
+        results_frame.pack(fill=tk.BOTH, expand=True, pady=5)
+        
+        # Tabla virtualizada: solo se crean las filas visibles
+        columns = [
+            ('type', 'Tipo', 100),
+            ('desc', 'Descripción', 200),
+            ('prob', 'Probabilidad', 100),
+            ('impact', 'Impacto', 100),
+            ('priority', 'Prioridad', 100),
+            ('category', 'Categoría', 120),
+            ('mitigation', 'Mitigación', 250)
+        ]
+        self.results_table = VirtualRiskTable(results_frame, columns)
+        self.tree = self.results_table.tree
+        
+        # Panel de estadísticas
+        stats_frame = ttk.LabelFrame(main_frame, text="Estadísticas", padding="10")
+        stats_frame.pack(fill=tk.X, pady=5)
+        
+        self.stats_text = scrolledtext.ScrolledText(stats_frame, height=6, wrap=tk.WORD, font=('Arial', 10))
+        self.stats_text.pack(fill=tk.BOTH, expand=True)
+        
+        # Configurar tags para colores en estadísticas
+        self.stats_text.tag_config('high', foreground='red', font=('Arial', 10, 'bold'))
+        self.stats_text.tag_config('medium', foreground='orange', font=('Arial', 10, 'bold'))
+        self.stats_text.tag_config('low', foreground='green', font=('Arial', 10, 'bold'))
+        self.stats_text.tag_config('highlight', foreground='blue', font=('Arial', 10, 'bold'))
+        
+    def run_simulation(self):
+        """Inicia la simulación en segundo plano y muestra los resultados a medida que llegan."""
+        if self.job is not None and not self.job.done:
+            return
+        
+        try:
+            num_risks = self.risk_count.get()
+            if not 1 <= num_risks <= MAX_GUI_RISKS:
+                raise ValueError(f"El número de riesgos debe estar entre 1 y {MAX_GUI_RISKS:,}")
+            
+            self.clear_results()
+            self.job = SimulationJob(self.simulator, num_risks)
+            self.job.start()
+        except Exception as e:
+            messagebox.showerror("Error", f"Ocurrió un error durante la simulación:\n{str(e)}")
+            return
+        
+        self.progress.config(maximum=num_risks, value=0)
+        self.simulate_button.config(state=tk.DISABLED)
+        self.cancel_button.config(state=tk.NORMAL)
+        self.root.after(POLL_INTERVAL_MS, self._poll_simulation)
+    
+    def cancel_simulation(self):
+        """Detiene la simulación en curso; se conservan los bloques ya recibidos."""
+        if self.job is not None:
+            self.job.cancel()
+    
+    def _poll_simulation(self):
+        """Incorpora los bloques terminados por el hilo de simulación."""
+        job = self.job
+        if job is None:
+            return
+        
+        batches = job.poll()
+        if batches:
+            received = sum(len(batch) for batch in batches)
+            stage = self.instrumentation.stage
+            # Las estadísticas se actualizan solo con los bloques nuevos
+            with stage("estadisticas", received):
+                for batch in batches:
+                    self.statistics.update(batch)
+            with stage("interfaz", received):
+                if self.current_results is not None:
+                    batches.insert(0, self.current_results)
+                self.current_results = RiskBatch.concatenate(batches)
+                self.results_table.update_batch(self.current_results)
+                self.progress.config(value=len(self.current_results))
+                
+                # Estadísticas parciales con lo recibido hasta ahora
+                self.show_statistics(self.statistics)
+        
+        if not job.done:
+            self.root.after(POLL_INTERVAL_MS, self._poll_simulation)
+            return
+        
+        self.simulate_button.config(state=tk.NORMAL)
+        self.cancel_button.config(state=tk.DISABLED)
+        if job.error is not None:
+            messagebox.showerror("Error", f"Ocurrió un error durante la simulación:\n{str(job.error)}")
+    
+    def apply_filter(self, event=None):
+        """Filtra la tabla de resultados por la categoría seleccionada."""
+        category = self.category_filter.get()
+        self.results_table.model.set_filter(None if category == "todas" else category)
+        self.results_table.reset_view()
+    
+    def show_statistics(self, risks):
+        """Muestra estadísticas de la simulación a partir de un RiskStatistics o de los riesgos."""
+        stats = risks if isinstance(risks, RiskStatistics) else RiskStatistics.from_risks(risks)
+        total_risks = stats.count
+        high_risks, medium_risks, low_risks = (
+            stats.category_counts[PriorityCategory.ALTO],
+            stats.category_counts[PriorityCategory.MEDIO],
+            stats.category_counts[PriorityCategory.BAJO]
+        )
+        share = (lambda n: n / total_risks) if total_risks > 0 else (lambda n: 0)
+        
+        self.stats_text.config(state=tk.NORMAL)
+        self.stats_text.delete(1.0, tk.END)
+        
+        self.stats_text.insert(tk.END, "=== Resumen del Sprint ===\n", 'highlight')
+        self.stats_text.insert(tk.END, f"Total de riesgos identificados: {total_risks}\n\n")
+        
+        self.stats_text.insert(tk.END, "Distribución de riesgos:\n")
+        self.stats_text.insert(tk.END, f"• Alto: ", 'high')
+        self.stats_text.insert(tk.END, f"{high_risks} ({share(high_risks):.0%})\n", 'high')
+        self.stats_text.insert(tk.END, f"• Medio: ", 'medium')
+        self.stats_text.insert(tk.END, f"{medium_risks} ({share(medium_risks):.0%})\n", 'medium')
+        self.stats_text.insert(tk.END, f"• Bajo: ", 'low')
+        self.stats_text.insert(tk.END, f"{low_risks} ({share(low_risks):.0%})\n\n", 'low')
+        
+        self.stats_text.insert(tk.END, f"Prioridad promedio: {stats.mean:.1f} (desvío {stats.std:.1f})\n\n")
+        
+        # Mostrar el riesgo más crítico
+        max_risk = stats.most_critical
+        if max_risk is not None:
+            self.stats_text.insert(tk.END, "Riesgo más crítico:\n", 'highlight')
+            self.stats_text.insert(tk.END, f"• Descripción: {max_risk['descripcion']}\n")
+            self.stats_text.insert(tk.END, f"• Prioridad: {max_risk['valor_prioridad']} (")
+            
+            if max_risk['categoria_prioridad'] == 'alto':
+                self.stats_text.insert(tk.END, "ALTO", 'high')
+            elif max_risk['categoria_prioridad'] == 'medio':
+                self.stats_text.insert(tk.END, "MEDIO", 'medium')
+            else:
+                self.stats_text.insert(tk.END, "BAJO", 'low')
+                
+            self.stats_text.insert(tk.END, ")\n")
+            self.stats_text.insert(tk.END, f"• Mitigación sugerida: {max_risk['mitigacion']}\n")
+        
+        self.stats_text.config(state=tk.DISABLED)
+    
+    def run_unit_tests(self):
+        """Ejecuta pruebas unitarias y muestra los resultados."""
+        import unittest
+        from src.self_test import TestRiskSimulator
+        
+        test_suite = unittest.TestLoader().loadTestsFromTestCase(TestRiskSimulator)
+        test_result = unittest.TextTestRunner(stream=None, verbosity=2).run(test_suite)
+        
+        message = (
+            f"Pruebas ejecutadas: {test_result.testsRun}\n"
+            f"Fallidas: {len(test_result.failures)}\n"
+            f"Errores: {len(test_result.errors)}"
+        )
+        
+        if test_result.wasSuccessful():
+            messagebox.showinfo("Resultado de Pruebas", f"¡Todas las pruebas pasaron!\n{message}")
+        else:
+            messagebox.showwarning("Resultado de Pruebas", f"Algunas pruebas fallaron:\n{message}")
+    
+    def export_to_csv(self):
+        """Exporta los resultados a un archivo CSV."""
+        if self.current_results is None or not len(self.current_results):
+            messagebox.showwarning("Sin datos", "No hay datos para exportar. Ejecute una simulación primero.")
+            return
+            
+        try:
+            filename = f"riesgos_sprint_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
+            
+            # Se exporta desde los resultados, no desde el Treeview
+            chunks = (self.current_results[i:i + DEFAULT_CHUNK_SIZE]
+                      for i in range(0, len(self.current_results), DEFAULT_CHUNK_SIZE))
+            export_csv(filename, chunks)
+            
+            messagebox.showinfo("Exportación exitosa", f"Los datos se exportaron correctamente a:\n{filename}")
+        
+        except Exception as e:
+            messagebox.showerror("Error al exportar", f"No se pudo exportar el archivo:\n{str(e)}")
+    
+    def show_diagnostics(self):
+        """Abre el panel de diagnóstico con los tiempos por etapa de la instrumentación."""
+        if self.diagnostics_window is not None and self.diagnostics_window.winfo_exists():
+            self.diagnostics_window.lift()
+            return
+        
+        window = tk.Toplevel(self.root)
+        window.title("Diagnóstico de rendimiento")
+        window.geometry("720x360")
+        self.diagnostics_window = window
+        
+        controls = ttk.Frame(window, padding="5")
+        controls.pack(fill=tk.X)
+        enabled = tk.BooleanVar(value=self.instrumentation.enabled)
+        allocations = tk.BooleanVar(value=self.instrumentation.track_allocations)
+        
+        def toggle_enabled():
+            self.instrumentation.enabled = enabled.get()
+        
+        def toggle_allocations():
+            self.instrumentation.stop()
+            self.instrumentation.track_allocations = allocations.get()
+            self.instrumentation.start()
+        
+        def reset():
+            self.instrumentation.reset()
+            refresh(reschedule=False)
+        
+        def export_json():
+            filename = f"diagnostico_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+            try:
+                self.instrumentation.to_json(filename)
+                messagebox.showinfo("Exportación exitosa", f"El diagnóstico se exportó a:\n{filename}",
+                                    parent=window)
+            except OSError as e:
+                messagebox.showerror("Error al exportar", f"No se pudo exportar el archivo:\n{str(e)}",
+                                     parent=window)
+        
+        ttk.Checkbutton(controls, text="Instrumentación activa", variable=enabled,
+                        command=toggle_enabled).pack(side=tk.LEFT, padx=5)
+        ttk.Checkbutton(controls, text="Medir memoria (tracemalloc)", variable=allocations,
+                        command=toggle_allocations).pack(side=tk.LEFT, padx=5)
+        ttk.Button(controls, text="Reiniciar", command=reset).pack(side=tk.RIGHT, padx=5)
+        ttk.Button(controls, text="Exportar JSON", command=export_json).pack(side=tk.RIGHT, padx=5)
+        
+        report_text = scrolledtext.ScrolledText(window, wrap=tk.NONE, font=('Courier', 10))
+        report_text.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+        
+        def refresh(reschedule=True):
+            if not window.winfo_exists():
+                return
+            report_text.config(state=tk.NORMAL)
+            report_text.delete(1.0, tk.END)
+            report_text.insert(tk.END, self.instrumentation.format_report())
+            report_text.config(state=tk.DISABLED)
+            if reschedule:
+                window.after(DIAGNOSTICS_REFRESH_MS, refresh)
+        
+        refresh()
+    
+    def clear_results(self):
+        """Limpia todos los resultados y estadísticas."""
+        self.cancel_simulation()
+        self.job = None
+        self.current_results = None
+        self.statistics = RiskStatistics()
+        self.progress.config(value=0)
+        self.simulate_button.config(state=tk.NORMAL)
+        self.cancel_button.config(state=tk.DISABLED)
+        self.results_table.clear()
+        
+        self.stats_text.config(state=tk.NORMAL)
+        self.stats_text.delete(1.0, tk.END)
+        self.stats_text.insert(tk.END, "Ejecute una simulación para ver los resultados...")
+        self.stats_text.config(state=tk.DISABLED)
+
+
+class VirtualRiskTable:
+    """
+    Treeview virtualizado sobre un RiskTableModel.
+    
+    El Treeview solo contiene las filas de la ventana visible; el
+    desplazamiento, el orden y el filtro se resuelven sobre los arrays
+    del modelo, por lo que el costo no depende del total de riesgos.
+    """
+    
+    # Tag de color de cada categoría
+    CATEGORY_TAGS = {"bajo": "low", "medio": "medium", "alto": "high"}
+    
+    # Campo de RISK_FIELDS que muestra cada columna
+    COLUMN_FIELDS = {
+        'type': "tipo", 'desc': "descripcion", 'prob': "probabilidad", 'impact': "impacto",
+        'priority': "valor_prioridad", 'category': "categoria_prioridad", 'mitigation': "mitigacion"
+    }
+    
+    def __init__(self, parent, columns: List[Tuple[str, str, int]], row_height: int = 20):
+        self.model = RiskTableModel()
+        self.offset = 0
+        self.row_height = row_height
+        self.visible_rows = 20
+        self._headings = {col_id: col_text for col_id, col_text, _ in columns}
+        
+        self.tree = ttk.Treeview(parent, columns=[c[0] for c in columns], show='headings',
+                                 selectmode='extended', height=self.visible_rows)
+        for col_id, col_text, col_width in columns:
+            self.tree.heading(col_id, text=col_text, command=lambda c=col_id: self.toggle_sort(c))
+            self.tree.column(col_id, width=col_width, anchor=tk.W if col_id in ['desc', 'mitigation'] else tk.CENTER)
+        
+        # La barra de desplazamiento recorre el modelo, no el Treeview
+        self.scrollbar = ttk.Scrollbar(parent, orient=tk.VERTICAL, command=self._on_scrollbar)
+        self.scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.tree.pack(fill=tk.BOTH, expand=True)
+        
+        self.tree.bind("<Configure>", self._on_resize)
+        self.tree.bind("<MouseWheel>", lambda e: self.scroll(-1 if e.delta > 0 else 1, "units"))
+        self.tree.bind("<Button-4>", lambda e: self.scroll(-1, "units"))
+        self.tree.bind("<Button-5>", lambda e: self.scroll(1, "units"))
+        self.tree.bind("<Prior>", lambda e: self.scroll(-1, "pages"))
+        self.tree.bind("<Next>", lambda e: self.scroll(1, "pages"))
+        
+        # Configurar tags para colores
+        self.tree.tag_configure('high', background='#ffdddd')
+        self.tree.tag_configure('medium', background='#fff3cd')
+        self.tree.tag_configure('low', background='#d4edda')
+    
+    def set_batch(self, batch: "RiskBatch"):
+        """Muestra un nuevo conjunto de resultados desde el principio."""
+        self.model.set_batch(batch)
+        self.reset_view()
+    
+    def update_batch(self, batch: "RiskBatch"):
+        """Reemplaza los resultados manteniendo la posición de desplazamiento."""
+        self.model.set_batch(batch)
+        self.refresh()
+    
+    def clear(self):
+        """Vacía la tabla sin recorrer los riesgos."""
+        self.model.set_batch(None)
+        self.reset_view()
+    
+    def reset_view(self):
+        """Vuelve al inicio y redibuja la ventana visible."""
+        self.offset = 0
+        self.refresh()
+    
+    def toggle_sort(self, col_id: str):
+        """Ordena por la columna indicada; un segundo clic invierte el orden."""
+        field = self.COLUMN_FIELDS[col_id]
+        descending = self.model.sort_field == field and not self.model.descending
+        self.model.sort_by(field, descending)
+        
+        for other_id, text in self._headings.items():
+            arrow = (" ▼" if descending else " ▲") if other_id == col_id else ""
+            self.tree.heading(other_id, text=text + arrow)
+        self.reset_view()
+    
+    def scroll(self, amount: int, what: str = "units"):
+        """Desplaza la ventana visible en filas o páginas."""
+        step = self.visible_rows if what == "pages" else 1
+        self.offset += int(amount) * step
+        self.refresh()
+    
+    def refresh(self):
+        """Sincroniza las filas del Treeview con la ventana visible del modelo."""
+        total = len(self.model)
+        self.offset = max(0, min(self.offset, total - self.visible_rows))
+        window = self.model.window(self.offset, self.visible_rows)
+        
+        rows = list(zip(*(window.column_list(field) for field in RISK_FIELDS))) if window is not None else []
+        items = self.tree.get_children()
+        
+        # Se reutilizan los items existentes en lugar de recrearlos
+        for i, row in enumerate(rows):
+            tag = self.CATEGORY_TAGS[row[5]]
+            if i < len(items):
+                self.tree.item(items[i], values=row, tags=(tag,))
+            else:
+                self.tree.insert('', tk.END, values=row, tags=(tag,))
+        if len(items) > len(rows):
+            self.tree.delete(*items[len(rows):])
+        
+        if total:
+            self.scrollbar.set(self.offset / total, (self.offset + len(rows)) / total)
+        else:
+            self.scrollbar.set(0.0, 1.0)
+    
+    def _on_scrollbar(self, action: str, *args):
+        if action == "moveto":
+            self.offset = int(float(args[0]) * len(self.model))
+            self.refresh()
+        elif action == "scroll":
+            self.scroll(int(args[0]), args[1])
+    
+    def _on_resize(self, event):
+        visible_rows = max(1, event.height // self.row_height - 1)
+        if visible_rows != self.visible_rows:
+            self.visible_rows = visible_rows
+            self.refresh()
@@ -0,0 +1,223 @@
+"""
+Instrumentación opcional de las etapas del simulador.
+
+Las rutas críticas del simulador envuelven cada etapa (muestreo, cálculo
+de prioridad, mitigación, ensamblado del lote, inserción en la interfaz)
+en `instrumentation.stage(nombre, elementos)`. Con la instrumentación
+desactivada, `stage` devuelve siempre el mismo contexto vacío, por lo que
+el costo es una llamada por lote y no por riesgo.
+
+Activada, registra por etapa la cantidad de llamadas, el tiempo total y
+máximo, los elementos procesados por segundo y, si se pide, el pico de
+memoria reservada medido con tracemalloc. También puede perfilar toda la
+sesión con cProfile. El informe se exporta a JSON con `to_json`.
+"""
+import cProfile
+import json
+import threading
+import time
+import tracemalloc
+from collections import Counter
+from typing import Dict, Optional
+
+
+class _NullStage:
+    """Contexto vacío que se usa cuando la instrumentación está desactivada."""
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info):
+        return False
+
+
+_NULL_STAGE = _NullStage()
+
+
+class _Stage:
+    """Mide una ejecución de una etapa."""
+    
+    __slots__ = ("_owner", "_name", "_items", "_start", "_memory_start", "_peak", "_parent")
+    
+    def __init__(self, owner: "Instrumentation", name: str, items: int):
+        self._owner = owner
+        self._name = name
+        self._items = items
+    
+    def __enter__(self):
+        self._memory_start = None
+        if self._owner.track_allocations and tracemalloc.is_tracing():
+            # reset_peak es global: antes de reiniciarlo, la etapa que
+            # contiene a esta guarda el pico que llevaba hasta ahora
+            stack = self._owner._open_stages()
+            self._parent = stack[-1] if stack else None
+            if self._parent is not None:
+                self._parent._peak = max(self._parent._peak, tracemalloc.get_traced_memory()[1])
+            tracemalloc.reset_peak()
+            self._memory_start = tracemalloc.get_traced_memory()[0]
+            self._peak = self._memory_start
+            stack.append(self)
+        self._start = time.perf_counter_ns()
+        return self
+    
+    def __exit__(self, *exc_info):
+        elapsed = time.perf_counter_ns() - self._start
+        peak = None
+        if self._memory_start is not None:
+            # Pico absoluto desde que empezó la etapa, incluidas las etapas internas
+            self._peak = max(self._peak, tracemalloc.get_traced_memory()[1])
+            peak = self._peak - self._memory_start
+            self._owner._open_stages().pop()
+            if self._parent is not None:
+                self._parent._peak = max(self._parent._peak, self._peak)
+        self._owner._record(self._name, elapsed, self._items, peak)
+        return False
+
+
+class Instrumentation:
+    """
+    Temporizadores, contadores y memoria por etapa.
+    
+    `enabled` puede cambiarse en cualquier momento. `track_allocations`
+    y `profile` activan tracemalloc y cProfile entre `start` y `stop`
+    (o dentro de un bloque `with`).
+    """
+    
+    def __init__(self, enabled: bool = True, track_allocations: bool = False, profile: bool = False):
+        self.enabled = enabled
+        self.track_allocations = track_allocations
+        self.profile = profile
+        self._lock = threading.Lock()
+        self._profiler: Optional[cProfile.Profile] = None
+        self._owns_tracemalloc = False
+        # Etapas con medición de memoria abiertas en cada hilo, de la más externa a la más interna
+        self._local = threading.local()
+        self.reset()
+    
+    def __enter__(self) -> "Instrumentation":
+        self.start()
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.stop()
+        return False
+    
+    def __reduce__(self):
+        # En los procesos de run_monte_carlo no se registra nada: los datos
+        # no volverían al proceso principal
+        return (_null_instrumentation, ())
+    
+    def reset(self):
+        """Descarta todo lo registrado."""
+        with self._lock:
+            # Por etapa: [llamadas, ns totales, ns máximos, elementos, pico de memoria]
+            self._stages: Dict[str, list] = {}
+            self.counters = Counter()
+    
+    def start(self):
+        """Inicia tracemalloc y cProfile si se pidieron."""
+        if self.track_allocations and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._owns_tracemalloc = True
+        if self.profile and self._profiler is None:
+            self._profiler = cProfile.Profile()
+            self._profiler.enable()
+    
+    def stop(self):
+        if self._profiler is not None:
+            self._profiler.disable()
+        if self._owns_tracemalloc:
+            tracemalloc.stop()
+            self._owns_tracemalloc = False
+    
+    def stage(self, name: str, items: int = 0):
+        """Contexto que mide una ejecución de la etapa `name` sobre `items` elementos."""
+        if not self.enabled:
+            return _NULL_STAGE
+        return _Stage(self, name, items)
+    
+    def count(self, name: str, amount: int = 1):
+        if self.enabled:
+            with self._lock:
+                self.counters[name] += amount
+    
+    def report(self) -> Dict:
+        """Informe serializable a JSON."""
+        with self._lock:
+            stages = {name: list(values) for name, values in self._stages.items()}
+            counters = dict(self.counters)
+        
+        report_stages = {}
+        for name, (calls, total_ns, max_ns, items, peak) in stages.items():
+            seconds = total_ns / 1e9
+            report_stages[name] = {
+                "llamadas": calls,
+                "segundos": seconds,
+                "segundos_max": max_ns / 1e9,
+                "elementos": items,
+                "elementos_por_segundo": items / seconds if items and seconds else None,
+                "memoria_pico_bytes": peak
+            }
+        return {"etapas": report_stages, "contadores": counters}
+    
+    def to_json(self, path: Optional[str] = None) -> str:
+        """Devuelve el informe en JSON y, si se indica `path`, lo guarda."""
+        text = json.dumps(self.report(), ensure_ascii=False, indent=2)
+        if path is not None:
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(text)
+        return text
+    
+    def dump_profile(self, path: str):
+        """Guarda las estadísticas de cProfile (legibles con pstats o snakeviz)."""
+        if self._profiler is None:
+            raise ValueError("El perfilado con cProfile no está activo")
+        self._profiler.dump_stats(path)
+    
+    def format_report(self) -> str:
+        """Informe en texto, con una fila por etapa ordenada por tiempo total."""
+        report = self.report()
+        if not report["etapas"] and not report["contadores"]:
+            return "Sin datos de instrumentación"
+        
+        lines = [f"{'Etapa':<16}{'Llamadas':>10}{'Total ms':>12}{'Máx ms':>10}"
+                 f"{'Elem./s':>14}{'Memoria KiB':>13}"]
+        by_time = sorted(report["etapas"].items(), key=lambda item: item[1]["segundos"], reverse=True)
+        for name, stage in by_time:
+            rate = stage["elementos_por_segundo"]
+            memory = stage["memoria_pico_bytes"]
+            lines.append(
+                f"{name:<16}{stage['llamadas']:>10}{stage['segundos'] * 1e3:>12.1f}"
+                f"{stage['segundos_max'] * 1e3:>10.1f}"
+                f"{(f'{rate:,.0f}' if rate else '-'):>14}"
+                f"{(f'{memory / 1024:,.0f}' if memory is not None else '-'):>13}"
+            )
+        for name, value in sorted(report["contadores"].items()):
+            lines.append(f"{name}: {value:,}")
+        return "\n".join(lines)
+    
+    def _open_stages(self) -> list:
+        stack = getattr(self._local, "stages", None)
+        if stack is None:
+            stack = self._local.stages = []
+        return stack
+    
+    def _record(self, name: str, elapsed_ns: int, items: int, peak: Optional[int]):
+        with self._lock:
+            values = self._stages.get(name)
+            if values is None:
+                values = self._stages[name] = [0, 0, 0, 0, None]
+            values[0] += 1
+            values[1] += elapsed_ns
+            values[2] = max(values[2], elapsed_ns)
+            values[3] += items
+            if peak is not None:
+                values[4] = peak if values[4] is None else max(values[4], peak)
+
+
+def _null_instrumentation() -> Instrumentation:
+    return NULL_INSTRUMENTATION
+
+
+# Instrumentación desactivada que usan por defecto todos los simuladores
+NULL_INSTRUMENTATION = Instrumentation(enabled=False)
@@ -0,0 +1,74 @@
+"""Ejecución de simulaciones en un hilo de fondo."""
+import queue
+import threading
+from typing import List, Optional
+
+from src.simulator import RiskBatch, RiskSimulator
+
+# Riesgos por bloque que la simulación en segundo plano entrega a la GUI
+GUI_CHUNK_SIZE = 50_000
+
+
+class SimulationJob:
+    """
+    Simulación ejecutada en un hilo de fondo.
+    
+    Los bloques generados se entregan mediante una cola; quien la
+    consume (por ejemplo la GUI con `root.after`) llama a `poll` sin
+    bloquearse.
+    """
+    
+    def __init__(self, simulator: "RiskSimulator", total_risks: int,
+                 chunk_size: int = GUI_CHUNK_SIZE):
+        if total_risks < 0:
+            raise ValueError("El número de riesgos no puede ser negativo")
+        self.simulator = simulator
+        self.total_risks = total_risks
+        self.chunk_size = chunk_size
+        self.completed = 0
+        self.error = None
+        self.done = False
+        self._queue = queue.Queue()
+        self._cancel = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+    
+    @property
+    def cancelled(self) -> bool:
+        return self._cancel.is_set()
+    
+    def start(self):
+        self._thread.start()
+    
+    def cancel(self):
+        """Pide al hilo que se detenga antes del siguiente bloque."""
+        self._cancel.set()
+    
+    def join(self, timeout: Optional[float] = None):
+        self._thread.join(timeout)
+    
+    def poll(self) -> List[RiskBatch]:
+        """Devuelve los bloques terminados desde la última llamada sin esperar."""
+        batches = []
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is None:
+                self.done = True
+                break
+            batches.append(item)
+            self.completed += len(item)
+        return batches
+    
+    def _run(self):
+        try:
+            for batch in self.simulator.iter_risk_batches(self.total_risks, self.chunk_size):
+                if self._cancel.is_set():
+                    break
+                self._queue.put(batch)
+        except Exception as e:
+            self.error = e
+        finally:
+            # None marca el final para quien consume la cola
+            self._queue.put(None)
@@ -0,0 +1,70 @@
+"""Pruebas unitarias del simulador que se ejecutan desde la interfaz gráfica."""
+import unittest
+
+from src.simulator import RiskSimulator
+
+
+class TestRiskSimulator(unittest.TestCase):
+    """Pruebas unitarias para el simulador de riesgos."""
+    
+    def setUp(self):
+        self.simulator = RiskSimulator()
+    
+    def test_calculate_priority(self):
+        """Prueba el cálculo de prioridad y categorización."""
+        test_cases = [
+            ((2, 3), (6, "bajo")),
+            ((5, 6), (30, "bajo")),
+            ((5, 7), (35, "medio")),
+            ((7, 10), (70, "medio")),
+            ((8, 9), (72, "alto")),
+            ((10, 10), (100, "alto"))
+        ]
+        
+        for (prob, imp), (expected_val, expected_cat) in test_cases:
+            with self.subTest(prob=prob, imp=imp):
+                result_val, result_cat = self.simulator.calculate_priority(prob, imp)
+                self.assertEqual(result_val, expected_val)
+                self.assertEqual(result_cat, expected_cat)
+    
+    def test_invalid_inputs(self):
+        """Prueba que se levanten errores con entradas inválidas."""
+        with self.assertRaises(ValueError):
+            self.simulator.calculate_priority(0, 5)
+        
+        with self.assertRaises(ValueError):
+            self.simulator.calculate_priority(11, 5)
+        
+        with self.assertRaises(ValueError):
+            self.simulator.calculate_priority(5, 0)
+        
+        with self.assertRaises(ValueError):
+            self.simulator.calculate_priority(5, 11)
+    
+    def test_integration_flow(self):
+        """Prueba de integración del flujo completo."""
+        sprint_results = self.simulator.run_sprint_simulation(3)
+        
+        self.assertEqual(len(sprint_results), 3)
+        
+        for risk in sprint_results:
+            self.assertIn("tipo", risk)
+            self.assertIn("descripcion", risk)
+            self.assertIn("probabilidad", risk)
+            self.assertIn("impacto", risk)
+            self.assertIn("valor_prioridad", risk)
+            self.assertIn("categoria_prioridad", risk)
+            self.assertIn("mitigacion", risk)
+            
+            calculated_value = risk["probabilidad"] * risk["impacto"]
+            self.assertEqual(risk["valor_prioridad"], calculated_value)
+            
+            if calculated_value <= 30:
+                expected_category = "bajo"
+            elif 31 <= calculated_value <= 70:
+                expected_category = "medio"
+            else:
+                expected_category = "alto"
+            
+            self.assertEqual(risk["categoria_prioridad"], expected_category)
+            self.assertIn(risk["mitigacion"], self.simulator.mitigation_strategies[expected_category])
@@ -0,0 +1,465 @@
+"""
+Servicio HTTP/JSON local alrededor de RiskSimulator.
+
+    python -m src servicio --puerto 8080
+
+Rutas:
+
+    GET  /salud        estado del servicio
+    GET  /metricas     solicitudes, latencias (p50/p95/p99) y lotes agrupados
+    POST /sprint       {"riesgos": 5, "umbrales": [30, 70], "semilla": 1}
+    POST /montecarlo   {"sprints": 100000, "riesgos": 5, "semilla": 1}
+    POST /lote         {"riesgos": 1000000, "bloque": 100000} → CSV por partes
+
+Solo usa asyncio (un HTTP/1.1 mínimo con keep-alive), sin dependencias
+externas. Las solicitudes de sprint sin semilla que llegan dentro de la
+misma ventana se agrupan en una sola llamada vectorizada a
+`run_sprint_simulation_batch` y el lote se reparte entre ellas. Las
+simulaciones Monte Carlo usan un pool de procesos creado y precalentado
+al iniciar el servicio, nunca un proceso por solicitud. `/lote` responde
+con `Transfer-Encoding: chunked`, un bloque de riesgos por parte.
+"""
+import asyncio
+import csv
+import io
+import json
+import os
+import time
+from collections import Counter, deque
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import suppress
+from http import HTTPStatus
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from src.cache import ScenarioCache, scenario_key
+from src.export import CSV_HEADER, iter_csv_rows
+from src.simulator import DEFAULT_CHUNK_SIZE, DEFAULT_THRESHOLDS, RiskBatch, RiskSimulator
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8080
+
+# Espera máxima de una solicitud de sprint para agruparse con otras
+DEFAULT_COALESCE_WINDOW = 0.002
+
+# Riesgos pendientes a partir de los cuales el lote se simula sin esperar
+MAX_COALESCED_RISKS = 100_000
+
+# Límites por solicitud
+MAX_SPRINT_RISKS = 10_000
+MAX_MONTE_CARLO_SPRINTS = 10_000_000
+MAX_STREAM_RISKS = 100_000_000
+MAX_BODY_BYTES = 1 << 20
+
+# Latencias recientes que se conservan por ruta para los percentiles
+LATENCY_SAMPLES = 10_000
+
+
+class HTTPError(Exception):
+    """Error que se responde al cliente con su código de estado."""
+    
+    def __init__(self, status: HTTPStatus, message: str):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+
+class SprintCoalescer:
+    """
+    Agrupa las solicitudes de sprint que llegan juntas en un único lote
+    vectorizado por par de umbrales.
+    
+    Cada par de umbrales tiene su propio simulador, con un flujo hijo de
+    `seed`. Una solicitud espera como mucho `window` segundos, o menos si
+    lo pendiente llega a `max_risks` riesgos.
+    """
+    
+    def __init__(self, window: float = DEFAULT_COALESCE_WINDOW,
+                 max_risks: int = MAX_COALESCED_RISKS, seed=None):
+        self.window = window
+        self.max_risks = max_risks
+        self._seed_sequence = np.random.SeedSequence(seed)
+        self._simulators: Dict[Tuple[int, int], RiskSimulator] = {}
+        self._pending: Dict[Tuple[int, int], List[Tuple[int, asyncio.Future]]] = {}
+        self._pending_risks = 0
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self.batches = 0
+        self.requests = 0
+    
+    async def submit(self, thresholds: Tuple[int, int], num_risks: int) -> RiskBatch:
+        """Encola `num_risks` riesgos y espera la porción del lote que le corresponde."""
+        loop = asyncio.get_running_loop()
+        # El simulador se crea aquí para que umbrales inválidos fallen en esta solicitud
+        self._simulator(thresholds)
+        future = loop.create_future()
+        self._pending.setdefault(thresholds, []).append((num_risks, future))
+        self._pending_risks += num_risks
+        if self._pending_risks >= self.max_risks:
+            self.flush()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(self.window, self.flush)
+        return await future
+    
+    def flush(self):
+        """Simula ya todo lo pendiente."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        pending, self._pending = self._pending, {}
+        self._pending_risks = 0
+        
+        for thresholds, requests in pending.items():
+            try:
+                batch = self._simulator(thresholds).run_sprint_simulation_batch(
+                    sum(num_risks for num_risks, _ in requests))
+            except Exception as e:
+                for _, future in requests:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+            offset = 0
+            for num_risks, future in requests:
+                if not future.done():
+                    future.set_result(batch[offset:offset + num_risks])
+                offset += num_risks
+            self.batches += 1
+            self.requests += len(requests)
+    
+    def _simulator(self, thresholds: Tuple[int, int]) -> RiskSimulator:
+        simulator = self._simulators.get(thresholds)
+        if simulator is None:
+            simulator = RiskSimulator(thresholds, rng=self._seed_sequence.spawn(1)[0])
+            self._simulators[thresholds] = simulator
+        return simulator
+
+
+class ServiceMetrics:
+    """Solicitudes, errores y latencias recientes por ruta."""
+    
+    def __init__(self):
+        self.started = time.monotonic()
+        self.requests = Counter()
+        self.errors = Counter()
+        self._latencies: Dict[str, deque] = {}
+    
+    def record(self, path: str, status: int, seconds: float):
+        self.requests[path] += 1
+        if status >= 400:
+            self.errors[path] += 1
+        self._latencies.setdefault(path, deque(maxlen=LATENCY_SAMPLES)).append(seconds)
+    
+    def snapshot(self, coalescer: SprintCoalescer) -> Dict:
+        """Métricas serializables a JSON."""
+        uptime = time.monotonic() - self.started
+        total = sum(self.requests.values())
+        routes = {}
+        for path, count in self.requests.items():
+            latencies_ms = np.asarray(self._latencies[path]) * 1e3
+            p50, p95, p99 = np.percentile(latencies_ms, [50, 95, 99]).tolist()
+            routes[path] = {
+                "solicitudes": count,
+                "errores": self.errors[path],
+                "latencia_ms": {"p50": p50, "p95": p95, "p99": p99, "max": float(latencies_ms.max())}
+            }
+        return {
+            "segundos_activo": uptime,
+            "solicitudes": total,
+            "solicitudes_por_segundo": total / uptime if uptime else 0.0,
+            "rutas": routes,
+            "lotes_agrupados": {
+                "lotes": coalescer.batches,
+                "solicitudes": coalescer.requests,
+                "solicitudes_por_lote": coalescer.requests / coalescer.batches if coalescer.batches else 0.0
+            }
+        }
+
+
+class SimulationService:
+    """
+    Servidor asyncio del simulador.
+    
+    Se usa con `async with SimulationService(...) as service` o con
+    `start`/`stop`. `port=0` elige un puerto libre, disponible luego en
+    `service.port`. Con `workers=0` las simulaciones Monte Carlo corren
+    en un hilo del proceso actual en lugar del pool de procesos.
+    """
+    
+    def __init__(self, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT,
+                 workers: Optional[int] = None, coalesce_window: float = DEFAULT_COALESCE_WINDOW,
+                 max_coalesced_risks: int = MAX_COALESCED_RISKS, seed=None):
+        self.host = host
+        self.port = port
+        self.workers = (os.cpu_count() or 1) if workers is None else workers
+        self.coalescer = SprintCoalescer(coalesce_window, max_coalesced_risks, seed)
+        self.metrics = ServiceMetrics()
+        self.cache = ScenarioCache()
+        # Simulaciones Monte Carlo con semilla en curso, por clave de escenario:
+        # las solicitudes idénticas que llegan mientras tanto esperan esa misma
+        self._running: Dict[str, asyncio.Future] = {}
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._routes = {
+            "/salud": ("GET", self._health, False),
+            "/metricas": ("GET", self._metrics, False),
+            "/sprint": ("POST", self._sprint, False),
+            "/montecarlo": ("POST", self._monte_carlo, False),
+            "/lote": ("POST", self._stream_batch, True)
+        }
+    
+    async def __aenter__(self) -> "SimulationService":
+        await self.start()
+        return self
+    
+    async def __aexit__(self, *exc_info):
+        await self.stop()
+        return False
+    
+    async def start(self):
+        """Crea y precalienta el pool de procesos y empieza a escuchar."""
+        if self.workers:
+            self._pool = ProcessPoolExecutor(max_workers=self.workers)
+            loop = asyncio.get_running_loop()
+            # Una tarea por proceso: cada uno arranca e importa NumPy y el simulador ahora
+            await asyncio.gather(*(loop.run_in_executor(self._pool, _warm_up)
+                                   for _ in range(self.workers)))
+        self._server = await asyncio.start_server(self._handle_connection, self.host, self.port,
+                                                  backlog=1024)
+        self.port = self._server.sockets[0].getsockname()[1]
+    
+    async def stop(self):
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+        self.coalescer.flush()
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+    
+    async def serve_forever(self):
+        async with self:
+            await self._server.serve_forever()
+    
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            while True:
+                try:
+                    request = await _read_request(reader)
+                except HTTPError as e:
+                    await _send_json(writer, e.status, {"error": e.message}, keep_alive=False)
+                    break
+                if request is None:
+                    break
+                method, path, headers, body = request
+                keep_alive = headers.get("connection", "").lower() != "close"
+                
+                start = time.perf_counter()
+                path = path.split("?", 1)[0]
+                status = await self._dispatch(method, path, body, writer, keep_alive)
+                self.metrics.record(path if path in self._routes else "otras", status,
+                                    time.perf_counter() - start)
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+            with suppress(ConnectionError):
+                await writer.wait_closed()
+    
+    async def _dispatch(self, method: str, path: str, body: bytes,
+                        writer: asyncio.StreamWriter, keep_alive: bool) -> int:
+        """Ejecuta la ruta y responde; devuelve el código de estado."""
+        try:
+            route = self._routes.get(path)
+            if route is None:
+                raise HTTPError(HTTPStatus.NOT_FOUND, f"Ruta desconocida: {path}")
+            expected_method, handler, streaming = route
+            if method != expected_method:
+                raise HTTPError(HTTPStatus.METHOD_NOT_ALLOWED, f"{path} solo acepta {expected_method}")
+            params = _parse_json(body) if method == "POST" else {}
+            if streaming:
+                await handler(params, writer, keep_alive)
+                return HTTPStatus.OK
+            status, payload = HTTPStatus.OK, await handler(params)
+        except HTTPError as e:
+            status, payload = e.status, {"error": e.message}
+        except ValueError as e:
+            status, payload = HTTPStatus.BAD_REQUEST, {"error": str(e)}
+        except ConnectionError:
+            raise
+        except Exception as e:
+            status, payload = HTTPStatus.INTERNAL_SERVER_ERROR, {"error": f"{type(e).__name__}: {e}"}
+        await _send_json(writer, status, payload, keep_alive)
+        return status
+    
+    async def _health(self, params: Dict) -> Dict:
+        return {"estado": "ok", "procesos": self.workers}
+    
+    async def _metrics(self, params: Dict) -> Dict:
+        return self.metrics.snapshot(self.coalescer)
+    
+    async def _sprint(self, params: Dict) -> Dict:
+        num_risks = _int_param(params, "riesgos", 5, 0, MAX_SPRINT_RISKS)
+        thresholds = _thresholds_param(params)
+        seed = _seed_param(params)
+        if seed is None:
+            batch = await self.coalescer.submit(thresholds, num_risks)
+        else:
+            # Con semilla el resultado es el mismo que `python -m src sprint --semilla`
+            batch = RiskSimulator(thresholds, rng=seed).run_sprint_simulation_batch(num_risks)
+        return {"riesgos": batch.to_records()}
+    
+    async def _monte_carlo(self, params: Dict) -> Dict:
+        num_sprints = _int_param(params, "sprints", 1000, 0, MAX_MONTE_CARLO_SPRINTS)
+        num_risks = _int_param(params, "riesgos", 5, 0, MAX_SPRINT_RISKS)
+        simulator = RiskSimulator(_thresholds_param(params))
+        seed = _seed_param(params)
+        
+        key = None if seed is None else scenario_key(simulator, num_sprints, num_risks, seed)
+        running = self._running.get(key) if key is not None else None
+        if running is None:
+            # La simulación bloquea hasta que el pool termina: se espera en un hilo
+            loop = asyncio.get_running_loop()
+            running = loop.run_in_executor(
+                None, lambda: self.cache.run_monte_carlo(simulator, num_sprints, num_risks, seed=seed,
+                                                         max_workers=max(1, self.workers),
+                                                         executor=self._pool))
+            if key is not None:
+                self._running[key] = running
+                running.add_done_callback(lambda _: self._running.pop(key, None))
+        # shield: si un cliente se desconecta, las demás solicitudes siguen esperando
+        result = await asyncio.shield(running)
+        return {**result.statistics.to_dict(), **result.high_risk_summary()}
+    
+    async def _stream_batch(self, params: Dict, writer: asyncio.StreamWriter, keep_alive: bool):
+        total = _int_param(params, "riesgos", 5, 0, MAX_STREAM_RISKS)
+        chunk_size = _int_param(params, "bloque", DEFAULT_CHUNK_SIZE, 1, MAX_COALESCED_RISKS)
+        simulator = RiskSimulator(_thresholds_param(params), rng=_seed_param(params))
+        chunks = _iter_csv_chunks(simulator.iter_risk_batches(total, chunk_size))
+        
+        writer.write(_response_head(HTTPStatus.OK, "text/csv; charset=utf-8", keep_alive,
+                                    {"Transfer-Encoding": "chunked"}))
+        loop = asyncio.get_running_loop()
+        while True:
+            # Simular y formatear un bloque no bloquea al resto de las conexiones
+            try:
+                data = await loop.run_in_executor(None, next, chunks, None)
+            except Exception as e:
+                # El encabezado ya se envió: solo queda cortar la respuesta
+                raise ConnectionAbortedError(f"Error en la respuesta por partes: {e}") from e
+            if data is None:
+                break
+            writer.write(b"%x\r\n%s\r\n" % (len(data), data))
+            await writer.drain()
+        writer.write(b"0\r\n\r\n")
+        await writer.drain()
+
+
+def _warm_up() -> int:
+    """Tarea mínima que obliga a un proceso del pool a arrancar e importar el simulador."""
+    return len(RiskSimulator(rng=0).run_sprint_simulation_batch(1))
+
+
+def _iter_csv_chunks(batches: Iterator[RiskBatch]) -> Iterator[bytes]:
+    """Cada bloque de riesgos como CSV; el primero lleva el encabezado."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(CSV_HEADER)
+    for rows in iter_csv_rows(batches):
+        writer.writerows(rows)
+        yield buffer.getvalue().encode("utf-8")
+        buffer.seek(0)
+        buffer.truncate()
+    if buffer.tell():
+        # Sin riesgos, la respuesta es solo el encabezado
+        yield buffer.getvalue().encode("utf-8")
+
+
+async def _read_request(reader: asyncio.StreamReader) -> Optional[Tuple[str, str, Dict[str, str], bytes]]:
+    """Lee una solicitud HTTP/1.1; devuelve None si el cliente cerró la conexión."""
+    try:
+        head = await reader.readuntil(b"\r\n\r\n")
+    except asyncio.IncompleteReadError:
+        return None
+    except asyncio.LimitOverrunError:
+        raise HTTPError(HTTPStatus.REQUEST_HEADER_FIELDS_TOO_LARGE, "Encabezados demasiado grandes")
+    
+    lines = head.decode("latin-1").split("\r\n")
+    try:
+        method, target, _ = lines[0].split(" ", 2)
+        headers = {}
+        for line in filter(None, lines[1:]):
+            name, value = line.split(":", 1)
+            headers[name.strip().lower()] = value.strip()
+        length = int(headers.get("content-length", 0))
+    except ValueError:
+        raise HTTPError(HTTPStatus.BAD_REQUEST, "Solicitud HTTP mal formada")
+    if "chunked" in headers.get("transfer-encoding", ""):
+        raise HTTPError(HTTPStatus.NOT_IMPLEMENTED, "El cuerpo debe enviarse con Content-Length")
+    if not 0 <= length <= MAX_BODY_BYTES:
+        raise HTTPError(HTTPStatus.REQUEST_ENTITY_TOO_LARGE, "Cuerpo demasiado grande")
+    body = await reader.readexactly(length) if length else b""
+    return method, target, headers, body
+
+
+def _response_head(status: HTTPStatus, content_type: str, keep_alive: bool,
+                   extra_headers: Optional[Dict[str, str]] = None) -> bytes:
+    status = HTTPStatus(status)
+    headers = {"Content-Type": content_type, "Connection": "keep-alive" if keep_alive else "close"}
+    headers.update(extra_headers or {})
+    lines = [f"HTTP/1.1 {status.value} {status.phrase}"]
+    lines += [f"{name}: {value}" for name, value in headers.items()]
+    return ("\r\n".join(lines) + "\r\n\r\n").encode("latin-1")
+
+
+async def _send_json(writer: asyncio.StreamWriter, status: HTTPStatus, payload: Dict, keep_alive: bool):
+    body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+    writer.write(_response_head(status, "application/json; charset=utf-8", keep_alive,
+                                {"Content-Length": str(len(body))}) + body)
+    await writer.drain()
+
+
+def _parse_json(body: bytes) -> Dict:
+    if not body:
+        return {}
+    try:
+        params = json.loads(body)
+    except (UnicodeDecodeError, json.JSONDecodeError):
+        raise ValueError("El cuerpo no es JSON válido")
+    if not isinstance(params, dict):
+        raise ValueError("El cuerpo debe ser un objeto JSON")
+    return params
+
+
+def _int_param(params: Dict, name: str, default: int, minimum: int, maximum: int) -> int:
+    value = params.get(name, default)
+    if isinstance(value, bool) or not isinstance(value, int):
+        raise ValueError(f"'{name}' debe ser un entero")
+    if not minimum <= value <= maximum:
+        raise ValueError(f"'{name}' debe estar entre {minimum} y {maximum}")
+    return value
+
+
+def _thresholds_param(params: Dict) -> Tuple[int, int]:
+    value = params.get("umbrales", DEFAULT_THRESHOLDS)
+    if (not isinstance(value, (list, tuple)) or len(value) != 2
+            or not all(isinstance(v, int) and not isinstance(v, bool) for v in value)):
+        raise ValueError("'umbrales' debe ser una lista de dos enteros")
+    return tuple(value)
+
+
+def _seed_param(params: Dict) -> Optional[int]:
+    seed = params.get("semilla")
+    if seed is not None and (isinstance(seed, bool) or not isinstance(seed, int) or seed < 0):
+        raise ValueError("'semilla' debe ser un entero no negativo")
+    return seed
+
+
+def serve(host: str = DEFAULT_HOST, port: int = DEFAULT_PORT, workers: Optional[int] = None,
+          coalesce_window: float = DEFAULT_COALESCE_WINDOW):
+    """Ejecuta el servicio hasta que se interrumpe con Ctrl+C."""
+    service = SimulationService(host, port, workers, coalesce_window)
+    with suppress(KeyboardInterrupt):
+        asyncio.run(service.serve_forever())
@@ -0,0 +1,820 @@
+"""
+Núcleo del simulador de riesgos: generación, cálculo de prioridad,
+almacenamiento columnar y estadísticas.
+
+Este módulo no depende de la interfaz gráfica, por lo que puede usarse
+en servidores sin display y desde la línea de comandos.
+"""
+import copy
+import heapq
+import os
+from collections import Counter
+from collections.abc import Mapping
+from concurrent.futures import Executor, ProcessPoolExecutor
+from contextlib import nullcontext
+from enum import IntEnum
+from typing import TYPE_CHECKING, Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from src.catalog import DEFAULT_CATALOG, PRIORITY_CATEGORIES, RiskCatalog, RiskTables  # noqa: F401
+from src.instrumentation import NULL_INSTRUMENTATION, Instrumentation
+
+if TYPE_CHECKING:
+    from src.adaptive import AdaptiveResult
+    from src.analytic import AnalyticRiskModel
+    from src.sensitivity import SensitivityResult
+    from src.timeline import TimelineModel
+
+# Umbrales por defecto (bajo, alto) para categorizar la prioridad
+DEFAULT_THRESHOLDS = (30, 70)
+
+# Rango de probabilidad e impacto: de 1 a PRIORITY_GRID_SIZE
+PRIORITY_GRID_SIZE = 10
+
+# Prioridad máxima posible (10 × 10)
+MAX_PRIORITY = PRIORITY_GRID_SIZE * PRIORITY_GRID_SIZE
+
+# Riesgos más críticos que conserva RiskStatistics
+DEFAULT_TOP_K = 10
+
+# Sprints simulados con cada flujo aleatorio independiente en run_monte_carlo
+SPRINTS_PER_STREAM = 1024
+
+# Riesgos generados por bloque al exportar o recorrer simulaciones grandes
+DEFAULT_CHUNK_SIZE = 100_000
+
+# Claves de cada riesgo simulado, en el orden en que se muestran y exportan
+RISK_FIELDS = (
+    "tipo", "descripcion", "probabilidad", "impacto",
+    "valor_prioridad", "categoria_prioridad", "mitigacion"
+)
+
+
+class RiskSimulator:
+    """Clase del simulador de riesgos"""
+    def __init__(self, thresholds: Tuple[int, int] = DEFAULT_THRESHOLDS, rng=None,
+                 catalog: Optional[RiskCatalog] = None,
+                 instrumentation: Optional[Instrumentation] = None):
+        # Catálogo inmutable, compartido entre simuladores en lugar de copiado
+        self.catalog = catalog if catalog is not None else DEFAULT_CATALOG
+        self._tables = self.catalog.tables
+        
+        # Umbrales de categoría: bajo <= low_threshold < medio <= high_threshold < alto
+        low_threshold, high_threshold = thresholds
+        if not 0 <= low_threshold <= high_threshold <= 100:
+            raise ValueError("Los umbrales deben cumplir 0 <= bajo <= alto <= 100")
+        self.thresholds = (low_threshold, high_threshold)
+        self._build_priority_tables()
+        
+        # Flujo aleatorio: semilla, SeedSequence o Generator de NumPy
+        self._rng = np.random.default_rng(rng)
+        
+        # Temporizadores por etapa; la instrumentación por defecto no registra nada
+        self.instrumentation = instrumentation if instrumentation is not None else NULL_INSTRUMENTATION
+    
+    @property
+    def risk_types(self) -> Tuple[str, ...]:
+        return self.catalog.risk_types
+    
+    @property
+    def risk_descriptions(self) -> Mapping:
+        return self.catalog.risk_descriptions
+    
+    @property
+    def mitigation_strategies(self) -> Mapping:
+        return self.catalog.mitigation_strategies
+    
+    @property
+    def rng(self) -> np.random.Generator:
+        return self._rng
+    
+    @property
+    def seed_sequence(self) -> np.random.SeedSequence:
+        """SeedSequence del flujo del simulador, de la que se derivan los flujos hijos."""
+        return self._rng.bit_generator.seed_seq
+    
+    def spawn(self, n: int) -> List["RiskSimulator"]:
+        """
+        Crea `n` simuladores con flujos hijos independientes y deterministas.
+        
+        Los hijos comparten las tablas y umbrales de este simulador.
+        """
+        children = []
+        for child_rng in self._rng.spawn(n):
+            child = copy.copy(self)
+            child._rng = child_rng
+            children.append(child)
+        return children
+    
+    def _build_priority_tables(self):
+        """Precalcula prioridad y categoría para toda la grilla 10×10."""
+        size = PRIORITY_GRID_SIZE + 1
+        self._priority_table = np.zeros(size * size, dtype=np.uint8)
+        self._category_code_table = np.zeros(size * size, dtype=np.uint8)
+        self._priority_lookup = {}
+        
+        for probability in range(1, size):
+            for impact in range(1, size):
+                priority_value = probability * impact
+                priority_category = self._categorize_priority(priority_value)
+                cell = probability * size + impact
+                self._priority_table[cell] = priority_value
+                self._category_code_table[cell] = PRIORITY_CATEGORIES.index(priority_category)
+                self._priority_lookup[probability, impact] = (priority_value, priority_category)
+    
+    def generate_risk(self) -> Dict[str, str]:
+        """Genera un riesgo aleatorio con probabilidad e impacto."""
+        # Consume los mismos cuatro uniformes por riesgo que `_sample_codes`
+        u_type, u_desc, u_prob, u_impact = self._rng.random(4).tolist()
+        type_code = self.catalog.sample_type(u_type)
+        risk_type = self._tables.types[type_code]
+        description = self._tables.descriptions[self.catalog.sample_description(type_code, u_desc)]
+        probability = 1 + int(u_prob * PRIORITY_GRID_SIZE)
+        impact = 1 + int(u_impact * PRIORITY_GRID_SIZE)
+        
+        return {
+            "tipo": risk_type,
+            "descripcion": description,
+            "probabilidad": probability,
+            "impacto": impact
+        }
+    
+    def calculate_priority(self, probability: int, impact: int) -> Tuple[int, str]:
+        """
+        Calcula la prioridad del riesgo (probabilidad × impacto) y la categoriza.
+        """
+        # Ruta rápida: los enteros de 1 a 10 están precalculados
+        try:
+            return self._priority_lookup[probability, impact]
+        except (KeyError, TypeError):
+            pass
+        
+        if not (1 <= probability <= 10) or not (1 <= impact <= 10):
+            raise ValueError("Probabilidad e impacto deben estar entre 1 y 10")
+        
+        priority_value = probability * impact
+        priority_category = self._categorize_priority(priority_value)
+        
+        return priority_value, priority_category
+    
+    def calculate_priorities(self, probabilities, impacts) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Versión vectorizada de `calculate_priority`.
+        
+        Devuelve los valores de prioridad y los códigos de categoría
+        (índices en PRIORITY_CATEGORIES) de cada par probabilidad/impacto.
+        """
+        probabilities = np.asarray(probabilities)
+        impacts = np.asarray(impacts)
+        if probabilities.dtype.kind not in "iu" or impacts.dtype.kind not in "iu":
+            raise TypeError("Probabilidad e impacto deben ser enteros")
+        if (probabilities.size and (probabilities.min() < 1 or probabilities.max() > 10)) or \
+                (impacts.size and (impacts.min() < 1 or impacts.max() > 10)):
+            raise ValueError("Probabilidad e impacto deben estar entre 1 y 10")
+        
+        return self._lookup_priorities(probabilities, impacts)
+    
+    def _lookup_priorities(self, probabilities: np.ndarray,
+                           impacts: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Consulta las tablas precalculadas sin validar el rango."""
+        cell = probabilities * (PRIORITY_GRID_SIZE + 1) + impacts
+        return self._priority_table[cell], self._category_code_table[cell]
+    
+    def _categorize_priority(self, priority_value: int) -> str:
+        """Categoriza la prioridad en bajo, medio o alto."""
+        low_threshold, high_threshold = self.thresholds
+        if priority_value <= low_threshold:
+            return "bajo"
+        elif priority_value <= high_threshold:
+            return "medio"
+        else:
+            return "alto"
+    
+    def suggest_mitigation(self, priority_category: str) -> str:
+        """Sugiere una estrategia de mitigación basada en la categoría de prioridad."""
+        category_code = PRIORITY_CATEGORIES.index(priority_category)
+        return self._tables.mitigations[self.catalog.sample_mitigation(category_code, self._rng.random())]
+    
+    def run_sprint_simulation(self, num_risks: int = 5) -> List[Dict]:
+        """Ejecuta una simulación completa de un sprint con riesgos."""
+        with self.instrumentation.stage("sprint_escalar", num_risks):
+            sprint_risks = self._run_scalar_risks(num_risks)
+        self.instrumentation.count("riesgos", num_risks)
+        return sprint_risks
+    
+    def _run_scalar_risks(self, num_risks: int) -> List[Dict]:
+        sprint_risks = []
+        
+        for _ in range(num_risks):
+            risk = self.generate_risk()
+            priority_value, priority_category = self.calculate_priority(
+                risk["probabilidad"], 
+                risk["impacto"]
+            )
+            mitigation = self.suggest_mitigation(priority_category)
+            
+            risk_result = {
+                **risk,
+                "valor_prioridad": priority_value,
+                "categoria_prioridad": priority_category,
+                "mitigacion": mitigation
+            }
+            
+            sprint_risks.append(risk_result)
+        
+        return sprint_risks
+    
+    def analytic(self, probability_weights=None, impact_weights=None) -> "AnalyticRiskModel":
+        """
+        Modelo analítico exacto de este simulador (ver src.analytic).
+        
+        Los pesos opcionales (10 valores para 1..10) reemplazan la
+        distribución uniforme de probabilidad e impacto.
+        """
+        from src.analytic import AnalyticRiskModel
+        return AnalyticRiskModel(self, probability_weights, impact_weights)
+    
+    def timelines(self, **parameters) -> "TimelineModel":
+        """
+        Modelo multi-sprint con riesgos persistentes (ver src.timeline).
+        
+        Los parámetros se pasan tal cual a TimelineModel.
+        """
+        from src.timeline import TimelineModel
+        return TimelineModel(self, **parameters)
+    
+    def sensitivity_sweep(self, low_thresholds, high_thresholds, risk_counts=(5,),
+                          num_sprints: Optional[int] = None, seed=None) -> "SensitivityResult":
+        """
+        Barrido de umbrales y cantidades de riesgos sobre una muestra
+        compartida de sprints (ver src.sensitivity).
+        """
+        from src.sensitivity import DEFAULT_SWEEP_SPRINTS, run_sweep
+        return run_sweep(self, low_thresholds, high_thresholds, risk_counts,
+                         num_sprints or DEFAULT_SWEEP_SPRINTS, seed)
+    
+    def run_adaptive(self, num_risks: int = 5, **parameters) -> "AdaptiveResult":
+        """
+        Monte Carlo que se detiene al alcanzar la precisión pedida o el
+        tiempo disponible (ver src.adaptive).
+        """
+        from src.adaptive import run_adaptive
+        return run_adaptive(self, num_risks, **parameters)
+    
+    def _sample_codes(self, rng: np.random.Generator, num_risks: int) -> Tuple[np.ndarray, ...]:
+        """
+        Muestrea `num_risks` riesgos como códigos enteros.
+        
+        Devuelve (tipo, descripción, probabilidad, impacto, prioridad,
+        categoría, mitigación); tipo, descripción y mitigación son índices
+        en las tablas planas y la categoría indexa PRIORITY_CATEGORIES.
+        
+        Cada riesgo consume cinco uniformes consecutivos del flujo (tipo,
+        descripción, probabilidad, impacto y mitigación), en el mismo
+        orden que `generate_risk` seguido de `suggest_mitigation`; así la
+        ruta escalar y la vectorizada dan resultados idénticos con la
+        misma semilla.
+        """
+        if num_risks < 0:
+            raise ValueError("El número de riesgos no puede ser negativo")
+        
+        stage = self.instrumentation.stage
+        with stage("muestreo", num_risks):
+            u_type, u_desc, u_prob, u_impact, u_mitigation = rng.random((num_risks, 5)).T
+            type_idx = self.catalog.sample_types(u_type)
+            desc_idx = self.catalog.sample_descriptions(type_idx, u_desc)
+            probability = 1 + (u_prob * PRIORITY_GRID_SIZE).astype(np.intp)
+            impact = 1 + (u_impact * PRIORITY_GRID_SIZE).astype(np.intp)
+        
+        with stage("prioridad", num_risks):
+            priority, category_idx = self._lookup_priorities(probability, impact)
+        with stage("mitigacion", num_risks):
+            mitigation_idx = self.catalog.sample_mitigations(category_idx, u_mitigation)
+        
+        return type_idx, desc_idx, probability, impact, priority, category_idx, mitigation_idx
+    
+    def run_sprint_simulation_batch(self, num_risks: int = 5) -> "RiskBatch":
+        """
+        Ejecuta la simulación de un sprint de forma vectorizada.
+        
+        Devuelve un RiskBatch cuyas filas se comportan como los riesgos
+        de `run_sprint_simulation`.
+        """
+        batch = self._make_batch(self._sample_codes(self._rng, num_risks))
+        self.instrumentation.count("riesgos", num_risks)
+        return batch
+    
+    def iter_risk_batches(self, total_risks: int,
+                          chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator["RiskBatch"]:
+        """Genera `total_risks` riesgos en bloques de como mucho `chunk_size`."""
+        if total_risks < 0:
+            raise ValueError("El número de riesgos no puede ser negativo")
+        if chunk_size <= 0:
+            raise ValueError("El tamaño de bloque debe ser positivo")
+        
+        for start in range(0, total_risks, chunk_size):
+            yield self.run_sprint_simulation_batch(min(chunk_size, total_risks - start))
+    
+    def _make_batch(self, codes: Tuple[np.ndarray, ...]) -> "RiskBatch":
+        """Empaqueta los códigos de `_sample_codes` en un RiskBatch."""
+        (type_idx, desc_idx, probability, impact,
+         priority, category_idx, mitigation_idx) = codes
+        with self.instrumentation.stage("ensamblado", len(type_idx)):
+            return RiskBatch(self._tables, type_idx, desc_idx, probability, impact,
+                             priority, category_idx, mitigation_idx)
+    
+    def _simulate_sprint_aggregates(self, rng: np.random.Generator, num_sprints: int,
+                                    num_risks: int) -> "SprintAggregates":
+        """Simula `num_sprints` sprints consecutivos con un mismo flujo y los resume."""
+        codes = self._sample_codes(rng, num_sprints * num_risks)
+        priority = codes[4].reshape(num_sprints, num_risks)
+        category_idx = codes[5].reshape(num_sprints, num_risks)
+        
+        category_counts = np.stack(
+            [(category_idx == k).sum(axis=1) for k in range(len(PRIORITY_CATEGORIES))],
+            axis=1
+        ).astype(np.int32)
+        
+        return SprintAggregates(
+            category_counts,
+            priority.sum(axis=1, dtype=np.int64),
+            priority.max(axis=1, initial=0).astype(np.uint8),
+            RiskStatistics().update(self._make_batch(codes))
+        )
+    
+    def _run_seed_sequence(self, seed) -> np.random.SeedSequence:
+        """Flujo raíz de una corrida por bloques: el de `seed` o, sin semilla, un hijo nuevo."""
+        if seed is None:
+            return self.seed_sequence.spawn(1)[0]
+        if isinstance(seed, np.random.SeedSequence):
+            return seed
+        return np.random.SeedSequence(seed)
+    
+    def run_monte_carlo(self, num_sprints: int, num_risks: int = 5, seed=None,
+                        max_workers: Optional[int] = None,
+                        executor: Optional[Executor] = None) -> "SprintAggregates":
+        """
+        Simula `num_sprints` sprints de `num_risks` riesgos repartidos entre procesos.
+        
+        Los sprints se agrupan en bloques de SPRINTS_PER_STREAM y el bloque
+        `b` usa el flujo hijo `b` de `seed` (ver `block_simulator`), de
+        modo que el resultado no depende del número de procesos. Sin
+        `seed` se deriva un flujo hijo nuevo del simulador. Con
+        `max_workers=1` todo se ejecuta en el proceso actual. Con
+        `executor` se reutiliza ese pool de procesos en lugar de crear uno.
+        """
+        if num_sprints < 0 or num_risks < 0:
+            raise ValueError("El número de sprints y de riesgos no puede ser negativo")
+        
+        seed_seq = self._run_seed_sequence(seed)
+        num_blocks = -(-num_sprints // SPRINTS_PER_STREAM)
+        
+        if max_workers is None:
+            max_workers = os.cpu_count() or 1
+        max_workers = max(1, min(max_workers, num_blocks))
+        
+        # Cada tarea agrupa varios bloques para amortizar el envío a los procesos
+        blocks_per_task = max(1, -(-num_blocks // (max_workers * 4)))
+        tasks = [
+            (block, min(block + blocks_per_task, num_blocks))
+            for block in range(0, num_blocks, blocks_per_task)
+        ]
+        
+        # En los procesos trabajadores no se instrumenta: se mide la ejecución completa
+        with self.instrumentation.stage("montecarlo", num_sprints * num_risks):
+            if executor is None and max_workers == 1:
+                parts = [
+                    _simulate_block_range(self, seed_seq, first, last, num_sprints, num_risks)
+                    for first, last in tasks
+                ]
+            else:
+                # Un pool propio se crea y se cierra aquí; el recibido se reutiliza
+                pool = (ProcessPoolExecutor(max_workers=max_workers) if executor is None
+                        else nullcontext(executor))
+                with pool as pool_executor:
+                    futures = [
+                        pool_executor.submit(_simulate_block_range, self, seed_seq,
+                                             first, last, num_sprints, num_risks)
+                        for first, last in tasks
+                    ]
+                    parts = [future.result() for future in futures]
+            result = SprintAggregates.concatenate(parts)
+        self.instrumentation.count("riesgos", num_sprints * num_risks)
+        return result
+
+
+class PriorityCategory(IntEnum):
+    """Código numérico de cada categoría de prioridad."""
+    BAJO = 0
+    MEDIO = 1
+    ALTO = 2
+    
+    @property
+    def label(self) -> str:
+        return PRIORITY_CATEGORIES[self]
+
+
+class RiskRecord(Mapping):
+    """Vista perezosa de una fila de RiskBatch con la interfaz de un riesgo en dict."""
+    
+    __slots__ = ("_batch", "_index")
+    
+    def __init__(self, batch: "RiskBatch", index: int):
+        self._batch = batch
+        self._index = index
+    
+    def __getitem__(self, key: str):
+        batch, i = self._batch, self._index
+        if key == "tipo":
+            return batch.tables.types[batch.type_code[i]]
+        if key == "descripcion":
+            return batch.tables.descriptions[batch.description_code[i]]
+        if key == "probabilidad":
+            return int(batch.probability[i])
+        if key == "impacto":
+            return int(batch.impact[i])
+        if key == "valor_prioridad":
+            return int(batch.priority[i])
+        if key == "categoria_prioridad":
+            return PRIORITY_CATEGORIES[batch.category_code[i]]
+        if key == "mitigacion":
+            return batch.tables.mitigations[batch.mitigation_code[i]]
+        raise KeyError(key)
+    
+    def __iter__(self):
+        return iter(RISK_FIELDS)
+    
+    def __len__(self) -> int:
+        return len(RISK_FIELDS)
+    
+    def __repr__(self) -> str:
+        return f"RiskRecord({dict(self)!r})"
+
+
+class RiskBatch:
+    """
+    Resultados de simulación almacenados por columnas.
+    
+    Tipo, descripción y mitigación se guardan como códigos en las tablas
+    de `tables`; probabilidad, impacto y prioridad como uint8 y la
+    categoría como código de PriorityCategory. Indexar con un entero
+    devuelve un RiskRecord; con un slice o un array de índices, otro
+    RiskBatch.
+    """
+    
+    def __init__(self, tables: RiskTables, type_code, description_code, probability,
+                 impact, priority, category_code, mitigation_code):
+        self.tables = tables
+        self.type_code = np.asarray(type_code, dtype=np.uint16)
+        self.description_code = np.asarray(description_code, dtype=np.uint16)
+        self.probability = np.asarray(probability, dtype=np.uint8)
+        self.impact = np.asarray(impact, dtype=np.uint8)
+        self.priority = np.asarray(priority, dtype=np.uint8)
+        self.category_code = np.asarray(category_code, dtype=np.uint8)
+        self.mitigation_code = np.asarray(mitigation_code, dtype=np.uint16)
+    
+    def __len__(self) -> int:
+        return len(self.priority)
+    
+    def __iter__(self):
+        for i in range(len(self)):
+            yield RiskRecord(self, i)
+    
+    def __getitem__(self, index):
+        if isinstance(index, (int, np.integer)):
+            if index < 0:
+                index += len(self)
+            if not 0 <= index < len(self):
+                raise IndexError("Índice de riesgo fuera de rango")
+            return RiskRecord(self, int(index))
+        return RiskBatch(
+            self.tables, self.type_code[index], self.description_code[index],
+            self.probability[index], self.impact[index], self.priority[index],
+            self.category_code[index], self.mitigation_code[index]
+        )
+    
+    def _columns(self) -> Tuple[np.ndarray, ...]:
+        return (self.type_code, self.description_code, self.probability, self.impact,
+                self.priority, self.category_code, self.mitigation_code)
+    
+    @property
+    def nbytes(self) -> int:
+        """Memoria ocupada por las columnas."""
+        return sum(column.nbytes for column in self._columns())
+    
+    def column(self, field: str) -> np.ndarray:
+        """Devuelve la columna `field` (una clave de RISK_FIELDS) ya decodificada."""
+        if field == "tipo":
+            return self.tables.decode("types", self.type_code)
+        if field == "descripcion":
+            return self.tables.decode("descriptions", self.description_code)
+        if field == "probabilidad":
+            return self.probability
+        if field == "impacto":
+            return self.impact
+        if field == "valor_prioridad":
+            return self.priority
+        if field == "categoria_prioridad":
+            return np.array(PRIORITY_CATEGORIES)[self.category_code]
+        if field == "mitigacion":
+            return self.tables.decode("mitigations", self.mitigation_code)
+        raise KeyError(field)
+    
+    def column_list(self, field: str) -> list:
+        """Como `column`, pero devuelve una lista de objetos de Python."""
+        if field == "tipo":
+            return list(map(self.tables.types.__getitem__, self.type_code.tolist()))
+        if field == "descripcion":
+            return list(map(self.tables.descriptions.__getitem__, self.description_code.tolist()))
+        if field == "categoria_prioridad":
+            return list(map(PRIORITY_CATEGORIES.__getitem__, self.category_code.tolist()))
+        if field == "mitigacion":
+            return list(map(self.tables.mitigations.__getitem__, self.mitigation_code.tolist()))
+        return self.column(field).tolist()
+    
+    def to_records(self) -> List[Dict]:
+        """Materializa todas las filas como diccionarios."""
+        return [dict(record) for record in self]
+    
+    @staticmethod
+    def from_records(tables: RiskTables, risks: List[Dict]) -> "RiskBatch":
+        """Construye un RiskBatch a partir de riesgos en forma de diccionario."""
+        codes = [tables.encode(risk) for risk in risks]
+        return RiskBatch(
+            tables,
+            [c[0] for c in codes],
+            [c[1] for c in codes],
+            [risk["probabilidad"] for risk in risks],
+            [risk["impacto"] for risk in risks],
+            [risk["valor_prioridad"] for risk in risks],
+            [c[2] for c in codes],
+            [c[3] for c in codes]
+        )
+    
+    @staticmethod
+    def concatenate(batches: List["RiskBatch"]) -> "RiskBatch":
+        """Une varios RiskBatch que comparten las mismas tablas."""
+        if not batches:
+            raise ValueError("Se necesita al menos un RiskBatch para concatenar")
+        columns = zip(*(batch._columns() for batch in batches))
+        return RiskBatch(batches[0].tables, *(np.concatenate(c) for c in columns))
+
+
+class RiskStatistics:
+    """
+    Estadísticas acumulativas de riesgos simulados en una sola pasada.
+    
+    Guarda conteos por categoría, tipo y descripción, el histograma
+    completo de prioridades (1..100) y los `top_k` riesgos más críticos.
+    Media, varianza y máximo se derivan del histograma, por lo que dos
+    acumuladores combinados con `merge` dan exactamente el mismo
+    resultado que uno solo alimentado con todos los riesgos.
+    """
+    
+    def __init__(self, top_k: int = DEFAULT_TOP_K):
+        if top_k < 0:
+            raise ValueError("top_k no puede ser negativo")
+        self.top_k = top_k
+        self.histogram = np.zeros(MAX_PRIORITY + 1, dtype=np.int64)
+        self.category_counts = np.zeros(len(PRIORITY_CATEGORIES), dtype=np.int64)
+        self.type_counts = Counter()
+        self.description_counts = Counter()
+        # Montículo de (prioridad, -orden de llegada, riesgo): ante empates gana el primero
+        self._top = []
+    
+    @staticmethod
+    def from_risks(risks, top_k: int = DEFAULT_TOP_K) -> "RiskStatistics":
+        """Crea un acumulador con los riesgos dados."""
+        return RiskStatistics(top_k).update(risks)
+    
+    @property
+    def count(self) -> int:
+        return int(self.histogram.sum())
+    
+    @property
+    def mean(self) -> float:
+        count = self.count
+        return float(self._moment(1) / count) if count else 0.0
+    
+    @property
+    def variance(self) -> float:
+        """Varianza poblacional de la prioridad."""
+        count = self.count
+        if not count:
+            return 0.0
+        # Aritmética entera exacta: (n·Σv² − (Σv)²) / n²
+        total = self._moment(1)
+        return float((count * self._moment(2) - total * total) / (count * count))
+    
+    @property
+    def std(self) -> float:
+        return self.variance ** 0.5
+    
+    @property
+    def max_priority(self) -> int:
+        nonzero = np.flatnonzero(self.histogram)
+        return int(nonzero[-1]) if len(nonzero) else 0
+    
+    @property
+    def top_risks(self) -> List[Dict]:
+        """Los riesgos más críticos, de mayor a menor prioridad."""
+        return [risk for _, _, risk in sorted(self._top, reverse=True)]
+    
+    @property
+    def most_critical(self) -> Optional[Dict]:
+        top = self.top_risks
+        return top[0] if top else None
+    
+    def category_distribution(self) -> Dict[str, float]:
+        """Proporción de riesgos en cada categoría."""
+        count = self.count
+        return {
+            category: (int(self.category_counts[k]) / count if count else 0.0)
+            for k, category in enumerate(PRIORITY_CATEGORIES)
+        }
+    
+    def update(self, risks) -> "RiskStatistics":
+        """Agrega un RiskBatch (vectorizado) o cualquier iterable de riesgos en dict."""
+        if isinstance(risks, RiskBatch):
+            self._update_batch(risks)
+        else:
+            for risk in risks:
+                self.add(risk)
+        return self
+    
+    def add(self, risk: Mapping) -> "RiskStatistics":
+        """Agrega un único riesgo."""
+        seq = self.count
+        priority = risk["valor_prioridad"]
+        self.histogram[priority] += 1
+        self.category_counts[PRIORITY_CATEGORIES.index(risk["categoria_prioridad"])] += 1
+        self.type_counts[risk["tipo"]] += 1
+        self.description_counts[risk["descripcion"]] += 1
+        self._push_top(priority, seq, risk)
+        return self
+    
+    def merge(self, other: "RiskStatistics") -> "RiskStatistics":
+        """Incorpora otro acumulador como si sus riesgos llegaran después de los propios."""
+        offset = self.count
+        self.histogram += other.histogram
+        self.category_counts += other.category_counts
+        self.type_counts.update(other.type_counts)
+        self.description_counts.update(other.description_counts)
+        for priority, neg_seq, risk in other._top:
+            self._push_top(priority, offset - neg_seq, risk)
+        return self
+    
+    def to_dict(self) -> Dict:
+        """Resumen serializable a JSON."""
+        return {
+            "total": self.count,
+            "categorias": {c: int(n) for c, n in zip(PRIORITY_CATEGORIES, self.category_counts)},
+            "tipos": dict(self.type_counts),
+            "descripciones": dict(self.description_counts),
+            "prioridad_promedio": self.mean,
+            "varianza_prioridad": self.variance,
+            "prioridad_maxima": self.max_priority,
+            "histograma": self.histogram[1:].tolist(),
+            "riesgos_criticos": self.top_risks
+        }
+    
+    @staticmethod
+    def from_dict(data: Mapping, top_k: int = DEFAULT_TOP_K) -> "RiskStatistics":
+        """Reconstruye un acumulador a partir de la salida de `to_dict`."""
+        stats = RiskStatistics(top_k)
+        stats.histogram[1:] = data["histograma"]
+        stats.category_counts[:] = [data["categorias"][c] for c in PRIORITY_CATEGORIES]
+        stats.type_counts.update(data["tipos"])
+        stats.description_counts.update(data["descripciones"])
+        # El orden de la lista conserva el desempate por orden de llegada
+        for seq, risk in enumerate(data["riesgos_criticos"]):
+            stats._push_top(risk["valor_prioridad"], seq, risk)
+        return stats
+    
+    def _moment(self, order: int) -> int:
+        values = np.arange(MAX_PRIORITY + 1, dtype=np.int64) ** order
+        return int(values @ self.histogram)
+    
+    def _push_top(self, priority: int, seq: int, risk: Mapping):
+        if self.top_k == 0:
+            return
+        entry = (int(priority), -seq, dict(risk))
+        if len(self._top) < self.top_k:
+            heapq.heappush(self._top, entry)
+        elif entry[:2] > self._top[0][:2]:
+            heapq.heapreplace(self._top, entry)
+    
+    def _update_batch(self, batch: RiskBatch):
+        offset = self.count
+        tables = batch.tables
+        histogram = np.bincount(batch.priority, minlength=MAX_PRIORITY + 1)
+        self.histogram += histogram
+        self.category_counts += np.bincount(batch.category_code, minlength=len(PRIORITY_CATEGORIES))
+        
+        type_counts = np.bincount(batch.type_code, minlength=len(tables.types))
+        for code in np.flatnonzero(type_counts):
+            self.type_counts[tables.types[code]] += int(type_counts[code])
+        desc_counts = np.bincount(batch.description_code, minlength=len(tables.descriptions))
+        for code in np.flatnonzero(desc_counts):
+            self.description_counts[tables.descriptions[code]] += int(desc_counts[code])
+        
+        # Solo los top_k del bloque pueden entrar al ranking global; el
+        # histograma da la prioridad de corte sin ordenar todo el bloque
+        k = min(self.top_k, len(batch))
+        if k:
+            at_least = np.cumsum(histogram[::-1])
+            threshold = MAX_PRIORITY - int(np.searchsorted(at_least, k))
+            candidates = np.flatnonzero(batch.priority >= threshold)
+            order = candidates[np.lexsort((candidates, -batch.priority[candidates].astype(np.int16)))][:k]
+            for index in order:
+                self._push_top(batch.priority[index], offset + int(index), batch[int(index)])
+
+
+class SprintAggregates:
+    """Agregados compactos por sprint de una simulación Monte Carlo."""
+    
+    def __init__(self, category_counts: np.ndarray, priority_sum: np.ndarray,
+                 priority_max: np.ndarray, statistics: Optional["RiskStatistics"] = None):
+        # category_counts tiene una columna por categoría en el orden de PRIORITY_CATEGORIES
+        self.category_counts = category_counts
+        self.priority_sum = priority_sum
+        self.priority_max = priority_max
+        # Estadísticas de todos los riesgos de estos sprints
+        self.statistics = statistics if statistics is not None else RiskStatistics()
+    
+    def __len__(self) -> int:
+        return len(self.priority_sum)
+    
+    @property
+    def risks_per_sprint(self) -> np.ndarray:
+        """Cantidad de riesgos simulados en cada sprint."""
+        return self.category_counts.sum(axis=1)
+    
+    def mean_priority(self) -> np.ndarray:
+        """Prioridad promedio de cada sprint."""
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return self.priority_sum / self.risks_per_sprint
+    
+    def category_distribution(self) -> Dict[str, float]:
+        """Proporción global de riesgos en cada categoría."""
+        totals = self.category_counts.sum(axis=0)
+        total = totals.sum()
+        return {
+            category: (float(totals[k] / total) if total else 0.0)
+            for k, category in enumerate(PRIORITY_CATEGORIES)
+        }
+    
+    def high_risk_summary(self) -> Dict[str, float]:
+        """Cantidad de sprints, proporción con algún riesgo alto y riesgos altos por sprint."""
+        high_counts = self.category_counts[:, PRIORITY_CATEGORIES.index("alto")]
+        return {
+            "sprints": len(self),
+            "sprints_con_riesgo_alto": float((high_counts > 0).mean()) if len(self) else 0.0,
+            "riesgos_altos_por_sprint": float(high_counts.mean()) if len(self) else 0.0
+        }
+    
+    @staticmethod
+    def concatenate(parts: List["SprintAggregates"]) -> "SprintAggregates":
+        """Une varios agregados en el orden dado."""
+        if not parts:
+            return SprintAggregates(
+                np.zeros((0, len(PRIORITY_CATEGORIES)), dtype=np.int32),
+                np.zeros(0, dtype=np.int64),
+                np.zeros(0, dtype=np.uint8)
+            )
+        statistics = RiskStatistics()
+        for part in parts:
+            statistics.merge(part.statistics)
+        return SprintAggregates(
+            np.concatenate([p.category_counts for p in parts]),
+            np.concatenate([p.priority_sum for p in parts]),
+            np.concatenate([p.priority_max for p in parts]),
+            statistics
+        )
+
+
+def block_seed_sequence(seed_seq: np.random.SeedSequence, block: int) -> np.random.SeedSequence:
+    """
+    Flujo hijo del bloque `block` de run_monte_carlo; equivale a seed_seq.spawn(...)[block].
+    
+    Simular los sprints del bloque en orden con un RiskSimulator creado
+    con este flujo reproduce exactamente los riesgos de run_monte_carlo.
+    """
+    return np.random.SeedSequence(
+        seed_seq.entropy, spawn_key=seed_seq.spawn_key + (block,),
+        pool_size=seed_seq.pool_size
+    )
+
+
+def _simulate_block_range(simulator: RiskSimulator, seed_seq: np.random.SeedSequence,
+                          first_block: int, last_block: int, num_sprints: int,
+                          num_risks: int) -> SprintAggregates:
+    """Simula los bloques [first_block, last_block) dentro de un proceso trabajador."""
+    parts = []
+    for block in range(first_block, last_block):
+        start = block * SPRINTS_PER_STREAM
+        count = min(SPRINTS_PER_STREAM, num_sprints - start)
+        rng = np.random.default_rng(block_seed_sequence(seed_seq, block))
+        parts.append(simulator._simulate_sprint_aggregates(rng, count, num_risks))
+    return SprintAggregates.concatenate(parts)
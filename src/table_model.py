@@ -0,0 +1,83 @@
+"""Modelo de filtro y orden de la tabla de resultados, independiente de Tk."""
+from typing import Optional, Tuple
+
+import numpy as np
+
+from src.simulator import PRIORITY_CATEGORIES, RISK_FIELDS, RiskBatch
+
+
+class RiskTableModel:
+    """Filtro y orden de un RiskBatch para recorrerlo por ventanas de filas."""
+    
+    def __init__(self, batch: Optional[RiskBatch] = None):
+        self.batch = None
+        self.category_filter = None
+        self.sort_field = None
+        self.descending = False
+        self._order = np.zeros(0, dtype=np.intp)
+        self.set_batch(batch)
+    
+    def __len__(self) -> int:
+        return len(self._order)
+    
+    def set_batch(self, batch: Optional[RiskBatch]):
+        """Cambia los datos de respaldo conservando filtro y orden."""
+        self.batch = batch
+        self._update()
+    
+    def set_filter(self, category: Optional[str]):
+        """Muestra solo la categoría indicada, o todas si es None."""
+        if category is not None and category not in PRIORITY_CATEGORIES:
+            raise ValueError(f"Categoría desconocida: {category}")
+        self.category_filter = category
+        self._update()
+    
+    def sort_by(self, field: Optional[str], descending: bool = False):
+        """Ordena de forma estable por un campo de RISK_FIELDS, o por orden original si es None."""
+        if field is not None and field not in RISK_FIELDS:
+            raise KeyError(field)
+        self.sort_field = field
+        self.descending = descending
+        self._update()
+    
+    def window(self, start: int, count: int) -> Optional[RiskBatch]:
+        """Filas visibles desde la posición `start`, como RiskBatch."""
+        if self.batch is None:
+            return None
+        return self.batch[self._order[start:start + count]]
+    
+    def _update(self):
+        if self.batch is None:
+            self._order = np.zeros(0, dtype=np.intp)
+            return
+        
+        if self.category_filter is None:
+            indices = np.arange(len(self.batch))
+        else:
+            code = PRIORITY_CATEGORIES.index(self.category_filter)
+            indices = np.flatnonzero(self.batch.category_code == code)
+        
+        if self.sort_field is not None:
+            keys = self._sort_keys(self.sort_field)[indices].astype(np.int64)
+            indices = indices[np.argsort(-keys if self.descending else keys, kind="stable")]
+        self._order = indices
+    
+    def _sort_keys(self, field: str) -> np.ndarray:
+        """Clave numérica de orden; los textos se ordenan alfabéticamente por su código."""
+        tables = self.batch.tables
+        if field == "tipo":
+            return _text_ranks(tables.types)[self.batch.type_code]
+        if field == "descripcion":
+            return _text_ranks(tables.descriptions)[self.batch.description_code]
+        if field == "mitigacion":
+            return _text_ranks(tables.mitigations)[self.batch.mitigation_code]
+        if field == "categoria_prioridad":
+            return self.batch.category_code
+        return self.batch.column(field)
+
+
+def _text_ranks(texts: Tuple[str, ...]) -> np.ndarray:
+    """Posición alfabética de cada texto de una tabla."""
+    ranks = np.empty(len(texts), dtype=np.int64)
+    ranks[sorted(range(len(texts)), key=texts.__getitem__)] = np.arange(len(texts))
+    return ranks
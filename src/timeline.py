@@ -0,0 +1,229 @@
+"""
+Evolución de los riesgos a lo largo de sprints consecutivos.
+
+A diferencia de `run_monte_carlo`, donde cada sprint es independiente,
+aquí los riesgos siguen abiertos de un sprint al siguiente:
+
+- Cada riesgo abierto sigue abierto en el sprint siguiente con
+  probabilidad `persistence`; si no, se cierra.
+- Mientras está abierto se mitiga: en cada sprint su probabilidad baja un
+  punto con probabilidad `probability_mitigation` y su impacto baja un
+  punto con probabilidad `impact_mitigation` (nunca por debajo de 1).
+- En cada sprint aparecen `new_risks` riesgos nuevos por línea temporal.
+  La probabilidad de los riesgos nuevos está correlacionada: con
+  probabilidad √type_correlation un riesgo toma el shock común de su
+  tipo en ese sprint, y con probabilidad √cross_type_correlation el
+  shock de un tipo es el shock común a todos los tipos. Como dos riesgos
+  comparten el shock solo si ambos lo toman, la correlación entre dos
+  riesgos del mismo tipo es `type_correlation` y entre tipos distintos
+  `type_correlation · cross_type_correlation`. La distribución de cada
+  riesgo sigue siendo uniforme sobre 1..10.
+
+Todas las líneas temporales avanzan juntas como arrays de forma
+(líneas, huecos): el único bucle de Python es sobre los sprints.
+"""
+import math
+from typing import Dict, Optional
+
+import numpy as np
+
+from src.simulator import PRIORITY_CATEGORIES, PRIORITY_GRID_SIZE, RiskSimulator
+
+DEFAULT_PERSISTENCE = 0.6
+DEFAULT_PROBABILITY_MITIGATION = 0.3
+DEFAULT_IMPACT_MITIGATION = 0.1
+
+
+class TimelineResult:
+    """
+    Agregados por línea temporal y sprint de `TimelineModel.simulate`.
+    
+    Los arrays se indexan [línea, sprint] y, los de conteos por categoría
+    o por tipo, [línea, sprint, código].
+    """
+    
+    def __init__(self, category_counts: np.ndarray, type_counts: np.ndarray,
+                 priority_sum: np.ndarray, priority_max: np.ndarray, new_risks: np.ndarray,
+                 closed_risks: np.ndarray, dropped_risks: np.ndarray):
+        # Riesgos abiertos al final de cada sprint, por categoría y por tipo
+        self.category_counts = category_counts
+        self.type_counts = type_counts
+        self.priority_sum = priority_sum
+        self.priority_max = priority_max
+        # Riesgos que aparecen, se cierran o no entran por falta de capacidad
+        self.new_risks = new_risks
+        self.closed_risks = closed_risks
+        self.dropped_risks = dropped_risks
+    
+    @property
+    def num_timelines(self) -> int:
+        return self.priority_sum.shape[0]
+    
+    @property
+    def num_sprints(self) -> int:
+        return self.priority_sum.shape[1]
+    
+    def open_risks(self) -> np.ndarray:
+        """Riesgos abiertos al final de cada sprint de cada línea."""
+        return self.category_counts.sum(axis=2)
+    
+    def mean_open_by_sprint(self) -> np.ndarray:
+        return self.open_risks().mean(axis=0)
+    
+    def mean_priority_by_sprint(self) -> np.ndarray:
+        """Prioridad promedio de los riesgos abiertos en cada sprint."""
+        open_total = self.open_risks().sum(axis=0)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return self.priority_sum.sum(axis=0) / open_total
+    
+    def high_risk_probability_by_sprint(self) -> np.ndarray:
+        """Proporción de líneas con al menos un riesgo alto abierto en cada sprint."""
+        return (self.category_counts[:, :, PRIORITY_CATEGORIES.index("alto")] > 0).mean(axis=0)
+    
+    def summary(self) -> Dict:
+        """Resumen por sprint, serializable a JSON."""
+        return {
+            "lineas": self.num_timelines,
+            "sprints": self.num_sprints,
+            "riesgos_abiertos": self.mean_open_by_sprint().tolist(),
+            "prioridad_promedio": np.nan_to_num(self.mean_priority_by_sprint()).tolist(),
+            "prob_algun_alto": self.high_risk_probability_by_sprint().tolist(),
+            "riesgos_descartados": int(self.dropped_risks.sum())
+        }
+
+
+class TimelineModel:
+    """Modelo multi-sprint con riesgos persistentes, mitigación y correlación entre tipos."""
+    
+    def __init__(self, simulator: RiskSimulator, persistence: float = DEFAULT_PERSISTENCE,
+                 probability_mitigation: float = DEFAULT_PROBABILITY_MITIGATION,
+                 impact_mitigation: float = DEFAULT_IMPACT_MITIGATION,
+                 type_correlation: float = 0.0, cross_type_correlation: float = 0.0,
+                 max_open_risks: Optional[int] = None):
+        parameters = {
+            "persistencia": persistence,
+            "mitigación de probabilidad": probability_mitigation,
+            "mitigación de impacto": impact_mitigation,
+            "correlación por tipo": type_correlation,
+            "correlación entre tipos": cross_type_correlation
+        }
+        for name, value in parameters.items():
+            if not 0.0 <= value <= 1.0:
+                raise ValueError(f"La {name} debe estar entre 0 y 1")
+        if max_open_risks is not None and max_open_risks < 1:
+            raise ValueError("La capacidad de riesgos abiertos debe ser positiva")
+        
+        self.simulator = simulator
+        self.persistence = persistence
+        self.probability_mitigation = probability_mitigation
+        self.impact_mitigation = impact_mitigation
+        self.type_correlation = type_correlation
+        self.cross_type_correlation = cross_type_correlation
+        self.max_open_risks = max_open_risks
+    
+    def capacity(self, new_risks: int, num_sprints: int) -> int:
+        """
+        Huecos de riesgos abiertos por línea temporal.
+        
+        Por defecto es el doble del número estable de riesgos abiertos
+        (new_risks / (1 - persistence)) más un sprint de margen, y nunca
+        más de los que pueden aparecer en toda la simulación.
+        """
+        if self.max_open_risks is not None:
+            return self.max_open_risks
+        upper_bound = max(1, new_risks * num_sprints)
+        if self.persistence >= 1.0:
+            return upper_bound
+        steady_state = new_risks / (1.0 - self.persistence)
+        return max(1, min(upper_bound, math.ceil(2 * steady_state) + new_risks))
+    
+    def simulate(self, num_timelines: int, num_sprints: int, new_risks: int = 5,
+                 seed=None) -> TimelineResult:
+        """
+        Simula `num_timelines` líneas temporales independientes de
+        `num_sprints` sprints. Sin `seed` se usa un flujo hijo del simulador.
+        """
+        if num_timelines < 0 or num_sprints < 0 or new_risks < 0:
+            raise ValueError("Las cantidades de líneas, sprints y riesgos no pueden ser negativas")
+        rng = np.random.default_rng(self.simulator.seed_sequence.spawn(1)[0] if seed is None else seed)
+        
+        catalog = self.simulator.catalog
+        num_types = len(catalog.risk_types)
+        slots = self.capacity(new_risks, num_sprints)
+        incoming = min(new_risks, slots)
+        rows = np.arange(num_timelines)[:, None]
+        
+        # Estado de los huecos de cada línea temporal
+        active = np.zeros((num_timelines, slots), dtype=bool)
+        type_code = np.zeros((num_timelines, slots), dtype=np.intp)
+        probability = np.ones((num_timelines, slots), dtype=np.intp)
+        impact = np.ones((num_timelines, slots), dtype=np.intp)
+        
+        shape = (num_timelines, num_sprints)
+        category_counts = np.zeros(shape + (len(PRIORITY_CATEGORIES),), dtype=np.int32)
+        type_counts = np.zeros(shape + (num_types,), dtype=np.int32)
+        priority_sum = np.zeros(shape, dtype=np.int64)
+        priority_max = np.zeros(shape, dtype=np.uint8)
+        new_counts = np.zeros(shape, dtype=np.int32)
+        closed_counts = np.zeros(shape, dtype=np.int32)
+        dropped_counts = np.zeros(shape, dtype=np.int32)
+        
+        for sprint in range(num_sprints):
+            # 1. Los riesgos abiertos persisten o se cierran, y se mitigan
+            u_close, u_probability, u_impact = rng.random((3, num_timelines, slots))
+            closed = active & (u_close >= self.persistence)
+            active &= ~closed
+            probability -= active & (u_probability < self.probability_mitigation)
+            impact -= active & (u_impact < self.impact_mitigation)
+            np.maximum(probability, 1, out=probability)
+            np.maximum(impact, 1, out=impact)
+            
+            # 2. Los riesgos nuevos ocupan los primeros huecos libres de cada línea
+            new_type, new_probability, new_impact = self._sample_new_risks(rng, num_timelines, new_risks)
+            free = np.argsort(active, axis=1, kind="stable")[:, :incoming]
+            placed = ~active[rows, free]
+            active[rows, free] = True
+            type_code[rows, free] = np.where(placed, new_type[:, :incoming], type_code[rows, free])
+            probability[rows, free] = np.where(placed, new_probability[:, :incoming],
+                                               probability[rows, free])
+            impact[rows, free] = np.where(placed, new_impact[:, :incoming], impact[rows, free])
+            
+            # 3. Agregados de los riesgos abiertos al final del sprint
+            priority, category = self.simulator._lookup_priorities(probability, impact)
+            priority = np.where(active, priority, 0)
+            category_counts[:, sprint] = _count_codes(category, active, len(PRIORITY_CATEGORIES))
+            type_counts[:, sprint] = _count_codes(type_code, active, num_types)
+            priority_sum[:, sprint] = priority.sum(axis=1)
+            priority_max[:, sprint] = priority.max(axis=1, initial=0)
+            new_counts[:, sprint] = placed.sum(axis=1)
+            closed_counts[:, sprint] = closed.sum(axis=1)
+            dropped_counts[:, sprint] = new_risks - new_counts[:, sprint]
+        
+        return TimelineResult(category_counts, type_counts, priority_sum, priority_max,
+                              new_counts, closed_counts, dropped_counts)
+    
+    def _sample_new_risks(self, rng: np.random.Generator, num_timelines: int, new_risks: int):
+        """Tipo, probabilidad e impacto de los riesgos nuevos de un sprint."""
+        catalog = self.simulator.catalog
+        num_types = len(catalog.risk_types)
+        u_type, u_probability, u_impact, u_shared = rng.random((4, num_timelines, new_risks))
+        new_type = catalog.sample_types(u_type)
+        
+        # Shocks del sprint: uno común y uno por tipo, que a veces es el común
+        sprint_shock = rng.random(num_timelines)[:, None]
+        # Las raíces hacen que la correlación entre dos riesgos sea el parámetro
+        common = rng.random((num_timelines, num_types)) < math.sqrt(self.cross_type_correlation)
+        type_shock = np.where(common, sprint_shock, rng.random((num_timelines, num_types)))
+        shared = np.take_along_axis(type_shock, new_type, axis=1)
+        u_probability = np.where(u_shared < math.sqrt(self.type_correlation), shared, u_probability)
+        
+        new_probability = 1 + (u_probability * PRIORITY_GRID_SIZE).astype(np.intp)
+        new_impact = 1 + (u_impact * PRIORITY_GRID_SIZE).astype(np.intp)
+        return new_type, new_probability, new_impact
+
+
+def _count_codes(codes: np.ndarray, mask: np.ndarray, num_codes: int) -> np.ndarray:
+    """Cuenta por fila los códigos de los huecos activos; devuelve (filas, num_codes)."""
+    rows = np.broadcast_to(np.arange(codes.shape[0])[:, None], codes.shape)
+    flat = (rows * num_codes + codes)[mask]
+    return np.bincount(flat, minlength=codes.shape[0] * num_codes).reshape(-1, num_codes)
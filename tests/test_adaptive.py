@@ -0,0 +1,91 @@
+import json
+
+import numpy as np
+import pytest
+from src.adaptive import AdaptiveResult, confidence_intervals
+from src.cli import main
+from src.simulator import SPRINTS_PER_STREAM, RiskSimulator, RiskStatistics
+
+
+class TestAdaptiveStopping:
+    """Pruebas del Monte Carlo con parada adaptativa."""
+    
+    @pytest.fixture
+    def simulator(self):
+        return RiskSimulator()
+    
+    def test_stops_at_requested_precision(self, simulator):
+        result = simulator.run_adaptive(5, priority_precision=0.3, rate_precision=0.01,
+                                        seed=1, max_workers=1)
+        summary = result.summary()
+        
+        assert isinstance(result, AdaptiveResult)
+        assert result.converged
+        assert summary["semiancho_prioridad"] <= 0.3
+        assert summary["semiancho_categorias"] <= 0.01
+        assert result.saved_sprints == result.max_sprints - result.num_sprints > 0
+        assert summary["riesgos"] == 5 * result.num_sprints
+        # La media exacta con probabilidad e impacto uniformes es 5.5²
+        low, high = result.intervals()["prioridad_promedio"]
+        assert low <= 30.25 <= high
+    
+    def test_batches_grow_until_converged(self, simulator):
+        """Cada lote duplica lo simulado y solo el último cumple la precisión."""
+        result = simulator.run_adaptive(5, priority_precision=0.05, rate_precision=None,
+                                        initial_sprints=SPRINTS_PER_STREAM, seed=2, max_workers=1)
+        sprints = [batch["sprints"] for batch in result.history]
+        widths = [batch["semiancho_prioridad"] for batch in result.history]
+        
+        assert sprints == [SPRINTS_PER_STREAM * 2 ** i for i in range(len(sprints))]
+        assert widths[-1] <= 0.05 < min(widths[:-1])
+    
+    def test_matches_fixed_run_prefix(self, simulator):
+        """Los sprints simulados son los mismos que los de run_monte_carlo con esa semilla."""
+        adaptive = simulator.run_adaptive(4, priority_precision=0.4, seed=9, max_workers=2)
+        fixed = simulator.run_monte_carlo(adaptive.num_sprints, 4, seed=9, max_workers=1)
+        
+        np.testing.assert_array_equal(adaptive.aggregates.category_counts, fixed.category_counts)
+        np.testing.assert_array_equal(adaptive.aggregates.priority_sum, fixed.priority_sum)
+        assert adaptive.statistics.to_dict() == fixed.statistics.to_dict()
+    
+    def test_stops_at_max_sprints(self, simulator):
+        result = simulator.run_adaptive(5, priority_precision=0.001, max_sprints=3000,
+                                        seed=3, max_workers=1)
+        
+        assert (result.reason, result.num_sprints, result.saved_sprints) == ("maximo", 3000, 0)
+        assert not result.converged
+    
+    def test_stops_at_time_budget(self, simulator):
+        result = simulator.run_adaptive(5, priority_precision=1e-6, time_budget=0.2,
+                                        seed=4, max_workers=1)
+        
+        assert result.reason == "tiempo"
+        assert result.seconds < 1.0
+        assert 0 < result.num_sprints < result.max_sprints
+    
+    def test_rare_category_is_not_zero_width(self):
+        """Una categoría que todavía no apareció no da un intervalo de ancho cero."""
+        stats = RiskStatistics()
+        stats.histogram[10] = 1000
+        stats.category_counts[:] = [1000, 0, 0]
+        low, high = confidence_intervals(stats)["alto"]
+        
+        assert 0 < high - low < 0.01
+    
+    def test_invalid_parameters(self, simulator):
+        for parameters in ({"priority_precision": 0}, {"time_budget": -1}, {"growth": 1.0},
+                           {"confidence": 1.0}, {"max_sprints": 0}):
+            with pytest.raises(ValueError):
+                simulator.run_adaptive(5, max_workers=1, **parameters)
+        with pytest.raises(ValueError):
+            simulator.run_adaptive(0, max_workers=1)
+    
+    def test_cli_adaptive(self, capsys):
+        main(["montecarlo", "--adaptativo", "--precision", "0.3", "--semilla", "5",
+              "--procesos", "1", "--json"])
+        output = json.loads(capsys.readouterr().out)
+        
+        assert output["motivo"] == "precision"
+        assert output["semiancho_prioridad"] <= 0.3
+        assert output["sprints"] + output["sprints_ahorrados"] == 10_000_000
+        assert output["total"] == 5 * output["sprints"]
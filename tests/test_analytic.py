@@ -0,0 +1,93 @@
+import numpy as np
+import pytest
+from src.simulator import RiskSimulator
+
+
+class TestAnalyticModel:
+    """Pruebas del modelo analítico exacto."""
+    
+    @pytest.fixture
+    def model(self):
+        return RiskSimulator().analytic()
+    
+    def test_grid_probabilities(self, model):
+        """Las probabilidades coinciden con contar las 100 celdas de la grilla."""
+        probabilities = model.category_probabilities()
+        
+        assert probabilities["bajo"] == pytest.approx(0.61)
+        assert probabilities["medio"] == pytest.approx(0.31)
+        assert probabilities["alto"] == pytest.approx(0.08)
+        assert model.mean == pytest.approx(30.25)
+        assert model.priority_pmf.sum() == pytest.approx(1.0)
+        assert model.priority_pmf[36] == pytest.approx(3 / 100)  # 4×9, 9×4, 6×6
+    
+    def test_uniform_tables(self, model):
+        """Tipos y descripciones son equiprobables; las mitigaciones dependen de la categoría."""
+        assert all(p == pytest.approx(0.2) for p in model.type_probabilities().values())
+        assert all(p == pytest.approx(0.04) for p in model.description_probabilities().values())
+        assert model.mitigation_probabilities()["Acción inmediata requerida"] == pytest.approx(0.08 / 5)
+    
+    def test_sprint_counts(self, model):
+        """Conteos esperados y colas binomiales de un sprint."""
+        assert model.expected_counts(10)["alto"] == pytest.approx(0.8)
+        assert model.prob_at_least("alto", 1, 10) == pytest.approx(1 - 0.92 ** 10)
+        assert model.prob_at_least("alto", 0, 10) == 1.0
+        assert model.prob_at_least("alto", 11, 10) == 0.0
+        assert model.count_distribution("medio", 50).sum() == pytest.approx(1.0)
+        
+        low, high = model.count_interval("bajo", 100, 0.95)
+        assert low < 61 < high
+    
+    def test_priority_sum_and_max(self, model):
+        """La suma convolucionada y el máximo del sprint son consistentes."""
+        pmf = model.priority_sum_pmf(5)
+        values = np.arange(len(pmf))
+        
+        assert pmf.sum() == pytest.approx(1.0)
+        assert values @ pmf == pytest.approx(5 * model.mean)
+        assert model.prob_max_at_least(1, 5) == pytest.approx(1.0)
+        assert model.prob_max_at_least(101, 5) == pytest.approx(0.0)
+        
+        exact = model.mean_priority_interval(20)
+        approximate = model.mean_priority_interval(10_000)
+        assert exact[0] < model.mean < exact[1]
+        assert approximate[1] - approximate[0] < exact[1] - exact[0]
+    
+    def test_fft_sum_matches_direct_convolution(self, model):
+        """La suma por FFT coincide con convolucionar riesgo por riesgo."""
+        direct = np.ones(1)
+        for _ in range(37):
+            direct = np.convolve(direct, model.priority_pmf)
+        
+        np.testing.assert_allclose(model.priority_sum_pmf(37), direct, atol=1e-15)
+    
+    def test_agrees_with_monte_carlo(self, model):
+        """Las predicciones analíticas coinciden con una simulación grande."""
+        result = RiskSimulator().run_monte_carlo(20_000, 10, seed=1, max_workers=1)
+        high = result.category_counts[:, 2]
+        
+        assert np.mean(high >= 1) == pytest.approx(model.prob_at_least("alto", 1, 10), abs=0.015)
+        assert np.mean(high >= 2) == pytest.approx(model.prob_at_least("alto", 2, 10), abs=0.015)
+        assert np.mean(result.priority_max >= 90) == pytest.approx(model.prob_max_at_least(90, 10), abs=0.015)
+    
+    def test_custom_distributions_and_thresholds(self):
+        """Se admiten pesos no uniformes y umbrales propios."""
+        weights = np.zeros(10)
+        weights[9] = 1.0  # siempre 10
+        model = RiskSimulator(thresholds=(20, 50)).analytic(probability_weights=weights,
+                                                          impact_weights=weights)
+        
+        assert model.mean == pytest.approx(100)
+        assert model.category_probabilities()["alto"] == pytest.approx(1.0)
+        assert model.prob_at_least("alto", 3, 3) == pytest.approx(1.0)
+    
+    @pytest.mark.parametrize("weights", [np.ones(9), -np.ones(10), np.zeros(10)])
+    def test_invalid_weights(self, weights):
+        with pytest.raises(ValueError):
+            RiskSimulator().analytic(probability_weights=weights)
+    
+    def test_invalid_queries(self, model):
+        with pytest.raises(ValueError):
+            model.count_distribution("critico", 5)
+        with pytest.raises(ValueError):
+            model.count_interval("alto", 5, confidence=1.5)
@@ -0,0 +1,71 @@
+import numpy as np
+import pytest
+from src.simulator import RiskSimulator, RISK_FIELDS
+
+
+def _expected_category_rates():
+    """Probabilidades exactas de cada categoría sobre la grilla 10×10."""
+    values = [p * i for p in range(1, 11) for i in range(1, 11)]
+    return {
+        "bajo": sum(1 for v in values if v <= 30) / 100,
+        "medio": sum(1 for v in values if 31 <= v <= 70) / 100,
+        "alto": sum(1 for v in values if v > 70) / 100
+    }
+
+
+class TestBatchSimulation:
+    """Pruebas del motor vectorizado de simulación."""
+    
+    @pytest.fixture
+    def simulator(self):
+        return RiskSimulator()
+    
+    def test_columns_have_one_entry_per_risk(self, simulator):
+        """Cada columna debe tener exactamente un valor por riesgo."""
+        result = simulator.run_sprint_simulation_batch(50)
+        
+        assert len(result) == 50
+        for field in RISK_FIELDS:
+            assert len(result.column(field)) == 50
+    
+    def test_empty_sprint(self, simulator):
+        """Un sprint sin riesgos devuelve columnas vacías."""
+        result = simulator.run_sprint_simulation_batch(0)
+        assert len(result) == 0
+        assert all(len(result.column(field)) == 0 for field in RISK_FIELDS)
+    
+    def test_negative_risk_count(self, simulator):
+        """Un número negativo de riesgos es inválido."""
+        with pytest.raises(ValueError):
+            simulator.run_sprint_simulation_batch(-1)
+    
+    def test_rows_are_consistent(self, simulator):
+        """Cada fila debe respetar las mismas reglas que la ruta escalar."""
+        result = simulator.run_sprint_simulation_batch(2000)
+        
+        assert np.array_equal(result.priority, result.probability * result.impact)
+        assert result.probability.min() >= 1 and result.probability.max() <= 10
+        assert result.impact.min() >= 1 and result.impact.max() <= 10
+        
+        for risk in result:
+            _, expected_category = simulator.calculate_priority(risk["probabilidad"], risk["impacto"])
+            assert risk["descripcion"] in simulator.risk_descriptions[risk["tipo"]]
+            assert risk["categoria_prioridad"] == expected_category
+            assert risk["mitigacion"] in simulator.mitigation_strategies[expected_category]
+    
+    def test_statistically_equivalent_to_scalar_path(self, simulator):
+        """Las frecuencias de ambas rutas deben coincidir con la distribución teórica."""
+        expected = _expected_category_rates()
+        batch = simulator.run_sprint_simulation_batch(200_000)
+        scalar = simulator.run_sprint_simulation(20_000)
+        
+        for category, rate in expected.items():
+            batch_rate = np.mean(batch.column("categoria_prioridad") == category)
+            scalar_rate = sum(1 for r in scalar if r["categoria_prioridad"] == category) / len(scalar)
+            assert batch_rate == pytest.approx(rate, abs=0.01)
+            assert scalar_rate == pytest.approx(rate, abs=0.025)
+        
+        # Todas las descripciones son equiprobables en ambas rutas
+        counts = np.bincount(batch.description_code, minlength=len(simulator._tables.descriptions))
+        assert counts.min() / len(batch) == pytest.approx(1 / len(counts), abs=0.005)
+        assert batch.priority.mean() == pytest.approx(30.25, abs=0.3)
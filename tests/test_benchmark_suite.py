@@ -0,0 +1,55 @@
+import json
+from benchmarks.suite import compare_results, main, run_suite
+
+
+class TestBenchmarkSuite:
+    """Pruebas de la suite de benchmarks y su detección de regresiones."""
+    
+    def test_run_suite_reports_throughput_and_memory(self):
+        """Cada caso reporta tiempo, riesgos por segundo y memoria pico."""
+        results = run_suite([100], repeat=1, only=["run_sprint_simulation_batch", "statistics"])
+        
+        assert set(results) == {"run_sprint_simulation_batch[100]", "statistics[100]"}
+        for result in results.values():
+            assert result["size"] == 100
+            assert result["risks_per_sec"] > 0
+            assert result["peak_memory_bytes"] >= 0
+    
+    def test_scalar_cases_are_capped(self):
+        """Las rutas escalares no se ejecutan por encima del tamaño máximo."""
+        results = run_suite([10, 100], repeat=1, only=["generate_risk"], max_scalar_size=10)
+        assert list(results) == ["generate_risk[10]"]
+    
+    def test_exact_sum_case_is_capped(self):
+        """La suma exacta de prioridades solo se mide hasta EXACT_SUM_LIMIT riesgos."""
+        results = run_suite([100, 10 ** 6], repeat=1, only=["priority_sum_pmf"])
+        assert list(results) == ["priority_sum_pmf[100]"]
+    
+    def test_compare_results(self):
+        """Solo se marcan las caídas mayores al umbral."""
+        baseline = {"a[10]": {"risks_per_sec": 100.0}, "b[10]": {"risks_per_sec": 100.0}}
+        current = {
+            "a[10]": {"risks_per_sec": 90.0},
+            "b[10]": {"risks_per_sec": 70.0},
+            "c[10]": {"risks_per_sec": 1.0}
+        }
+        
+        regressions = compare_results(baseline, current, threshold=0.15)
+        
+        assert [r["case"] for r in regressions] == ["b[10]"]
+        assert regressions[0]["ratio"] == 0.7
+    
+    def test_main_fails_on_regression(self, tmp_path):
+        """La línea de comandos devuelve 1 cuando hay regresiones."""
+        baseline = tmp_path / "baseline.json"
+        args = ["--min-exp", "2", "--max-exp", "2", "--repeat", "1", "--only", "statistics"]
+        
+        assert main(args + ["--save", str(baseline)]) == 0
+        
+        # Una línea base imposiblemente rápida obliga a detectar la regresión
+        data = json.loads(baseline.read_text(encoding="utf-8"))
+        for result in data["results"].values():
+            result["risks_per_sec"] *= 1e6
+        baseline.write_text(json.dumps(data), encoding="utf-8")
+        
+        assert main(args + ["--compare", str(baseline)]) == 1
@@ -0,0 +1,151 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pytest
+from src.cache import ScenarioCache, scenario_key
+from src.catalog import RiskCatalog
+from src.cli import main
+from src.simulator import RiskSimulator, RiskStatistics
+
+
+class TestScenarioCache:
+    """Pruebas de la caché de escenarios Monte Carlo."""
+    
+    @pytest.fixture
+    def simulator(self):
+        return RiskSimulator()
+    
+    def test_memory_hit_returns_same_result(self, simulator):
+        """La segunda consulta del mismo escenario no vuelve a simular."""
+        cache = ScenarioCache()
+        first = cache.run_monte_carlo(simulator, 2000, 5, seed=3, max_workers=1)
+        
+        second = cache.run_monte_carlo(simulator, 2000, 5, seed=3, max_workers=1)
+        
+        assert second is first
+        assert (cache.hits, cache.misses) == (1, 1)
+        with pytest.raises(ValueError):
+            second.priority_sum[0] = 0
+    
+    def test_key_changes_with_scenario(self, simulator):
+        """Catálogo, umbrales, tamaños y semilla forman parte de la clave."""
+        base = scenario_key(simulator, 100, 5, 1)
+        catalog = RiskCatalog.from_dict({"tipos": [{"nombre": "Técnico", "riesgos": ["Deuda"]}]})
+        
+        assert base == scenario_key(RiskSimulator(rng=99), 100, 5, 1)
+        assert len({
+            base,
+            scenario_key(RiskSimulator(thresholds=(20, 70)), 100, 5, 1),
+            scenario_key(RiskSimulator(catalog=catalog), 100, 5, 1),
+            scenario_key(simulator, 101, 5, 1),
+            scenario_key(simulator, 100, 6, 1),
+            scenario_key(simulator, 100, 5, 2),
+            scenario_key(simulator, 100, 5, np.random.SeedSequence(1).spawn(1)[0])
+        }) == 7
+    
+    def test_unseeded_runs_are_not_cached(self, simulator):
+        cache = ScenarioCache()
+        cache.run_monte_carlo(simulator, 100, seed=None, max_workers=1)
+        
+        assert len(cache) == 0
+        with pytest.raises(ValueError):
+            scenario_key(simulator, 100, 5, None)
+    
+    def test_lru_eviction(self, simulator):
+        """La memoria conserva los `max_entries` escenarios usados más recientemente."""
+        cache = ScenarioCache(max_entries=2)
+        for seed in (1, 2, 1, 3):
+            cache.run_monte_carlo(simulator, 50, seed=seed, max_workers=1)
+        
+        assert scenario_key(simulator, 50, 5, 1) in cache
+        assert scenario_key(simulator, 50, 5, 2) not in cache
+        assert len(cache) == 2
+    
+    def test_memory_size_eviction(self, simulator):
+        """La memoria también se recorta por bytes de los arrays por sprint."""
+        entry_bytes = 2000 * (3 * 4 + 8 + 1)
+        cache = ScenarioCache(max_memory_bytes=int(entry_bytes * 2.5))
+        for seed in (1, 2, 3):
+            cache.run_monte_carlo(simulator, 2000, seed=seed, max_workers=1)
+        
+        assert scenario_key(simulator, 2000, 5, 1) not in cache
+        assert len(cache) == 2
+        assert cache.memory_usage == 2 * entry_bytes
+    
+    def test_large_entry_kept_as_memory_map(self, simulator, tmp_path):
+        """Un escenario que no entra en memoria se sirve desde el disco con memory-map."""
+        cache = ScenarioCache(directory=str(tmp_path), max_memory_bytes=1000)
+        first = cache.run_monte_carlo(simulator, 2000, seed=4, max_workers=1)
+        second = cache.run_monte_carlo(simulator, 2000, seed=4, max_workers=1)
+        
+        assert isinstance(first.priority_sum, np.memmap)
+        assert second is first
+        assert cache.memory_usage == 0
+    
+    def test_concurrent_threads(self, simulator):
+        """Varios hilos pueden consultar y expulsar escenarios a la vez."""
+        cache = ScenarioCache(max_entries=2)
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            results = list(pool.map(lambda seed: cache.run_monte_carlo(simulator, 100, seed=seed % 5,
+                                                                       max_workers=1), range(400)))
+        
+        assert len(results) == 400
+        assert len(cache) == 2
+        assert cache.hits + cache.misses == 400
+    
+    def test_disk_store_round_trip(self, simulator, tmp_path):
+        """Otro proceso (otra caché sobre el mismo directorio) reutiliza el resultado."""
+        expected = ScenarioCache(directory=str(tmp_path)).run_monte_carlo(
+            simulator, 3000, 4, seed=7, max_workers=1)
+        
+        cache = ScenarioCache(directory=str(tmp_path))
+        result = cache.run_monte_carlo(simulator, 3000, 4, seed=7, max_workers=1)
+        
+        assert (cache.disk_hits, cache.misses) == (1, 0)
+        assert isinstance(result.priority_sum, np.memmap)
+        np.testing.assert_array_equal(result.category_counts, expected.category_counts)
+        assert result.statistics.to_dict() == expected.statistics.to_dict()
+    
+    def test_damaged_disk_entry_is_rewritten(self, simulator, tmp_path):
+        """Una entrada incompleta cuenta como fallo y se repara para la próxima corrida."""
+        ScenarioCache(directory=str(tmp_path)).run_monte_carlo(simulator, 3000, 4, seed=7, max_workers=1)
+        entry, = tmp_path.iterdir()
+        (entry / "statistics.json").unlink()
+        
+        damaged = ScenarioCache(directory=str(tmp_path))
+        damaged.run_monte_carlo(simulator, 3000, 4, seed=7, max_workers=1)
+        repaired = ScenarioCache(directory=str(tmp_path))
+        repaired.run_monte_carlo(simulator, 3000, 4, seed=7, max_workers=1)
+        
+        assert (damaged.disk_hits, damaged.misses) == (0, 1)
+        assert (repaired.disk_hits, repaired.misses) == (1, 0)
+        assert (entry / "statistics.json").is_file()
+    
+    def test_disk_size_eviction(self, simulator, tmp_path):
+        """El directorio se recorta por tamaño borrando primero lo más antiguo."""
+        cache = ScenarioCache(max_entries=0, directory=str(tmp_path))
+        cache.run_monte_carlo(simulator, 5000, seed=1, max_workers=1)
+        entry_size = cache.disk_usage()
+        cache.max_disk_bytes = int(entry_size * 1.5)
+        cache.run_monte_carlo(simulator, 5000, seed=2, max_workers=1)
+        
+        assert scenario_key(simulator, 5000, 5, 1) not in cache
+        assert scenario_key(simulator, 5000, 5, 2) in cache
+        assert cache.disk_usage() <= cache.max_disk_bytes
+    
+    def test_statistics_round_trip(self, simulator):
+        """RiskStatistics.from_dict reconstruye el acumulador, incluido el ranking."""
+        stats = RiskStatistics(top_k=5).update(simulator.run_sprint_simulation_batch(1000))
+        restored = RiskStatistics.from_dict(stats.to_dict(), top_k=5)
+        
+        assert restored.to_dict() == stats.to_dict()
+    
+    def test_cli_cache(self, tmp_path, capsys):
+        args = ["montecarlo", "--sprints", "300", "--semilla", "5", "--procesos", "1",
+                "--cache", str(tmp_path), "--json"]
+        main(args)
+        first = capsys.readouterr().out
+        main(args)
+        
+        assert capsys.readouterr().out == first
+        assert len(list(tmp_path.iterdir())) == 1
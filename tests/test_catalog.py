@@ -0,0 +1,138 @@
+import json
+import pickle
+
+import numpy as np
+import pytest
+from src.catalog import DEFAULT_CATALOG, RiskCatalog
+from src.cli import main
+from src.simulator import RiskSimulator
+
+
+def _weighted_catalog():
+    return RiskCatalog.from_dict({
+        "tipos": [
+            {"nombre": "Técnico", "peso": 3,
+             "riesgos": [{"descripcion": "Deuda técnica", "peso": 9}, "Caída del CI"]},
+            {"nombre": "Externo", "riesgos": ["Proveedor tardío"]}
+        ]
+    })
+
+
+class TestRiskCatalog:
+    """Pruebas del catálogo de riesgos inmutable y ponderado."""
+    
+    def test_default_catalog_is_shared(self):
+        """Los simuladores comparten el catálogo por defecto sin copiarlo."""
+        first, second = RiskSimulator(), RiskSimulator(rng=1)
+        
+        assert first.catalog is second.catalog is DEFAULT_CATALOG
+        assert first.risk_descriptions is second.risk_descriptions
+        assert len(DEFAULT_CATALOG) == 25
+        with pytest.raises(TypeError):
+            first.risk_descriptions["Técnico"] = []
+    
+    def test_weighted_sampling_frequencies(self):
+        """Las frecuencias muestreadas siguen los pesos de tipo y descripción."""
+        simulator = RiskSimulator(rng=4, catalog=_weighted_catalog())
+        batch = simulator.run_sprint_simulation_batch(200_000)
+        descriptions = batch.column("descripcion")
+        
+        assert np.mean(descriptions == "Deuda técnica") == pytest.approx(0.75 * 0.9, abs=0.005)
+        assert np.mean(descriptions == "Caída del CI") == pytest.approx(0.75 * 0.1, abs=0.005)
+        assert np.mean(batch.column("tipo") == "Externo") == pytest.approx(0.25, abs=0.005)
+    
+    def test_scalar_matches_batch(self):
+        """La ruta escalar (bisect) y la vectorizada eligen lo mismo con la misma semilla."""
+        catalog = _weighted_catalog()
+        scalar = RiskSimulator(rng=8, catalog=catalog).run_sprint_simulation(500)
+        batch = RiskSimulator(rng=8, catalog=catalog).run_sprint_simulation_batch(500)
+        
+        assert batch.to_records() == scalar
+    
+    def test_zero_weight_is_never_sampled(self):
+        """Una entrada con peso cero queda en el catálogo pero nunca se elige."""
+        catalog = RiskCatalog.from_dict({"tipos": [
+            {"nombre": "Técnico", "riesgos": [{"descripcion": "Nunca", "peso": 0}, "Siempre"]}
+        ]})
+        batch = RiskSimulator(rng=2, catalog=catalog).run_sprint_simulation_batch(10_000)
+        
+        assert set(batch.column_list("descripcion")) == {"Siempre"}
+    
+    def test_large_catalog(self):
+        """Un catálogo de miles de riesgos se muestrea y se analiza sin cambios en la API."""
+        catalog = RiskCatalog.from_dict({"tipos": [
+            {"nombre": f"Tipo {t}", "riesgos": [f"Riesgo {t}-{d}" for d in range(500)]}
+            for t in range(20)
+        ]})
+        simulator = RiskSimulator(rng=3, catalog=catalog)
+        batch = simulator.run_sprint_simulation_batch(50_000)
+        
+        assert len(catalog) == 10_000
+        assert all(d.startswith(t.replace("Tipo", "Riesgo"))
+                   for t, d in zip(batch.column_list("tipo")[:100], batch.column_list("descripcion")[:100]))
+        assert sum(simulator.analytic().description_probabilities().values()) == pytest.approx(1.0)
+    
+    def test_json_and_csv_loaders(self, tmp_path):
+        """JSON y CSV describen el mismo catálogo y se distinguen por extensión."""
+        json_path = tmp_path / "catalogo.json"
+        json_path.write_text(json.dumps({"tipos": [
+            {"nombre": "Técnico", "peso": 2, "riesgos": [{"descripcion": "Deuda", "peso": 3}, "CI"]},
+            {"nombre": "Externo", "riesgos": ["Proveedor"]}
+        ]}), encoding="utf-8")
+        csv_path = tmp_path / "catalogo.csv"
+        csv_path.write_text("tipo,descripcion,peso,peso_tipo\n"
+                            "Técnico,Deuda,3,2\nTécnico,CI,,\nExterno,Proveedor,,\n", encoding="utf-8")
+        
+        from_json, from_csv = RiskCatalog.load(str(json_path)), RiskCatalog.load(str(csv_path))
+        
+        assert from_json.fingerprint == from_csv.fingerprint
+        assert from_json.risk_descriptions["Técnico"] == ("Deuda", "CI")
+        assert from_json.fingerprint != DEFAULT_CATALOG.fingerprint
+    
+    def test_csv_mitigations(self, tmp_path):
+        """Las mitigaciones pueden venir de un segundo CSV."""
+        risks = tmp_path / "riesgos.csv"
+        risks.write_text("tipo,descripcion\nTécnico,Deuda\n", encoding="utf-8")
+        mitigations = tmp_path / "mitigaciones.csv"
+        mitigations.write_text("categoria,estrategia\nbajo,Anotar\nmedio,Revisar\nalto,Escalar\n",
+                               encoding="utf-8")
+        catalog = RiskCatalog.from_csv(str(risks), str(mitigations))
+        
+        risk = RiskSimulator(rng=0, catalog=catalog).run_sprint_simulation(1)[0]
+        assert risk["mitigacion"] == {"bajo": "Anotar", "medio": "Revisar", "alto": "Escalar"}[
+            risk["categoria_prioridad"]]
+    
+    @pytest.mark.parametrize("data", [
+        {"tipos": []},
+        {"tipos": [{"nombre": "Técnico", "riesgos": []}]},
+        {"tipos": [{"nombre": "Técnico", "riesgos": ["A", "A"]}]},
+        {"tipos": [{"nombre": "Técnico", "riesgos": [{"descripcion": "A", "peso": -1}]}]},
+        {"tipos": [{"nombre": "Técnico", "riesgos": ["A"]}], "mitigaciones": {"bajo": ["X"]}},
+        {"riesgos": []},
+        {"tipos": [{"nombre": "Técnico", "riesgos": ["A"]}],
+         "mitigaciones": {"bajo": [{"texto": "m"}], "medio": ["m"], "alto": ["m"]}},
+        {"tipos": [{"nombre": "Técnico", "riesgos": ["A"]}], "mitigaciones": ["m"]},
+        {"tipos": [{"nombre": "Técnico", "riesgos": ["A"]}], "mitigaciones": {"bajo": 3}},
+        {"tipos": ["Técnico"]}
+    ])
+    def test_invalid_catalogs(self, data):
+        """Los catálogos mal formados se rechazan con ValueError."""
+        with pytest.raises(ValueError):
+            RiskCatalog.from_dict(data)
+    
+    def test_cli_reports_invalid_catalog(self, tmp_path, capsys):
+        """La línea de comandos informa el error en lugar de mostrar una traza."""
+        path = tmp_path / "malo.json"
+        path.write_text(json.dumps({"tipos": [{"nombre": "Técnico", "riesgos": ["A"]}],
+                                    "mitigaciones": ["m"]}), encoding="utf-8")
+        
+        assert main(["sprint", "--catalogo", str(path)]) == 1
+        assert "mitigaciones" in capsys.readouterr().err
+    
+    def test_pickle_round_trip(self):
+        """El catálogo viaja a los procesos de run_monte_carlo y sigue siendo inmutable."""
+        catalog = pickle.loads(pickle.dumps(_weighted_catalog()))
+        
+        assert catalog.fingerprint == _weighted_catalog().fingerprint
+        with pytest.raises(TypeError):
+            catalog.mitigation_strategies["alto"] = ()
@@ -0,0 +1,62 @@
+import json
+import subprocess
+import sys
+
+from src.cli import main
+
+
+class TestCli:
+    """Pruebas de la línea de comandos sin interfaz gráfica."""
+    
+    def test_sprint_lists_risks(self, capsys):
+        """El comando sprint muestra cada riesgo y el resumen."""
+        assert main(["sprint", "--riesgos", "3", "--semilla", "1"]) == 0
+        output = capsys.readouterr().out
+        
+        assert output.count("→") == 3
+        assert "Total de riesgos identificados: 3" in output
+    
+    def test_batch_json_and_csv(self, capsys, tmp_path):
+        """El comando lote exporta y resume en una sola pasada."""
+        path = tmp_path / "riesgos.csv"
+        assert main(["lote", "--riesgos", "2500", "--bloque", "1000", "--semilla", "2",
+                     "--csv", str(path), "--json"]) == 0
+        summary = json.loads(capsys.readouterr().out)
+        
+        assert summary["total"] == 2500
+        assert sum(summary["categorias"].values()) == 2500
+        assert len(path.read_text(encoding="utf-8").splitlines()) == 2501
+    
+    def test_monte_carlo_is_reproducible(self, capsys):
+        """Con la misma semilla el resumen Monte Carlo es idéntico."""
+        args = ["montecarlo", "--sprints", "200", "--riesgos", "4", "--semilla", "9",
+                "--procesos", "1", "--json"]
+        main(args)
+        first = json.loads(capsys.readouterr().out)
+        main(args)
+        second = json.loads(capsys.readouterr().out)
+        
+        assert first == second
+        assert first["sprints"] == 200
+        assert first["total"] == 800
+    
+    def test_custom_thresholds(self, capsys):
+        """Los umbrales se pasan al simulador."""
+        main(["lote", "--riesgos", "100", "--umbrales", "0", "0", "--json"])
+        assert json.loads(capsys.readouterr().out)["categorias"]["alto"] == 100
+    
+    def test_invalid_arguments(self, capsys):
+        """Los valores inválidos terminan con un código de error."""
+        assert main(["lote", "--riesgos", "-1"]) == 2
+        assert main(["lote", "--umbrales", "70", "30"]) == 1
+        assert "Error" in capsys.readouterr().err
+    
+    def test_core_does_not_import_gui(self):
+        """El núcleo y la CLI se importan sin tkinter, y la CLI sin NumPy."""
+        code = (
+            "import sys, src.cli; numpy_loaded = 'numpy' in sys.modules; "
+            "import src.simulator, src.export; "
+            "print(numpy_loaded, 'tkinter' in sys.modules)"
+        )
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+        assert result.stdout.split() == ["False", "False"]
@@ -0,0 +1,79 @@
+import csv
+import pytest
+from src.export import CSV_HEADER, export_csv, export_columnar, iter_columnar, load_columnar
+from src.simulator import RiskSimulator, RiskBatch
+
+
+class TestExport:
+    """Pruebas de la exportación en streaming sin interfaz gráfica."""
+    
+    @pytest.fixture
+    def simulator(self):
+        return RiskSimulator()
+    
+    def test_iter_risk_batches_chunks(self, simulator):
+        """Los bloques generados cubren exactamente el total pedido."""
+        sizes = [len(batch) for batch in simulator.iter_risk_batches(25, chunk_size=10)]
+        assert sizes == [10, 10, 5]
+        
+        with pytest.raises(ValueError):
+            list(simulator.iter_risk_batches(10, chunk_size=0))
+    
+    def test_export_csv(self, simulator, tmp_path):
+        """El CSV contiene la cabecera y una fila por riesgo."""
+        batches = [simulator.run_sprint_simulation_batch(7) for _ in range(3)]
+        path = tmp_path / "riesgos.csv"
+        
+        written = export_csv(str(path), iter(batches))
+        
+        with open(path, newline='', encoding='utf-8') as f:
+            rows = list(csv.reader(f))
+        assert written == 21
+        assert rows[0] == CSV_HEADER
+        expected = [r for batch in batches for r in batch.to_records()]
+        assert [row[1] for row in rows[1:]] == [r["descripcion"] for r in expected]
+        assert [int(row[4]) for row in rows[1:]] == [r["valor_prioridad"] for r in expected]
+    
+    def test_columnar_round_trip(self, simulator, tmp_path):
+        """El formato columnar se recarga con los mismos riesgos."""
+        path = tmp_path / "riesgos.rskcol"
+        batches = list(simulator.iter_risk_batches(2500, chunk_size=1000))
+        
+        assert export_columnar(str(path), batches) == 2500
+        assert [len(chunk) for chunk in iter_columnar(str(path))] == [1000, 1000, 500]
+        
+        loaded = load_columnar(str(path))
+        assert loaded.to_records() == RiskBatch.concatenate(batches).to_records()
+    
+    def test_columnar_rejects_other_files(self, tmp_path):
+        """Un archivo sin la firma esperada no se puede leer."""
+        path = tmp_path / "otro.bin"
+        path.write_bytes(b"no es un archivo de riesgos")
+        
+        with pytest.raises(ValueError):
+            load_columnar(str(path))
+    
+    def test_columnar_detects_truncation(self, simulator, tmp_path):
+        """Un archivo cortado no se interpreta en silencio."""
+        path = tmp_path / "riesgos.rskcol"
+        export_columnar(str(path), [simulator.run_sprint_simulation_batch(100)])
+        data = path.read_bytes()
+        
+        # Cortado en medio de una columna y en medio del número de filas
+        for cut in (len(data) - 10, len(data) - 100 * 10 - 4):
+            path.write_bytes(data[:cut])
+            with pytest.raises(ValueError, match="truncado"):
+                load_columnar(str(path))
+    
+    def test_columnar_without_risks(self, simulator, tmp_path):
+        """Sin riesgos queda un archivo válido con la cabecera de las tablas del simulador."""
+        path = tmp_path / "vacio.rskcol"
+        
+        assert export_columnar(str(path), [], simulator.catalog.tables) == 0
+        assert list(iter_columnar(str(path))) == []
+        loaded = load_columnar(str(path))
+        assert len(loaded) == 0
+        assert loaded.tables.types == simulator.catalog.tables.types
+        with pytest.raises(ValueError):
+            export_columnar(str(tmp_path / "sin_tablas.rskcol"), [])
+        assert not (tmp_path / "sin_tablas.rskcol").exists()
@@ -0,0 +1,114 @@
+import json
+import pickle
+import pstats
+
+import pytest
+from src.cli import main
+from src.instrumentation import NULL_INSTRUMENTATION, Instrumentation
+from src.simulator import RiskSimulator
+
+
+class TestInstrumentation:
+    """Pruebas de la instrumentación opcional por etapas."""
+    
+    def test_disabled_by_default(self):
+        """Sin instrumentación explícita no se registra nada."""
+        simulator = RiskSimulator(rng=1)
+        simulator.run_sprint_simulation_batch(100)
+        
+        assert simulator.instrumentation is NULL_INSTRUMENTATION
+        assert NULL_INSTRUMENTATION.report() == {"etapas": {}, "contadores": {}}
+    
+    def test_batch_stages_and_counters(self):
+        """Cada etapa del lote registra llamadas, elementos y tiempo."""
+        instrumentation = Instrumentation()
+        simulator = RiskSimulator(rng=2, instrumentation=instrumentation)
+        for batch in simulator.iter_risk_batches(2500, 1000):
+            pass
+        report = instrumentation.report()
+        
+        assert set(report["etapas"]) == {"muestreo", "prioridad", "mitigacion", "ensamblado"}
+        sampling = report["etapas"]["muestreo"]
+        assert sampling["llamadas"] == 3
+        assert sampling["elementos"] == 2500
+        assert sampling["segundos"] > 0
+        assert sampling["elementos_por_segundo"] > 0
+        assert report["contadores"] == {"riesgos": 2500}
+    
+    def test_toggle_at_runtime(self):
+        instrumentation = Instrumentation(enabled=False)
+        simulator = RiskSimulator(rng=3, instrumentation=instrumentation)
+        simulator.run_sprint_simulation(5)
+        instrumentation.enabled = True
+        simulator.run_sprint_simulation(5)
+        
+        assert instrumentation.report()["etapas"]["sprint_escalar"]["llamadas"] == 1
+        instrumentation.reset()
+        assert instrumentation.report()["contadores"] == {}
+    
+    def test_allocation_tracking(self):
+        """Con tracemalloc se informa el pico de memoria de cada etapa."""
+        with Instrumentation(track_allocations=True) as instrumentation:
+            RiskSimulator(rng=4, instrumentation=instrumentation).run_sprint_simulation_batch(100_000)
+        
+        peak = instrumentation.report()["etapas"]["muestreo"]["memoria_pico_bytes"]
+        # Cinco uniformes float64 por riesgo
+        assert peak >= 100_000 * 5 * 8
+    
+    def test_nested_stage_keeps_outer_peak(self):
+        """Una etapa interna no borra el pico de la etapa que la contiene."""
+        with Instrumentation(track_allocations=True) as instrumentation:
+            simulator = RiskSimulator(rng=5, instrumentation=instrumentation)
+            with instrumentation.stage("externa"):
+                large = bytearray(4_000_000)
+                del large
+                with instrumentation.stage("interna"):
+                    inner = bytearray(2_000_000)
+                    del inner
+            simulator.run_monte_carlo(20_000, 5, seed=1, max_workers=1)
+        
+        stages = instrumentation.report()["etapas"]
+        # Margen para objetos que el intérprete libera durante la etapa
+        assert stages["externa"]["memoria_pico_bytes"] >= 3_900_000
+        assert 1_900_000 <= stages["interna"]["memoria_pico_bytes"] < 3_000_000
+        assert stages["montecarlo"]["memoria_pico_bytes"] >= stages["muestreo"]["memoria_pico_bytes"]
+    
+    def test_profile_dump(self, tmp_path):
+        path = tmp_path / "perfil.prof"
+        with Instrumentation(profile=True) as instrumentation:
+            RiskSimulator(rng=5, instrumentation=instrumentation).run_sprint_simulation(50)
+        instrumentation.dump_profile(str(path))
+        
+        functions = {name for _, _, name in pstats.Stats(str(path)).stats}
+        assert "generate_risk" in functions
+        with pytest.raises(ValueError):
+            Instrumentation().dump_profile(str(path))
+    
+    def test_not_sent_to_worker_processes(self):
+        """Al serializar (procesos de Monte Carlo) se reemplaza por la desactivada."""
+        instrumentation = Instrumentation()
+        simulator = RiskSimulator(rng=6, instrumentation=instrumentation)
+        
+        assert pickle.loads(pickle.dumps(simulator)).instrumentation is NULL_INSTRUMENTATION
+        simulator.run_monte_carlo(100, 5, seed=1, max_workers=2)
+        assert instrumentation.report()["etapas"]["montecarlo"]["elementos"] == 500
+    
+    def test_json_and_text_report(self, tmp_path):
+        instrumentation = Instrumentation()
+        RiskSimulator(rng=7, instrumentation=instrumentation).run_sprint_simulation_batch(10)
+        path = tmp_path / "diagnostico.json"
+        instrumentation.to_json(str(path))
+        
+        assert json.loads(path.read_text(encoding="utf-8")) == instrumentation.report()
+        assert "muestreo" in instrumentation.format_report()
+        assert Instrumentation().format_report() == "Sin datos de instrumentación"
+    
+    def test_cli_diagnostics(self, tmp_path, capsys):
+        path = tmp_path / "diagnostico.json"
+        assert main(["lote", "--riesgos", "3000", "--bloque", "1000", "--semilla", "1",
+                     "--diagnostico", str(path)]) == 0
+        report = json.loads(path.read_text(encoding="utf-8"))
+        
+        assert report["etapas"]["estadisticas"]["elementos"] == 3000
+        assert main(["sprint", "--riesgos", "3", "--diagnostico"]) == 0
+        assert "Etapa" in capsys.readouterr().err
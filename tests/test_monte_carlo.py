@@ -0,0 +1,71 @@
+import numpy as np
+import pytest
+from src.simulator import RiskSimulator, SPRINTS_PER_STREAM, SprintAggregates
+
+
+class TestMonteCarlo:
+    """Pruebas del simulador Monte Carlo de múltiples sprints."""
+    
+    @pytest.fixture
+    def simulator(self):
+        return RiskSimulator()
+    
+    def test_aggregates_shape(self, simulator):
+        """Debe devolver un agregado por sprint con los riesgos pedidos."""
+        result = simulator.run_monte_carlo(100, 7, seed=1, max_workers=1)
+        
+        assert isinstance(result, SprintAggregates)
+        assert len(result) == 100
+        assert result.category_counts.shape == (100, 3)
+        assert np.all(result.risks_per_sprint == 7)
+        assert np.all(result.priority_max <= 100)
+        assert np.all(result.priority_sum <= 7 * result.priority_max.astype(np.int64))
+    
+    def test_same_seed_is_reproducible(self, simulator):
+        """La misma semilla produce exactamente los mismos agregados."""
+        first = simulator.run_monte_carlo(50, 5, seed=42, max_workers=1)
+        second = simulator.run_monte_carlo(50, 5, seed=42, max_workers=1)
+        other = simulator.run_monte_carlo(50, 5, seed=43, max_workers=1)
+        
+        assert np.array_equal(first.priority_sum, second.priority_sum)
+        assert np.array_equal(first.category_counts, second.category_counts)
+        assert not np.array_equal(first.priority_sum, other.priority_sum)
+    
+    def test_parallel_matches_serial(self, simulator):
+        """El resultado no depende del número de procesos."""
+        num_sprints = 3 * SPRINTS_PER_STREAM + 10
+        serial = simulator.run_monte_carlo(num_sprints, 4, seed=7, max_workers=1)
+        parallel = simulator.run_monte_carlo(num_sprints, 4, seed=7, max_workers=2)
+        
+        assert len(parallel) == num_sprints
+        assert np.array_equal(serial.category_counts, parallel.category_counts)
+        assert np.array_equal(serial.priority_sum, parallel.priority_sum)
+        assert np.array_equal(serial.priority_max, parallel.priority_max)
+    
+    def test_distribution_matches_theory(self, simulator):
+        """Las proporciones globales deben aproximar la distribución exacta."""
+        result = simulator.run_monte_carlo(20_000, 10, seed=3, max_workers=1)
+        distribution = result.category_distribution()
+        
+        assert distribution["bajo"] == pytest.approx(0.61, abs=0.01)
+        assert distribution["medio"] == pytest.approx(0.31, abs=0.01)
+        assert distribution["alto"] == pytest.approx(0.08, abs=0.01)
+        assert np.mean(result.mean_priority()) == pytest.approx(30.25, abs=0.3)
+    
+    def test_high_risk_summary(self, simulator):
+        """Indicadores de riesgos altos por sprint a partir de la columna "alto"."""
+        result = simulator.run_monte_carlo(2000, 5, seed=4, max_workers=1)
+        high_counts = result.category_counts[:, 2]
+        
+        assert result.high_risk_summary() == {
+            "sprints": 2000,
+            "sprints_con_riesgo_alto": pytest.approx(np.mean(high_counts > 0)),
+            "riesgos_altos_por_sprint": pytest.approx(np.mean(high_counts))
+        }
+        assert simulator.run_monte_carlo(0, 5).high_risk_summary()["sprints_con_riesgo_alto"] == 0.0
+    
+    def test_empty_and_invalid_runs(self, simulator):
+        """Cero sprints devuelve un resultado vacío y los negativos fallan."""
+        assert len(simulator.run_monte_carlo(0, 5)) == 0
+        with pytest.raises(ValueError):
+            simulator.run_monte_carlo(-1, 5)
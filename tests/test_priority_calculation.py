@@ -1,5 +1,5 @@
 import pytest
-from src.main import RiskSimulator  # Asegúrate de que esta importación sea correcta según tu estructura
+from src.simulator import RiskSimulator  # Asegúrate de que esta importación sea correcta según tu estructura
 
 class TestPriorityCalculation:
     """Pruebas unitarias para el cálculo de prioridad de riesgos."""
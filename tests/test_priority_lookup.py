@@ -0,0 +1,65 @@
+import numpy as np
+import pytest
+from src.simulator import RiskSimulator, PRIORITY_CATEGORIES
+
+
+class TestPriorityLookup:
+    """Pruebas de las tablas precalculadas de prioridad."""
+    
+    @pytest.fixture
+    def simulator(self):
+        return RiskSimulator()
+    
+    def test_vectorized_matches_scalar(self, simulator):
+        """La ruta vectorizada coincide con la escalar en toda la grilla."""
+        probabilities, impacts = np.meshgrid(np.arange(1, 11), np.arange(1, 11))
+        values, codes = simulator.calculate_priorities(probabilities, impacts)
+        
+        for p, i, value, code in zip(probabilities.ravel(), impacts.ravel(),
+                                     values.ravel(), codes.ravel()):
+            expected_value, expected_category = simulator.calculate_priority(int(p), int(i))
+            assert value == expected_value
+            assert PRIORITY_CATEGORIES[code] == expected_category
+    
+    @pytest.mark.parametrize("probabilities, impacts", [
+        ([0, 5], [5, 5]),
+        ([5, 11], [5, 5]),
+        ([5, 5], [0, 5]),
+        ([5, 5], [5, 11])
+    ])
+    def test_vectorized_invalid_inputs(self, simulator, probabilities, impacts):
+        """Los arrays fuera de rango lanzan el mismo error que la ruta escalar."""
+        with pytest.raises(ValueError, match="Probabilidad e impacto deben estar entre 1 y 10"):
+            simulator.calculate_priorities(probabilities, impacts)
+    
+    def test_vectorized_rejects_floats(self, simulator):
+        """Solo se aceptan arrays enteros."""
+        with pytest.raises(TypeError):
+            simulator.calculate_priorities([1.5], [2])
+    
+    @pytest.mark.parametrize("probability, impact, expected_category", [
+        (4, 5, "bajo"),    # 20 → bajo (límite)
+        (3, 7, "medio"),   # 21 → medio
+        (5, 10, "medio"),  # 50 → medio (límite)
+        (6, 9, "alto")     # 54 → alto
+    ])
+    def test_custom_thresholds(self, probability, impact, expected_category):
+        """Los umbrales configurados cambian la categorización."""
+        simulator = RiskSimulator(thresholds=(20, 50))
+        
+        assert simulator.calculate_priority(probability, impact)[1] == expected_category
+        _, codes = simulator.calculate_priorities([probability], [impact])
+        assert PRIORITY_CATEGORIES[codes[0]] == expected_category
+    
+    def test_batch_uses_thresholds(self):
+        """La simulación vectorizada respeta los umbrales configurados."""
+        simulator = RiskSimulator(thresholds=(0, 0))
+        batch = simulator.run_sprint_simulation_batch(100)
+        
+        assert all(risk["categoria_prioridad"] == "alto" for risk in batch)
+    
+    @pytest.mark.parametrize("thresholds", [(70, 30), (-1, 50), (30, 101)])
+    def test_invalid_thresholds(self, thresholds):
+        """Los umbrales deben estar ordenados y dentro de 0..100."""
+        with pytest.raises(ValueError):
+            RiskSimulator(thresholds=thresholds)
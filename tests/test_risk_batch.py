@@ -0,0 +1,71 @@
+import numpy as np
+import pytest
+from src.simulator import RiskSimulator, RiskBatch, RiskRecord, PriorityCategory, RISK_FIELDS
+
+
+class TestRiskBatch:
+    """Pruebas del contenedor columnar de riesgos."""
+    
+    @pytest.fixture
+    def simulator(self):
+        return RiskSimulator()
+    
+    @pytest.fixture
+    def batch(self, simulator):
+        return simulator.run_sprint_simulation_batch(200)
+    
+    def test_compact_dtypes(self, batch):
+        """Las columnas usan tipos enteros pequeños."""
+        assert batch.probability.dtype == np.uint8
+        assert batch.impact.dtype == np.uint8
+        assert batch.priority.dtype == np.uint8
+        assert batch.category_code.dtype == np.uint8
+        assert batch.type_code.dtype == np.uint16
+        assert batch.nbytes == 10 * len(batch)
+    
+    def test_rows_look_like_dicts(self, batch, simulator):
+        """Cada fila expone las mismas claves y valores que un riesgo escalar."""
+        risk = batch[0]
+        
+        assert isinstance(risk, RiskRecord)
+        assert list(risk) == list(RISK_FIELDS)
+        assert risk == dict(risk)
+        assert isinstance(risk["probabilidad"], int)
+        assert risk["tipo"] in simulator.risk_types
+        assert risk["valor_prioridad"] == risk["probabilidad"] * risk["impacto"]
+        assert batch[-1] == batch[len(batch) - 1]
+        with pytest.raises(KeyError):
+            risk["inexistente"]
+        with pytest.raises(IndexError):
+            batch[len(batch)]
+    
+    def test_category_codes(self, batch):
+        """Los códigos de categoría corresponden a PriorityCategory."""
+        for risk, code in zip(batch, batch.category_code):
+            assert PriorityCategory(code).label == risk["categoria_prioridad"]
+    
+    def test_slicing_and_masks(self, batch):
+        """Los slices y máscaras devuelven otro RiskBatch con las mismas filas."""
+        head = batch[:10]
+        high = batch[batch.category_code == PriorityCategory.ALTO]
+        
+        assert isinstance(head, RiskBatch)
+        assert head.to_records() == batch.to_records()[:10]
+        assert all(risk["categoria_prioridad"] == "alto" for risk in high)
+    
+    def test_round_trip_with_records(self, simulator):
+        """Convertir riesgos escalares a RiskBatch conserva todos los valores."""
+        risks = simulator.run_sprint_simulation(50)
+        batch = RiskBatch.from_records(simulator._tables, risks)
+        
+        assert batch.to_records() == risks
+        assert list(batch.column("mitigacion")) == [r["mitigacion"] for r in risks]
+    
+    def test_concatenate(self, simulator):
+        """Concatenar conserva el orden de las filas."""
+        first = simulator.run_sprint_simulation_batch(5)
+        second = simulator.run_sprint_simulation_batch(7)
+        joined = RiskBatch.concatenate([first, second])
+        
+        assert len(joined) == 12
+        assert joined.to_records() == first.to_records() + second.to_records()
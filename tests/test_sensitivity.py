@@ -0,0 +1,94 @@
+import csv
+import time
+
+import numpy as np
+import pytest
+from src.cli import main
+from src.sensitivity import run_sweep, threshold_range
+from src.simulator import RiskSimulator
+
+
+class TestSensitivitySweep:
+    """Pruebas del barrido de umbrales con muestras compartidas."""
+    
+    @pytest.fixture
+    def simulator(self):
+        return RiskSimulator()
+    
+    def test_matches_direct_recategorization(self, simulator):
+        """Cada celda coincide con recategorizar la muestra con esos umbrales."""
+        result = run_sweep(simulator, [20, 30], [60, 70], (3, 5), num_sprints=2000, seed=1)
+        
+        # Misma muestra que usa el barrido: prioridades de 5 riesgos por sprint
+        u_probability, u_impact = np.random.default_rng(1).random((2, 2000, 5))
+        priority = (1 + (u_probability * 10).astype(int)) * (1 + (u_impact * 10).astype(int))
+        for k, num_risks in enumerate((3, 5)):
+            sample = priority[:, :num_risks]
+            for i, low in enumerate((20, 30)):
+                for j, high in enumerate((60, 70)):
+                    assert result.metrics["bajo"][k, i, j] == pytest.approx(np.mean(sample <= low))
+                    assert result.metrics["medio"][k, i, j] == pytest.approx(
+                        np.mean((sample > low) & (sample <= high)))
+                    assert result.metrics["prob_algun_alto"][k, i, j] == pytest.approx(
+                        np.mean((sample > high).any(axis=1)))
+    
+    def test_default_thresholds_match_analytic(self, simulator):
+        result = simulator.sensitivity_sweep([30], [70], (5,), num_sprints=50_000, seed=2)
+        expected = simulator.analytic()
+        
+        assert result.metric("alto")[0, 0] == pytest.approx(0.08, abs=0.005)
+        assert result.metric("prob_algun_alto")[0, 0] == pytest.approx(
+            expected.prob_at_least("alto", 1, 5), abs=0.01)
+    
+    def test_invalid_pairs_are_nan(self, simulator):
+        result = simulator.sensitivity_sweep([10, 80], [50], num_sprints=100, seed=3)
+        
+        assert not np.isnan(result.metric("medio")[0, 0])
+        assert np.isnan(result.metric("medio")[1, 0])
+        assert len(result.to_table()) == 1
+    
+    def test_grid_costs_about_one_simulation(self, simulator):
+        """Una grilla de 50×50 umbrales no cuesta mucho más que un solo par."""
+        def elapsed(lows, highs):
+            start = time.perf_counter()
+            run_sweep(simulator, lows, highs, (5,), num_sprints=50_000, seed=4)
+            return time.perf_counter() - start
+        
+        single = min(elapsed([30], [70]) for _ in range(3))
+        grid = min(elapsed(threshold_range(1, 50), threshold_range(51, 100)) for _ in range(3))
+        assert grid < 3 * single
+    
+    def test_csv_and_heatmap(self, simulator, tmp_path):
+        result = simulator.sensitivity_sweep(threshold_range(10, 40, 10), threshold_range(50, 90, 20),
+                                             (5, 8), num_sprints=500, seed=5)
+        
+        assert result.to_csv(str(tmp_path / "barrido.csv")) == 2 * 4 * 3
+        with open(tmp_path / "barrido.csv", newline="", encoding="utf-8") as f:
+            assert next(csv.DictReader(f))["umbral_bajo"] == "10"
+        
+        path = tmp_path / "mapa.png"
+        figure = result.heatmap("prob_algun_alto", 8, str(path))
+        assert path.stat().st_size > 0
+        assert "8 riesgos" in figure.axes[0].get_title()
+        with pytest.raises(ValueError):
+            result.metric("alto", 6)
+    
+    @pytest.mark.parametrize("lows, highs, counts", [
+        ([], [70], (5,)), ([-1], [70], (5,)), ([30], [101], (5,)), ([30], [70], (0,)),
+        ([60, 70], [51, 55], (5,))
+    ])
+    def test_invalid_arguments(self, simulator, lows, highs, counts):
+        with pytest.raises(ValueError):
+            run_sweep(simulator, lows, highs, counts, num_sprints=10)
+    
+    def test_cli(self, tmp_path, capsys):
+        assert main(["sensibilidad", "--riesgos", "5", "--sprints", "500", "--bajos", "20", "40", "10",
+                     "--altos", "60", "80", "10", "--semilla", "1", "--csv", str(tmp_path / "t.csv")]) == 0
+        output = capsys.readouterr().out
+        
+        assert "Combinaciones evaluadas: 9" in output
+        assert (tmp_path / "t.csv").exists()
+    
+    def test_cli_rejects_grid_without_valid_pairs(self, capsys):
+        assert main(["sensibilidad", "--bajos", "60", "70", "1", "--altos", "51", "55", "1"]) == 1
+        assert "umbral" in capsys.readouterr().err
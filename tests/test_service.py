@@ -0,0 +1,173 @@
+import asyncio
+import csv
+import io
+import json
+
+from src.service import SimulationService
+from src.simulator import RiskSimulator
+
+
+async def request(port, method, path, payload=None, raw_body=None):
+    """Cliente HTTP/1.1 mínimo; devuelve (estado, encabezados, cuerpo)."""
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    body = raw_body if raw_body is not None else (json.dumps(payload).encode() if payload is not None else b"")
+    writer.write(f"{method} {path} HTTP/1.1\r\nHost: localhost\r\nConnection: close\r\n"
+                 f"Content-Length: {len(body)}\r\n\r\n".encode() + body)
+    await writer.drain()
+    response = await reader.read()
+    writer.close()
+    await writer.wait_closed()
+    
+    head, _, body = response.partition(b"\r\n\r\n")
+    lines = head.decode().split("\r\n")
+    headers = dict(line.split(": ", 1) for line in lines[1:])
+    if headers.get("Transfer-Encoding") == "chunked":
+        body = decode_chunked(body)
+    return int(lines[0].split()[1]), headers, body
+
+
+def decode_chunked(data: bytes) -> bytes:
+    parts = []
+    while True:
+        size_line, _, data = data.partition(b"\r\n")
+        size = int(size_line, 16)
+        if size == 0:
+            return b"".join(parts)
+        parts.append(data[:size])
+        data = data[size + 2:]
+
+
+def run_service(scenario, **options):
+    """Ejecuta `scenario(service)` con un servicio en un puerto libre."""
+    async def main():
+        async with SimulationService(port=0, **options) as service:
+            return await scenario(service)
+    return asyncio.run(main())
+
+
+class TestSimulationService:
+    """Pruebas del servicio HTTP/JSON local."""
+    
+    def test_health_and_unknown_routes(self):
+        async def scenario(service):
+            return [await request(service.port, "GET", "/salud"),
+                    await request(service.port, "GET", "/nada"),
+                    await request(service.port, "GET", "/sprint")]
+        
+        health, missing, wrong_method = run_service(scenario, workers=0)
+        
+        assert health[0] == 200 and json.loads(health[2])["estado"] == "ok"
+        assert missing[0] == 404
+        assert wrong_method[0] == 405
+    
+    def test_invalid_requests_are_rejected(self):
+        async def scenario(service):
+            return [(await request(service.port, "POST", "/sprint", payload))[0]
+                    for payload in ({"riesgos": -1}, {"riesgos": "5"}, {"umbrales": [80, 20]},
+                                    {"semilla": 1.5}, [1, 2])] + [
+                (await request(service.port, "POST", "/sprint", raw_body=b"{no es json"))[0]]
+        
+        assert run_service(scenario, workers=0) == [400] * 6
+    
+    def test_seeded_sprint_matches_simulator(self):
+        async def scenario(service):
+            return await request(service.port, "POST", "/sprint", {"riesgos": 7, "semilla": 3})
+        
+        status, headers, body = run_service(scenario, workers=0)
+        
+        assert status == 200
+        assert headers["Content-Type"].startswith("application/json")
+        expected = RiskSimulator(rng=3).run_sprint_simulation_batch(7).to_records()
+        assert json.loads(body)["riesgos"] == expected
+    
+    def test_concurrent_requests_are_coalesced(self):
+        """Cientos de solicitudes simultáneas se resuelven en pocos lotes vectorizados."""
+        async def scenario(service):
+            sizes = [1 + i % 9 for i in range(300)]
+            responses = await asyncio.gather(*(
+                request(service.port, "POST", "/sprint", {"riesgos": size}) for size in sizes))
+            metrics = json.loads((await request(service.port, "GET", "/metricas"))[2])
+            return sizes, responses, metrics
+        
+        sizes, responses, metrics = run_service(scenario, workers=0, coalesce_window=0.05)
+        
+        assert all(status == 200 for status, _, _ in responses)
+        assert [len(json.loads(body)["riesgos"]) for _, _, body in responses] == sizes
+        batches = metrics["lotes_agrupados"]
+        assert batches["solicitudes"] == 300
+        assert batches["lotes"] < 300
+        assert metrics["rutas"]["/sprint"]["solicitudes"] == 300
+        assert metrics["rutas"]["/sprint"]["latencia_ms"]["p99"] > 0
+    
+    def test_monte_carlo_uses_pool_and_cache(self):
+        """El resultado no depende de los procesos y una repetición sale de la caché."""
+        payload = {"sprints": 3000, "riesgos": 4, "semilla": 11}
+        
+        async def scenario(service):
+            first = await request(service.port, "POST", "/montecarlo", payload)
+            second = await request(service.port, "POST", "/montecarlo", payload)
+            return first, second, service.cache.hits
+        
+        first, second, hits = run_service(scenario, workers=2)
+        expected = RiskSimulator().run_monte_carlo(3000, 4, seed=11, max_workers=1)
+        
+        assert first[0] == 200 and first[2] == second[2]
+        assert hits == 1
+        result = json.loads(first[2])
+        assert result["sprints"] == 3000
+        assert result == json.loads(json.dumps({**expected.statistics.to_dict(), **{
+            key: result[key] for key in ("sprints", "sprints_con_riesgo_alto", "riesgos_altos_por_sprint")}}))
+    
+    def test_identical_monte_carlo_requests_share_one_run(self):
+        """Las solicitudes idénticas simultáneas esperan la misma simulación."""
+        async def scenario(service):
+            responses = await asyncio.gather(*(
+                request(service.port, "POST", "/montecarlo", {"sprints": 2000, "semilla": i % 10})
+                for i in range(200)))
+            return responses, service.cache.misses
+        
+        responses, misses = run_service(scenario, workers=0)
+        
+        assert all(status == 200 for status, _, _ in responses)
+        assert misses == 10
+        bodies = {i % 10: body for i, (_, _, body) in enumerate(responses)}
+        assert all(body == bodies[i % 10] for i, (_, _, body) in enumerate(responses))
+    
+    def test_batch_is_streamed_in_chunks(self):
+        async def scenario(service):
+            return await request(service.port, "POST", "/lote",
+                                 {"riesgos": 2500, "bloque": 1000, "semilla": 5})
+        
+        status, headers, body = run_service(scenario, workers=0)
+        
+        assert status == 200
+        assert headers["Transfer-Encoding"] == "chunked"
+        rows = list(csv.reader(io.StringIO(body.decode("utf-8"))))
+        assert len(rows) == 2501
+        first = RiskSimulator(rng=5).run_sprint_simulation_batch(1000)[0]
+        assert rows[1][:2] == [first["tipo"], first["descripcion"]]
+    
+    def test_keep_alive_connection(self):
+        """Varias solicitudes por la misma conexión."""
+        async def scenario(service):
+            reader, writer = await asyncio.open_connection("127.0.0.1", service.port)
+            statuses = []
+            for _ in range(3):
+                writer.write(b"GET /salud HTTP/1.1\r\nHost: localhost\r\n\r\n")
+                await writer.drain()
+                head = await reader.readuntil(b"\r\n\r\n")
+                length = int(head.split(b"Content-Length: ")[1].split(b"\r\n")[0])
+                await reader.readexactly(length)
+                statuses.append(int(head.split()[1]))
+            writer.close()
+            await writer.wait_closed()
+            return statuses
+        
+        assert run_service(scenario, workers=0) == [200, 200, 200]
+    
+    def test_cli_rejects_negative_workers(self, capsys):
+        from src.cli import main
+        
+        assert main(["servicio", "--procesos", "-1"]) == 1
+        assert "procesos" in capsys.readouterr().err
+
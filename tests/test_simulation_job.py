@@ -0,0 +1,53 @@
+import pytest
+from src.jobs import SimulationJob
+from src.simulator import RiskSimulator, RiskBatch
+
+
+def _drain(job):
+    """Consume la cola hasta que el trabajo termina."""
+    batches = []
+    while not job.done:
+        job.join(timeout=0.01)
+        batches.extend(job.poll())
+    return batches
+
+
+class TestSimulationJob:
+    """Pruebas de la simulación en segundo plano."""
+    
+    @pytest.fixture
+    def simulator(self):
+        return RiskSimulator()
+    
+    def test_delivers_all_batches(self, simulator):
+        """El trabajo entrega todos los riesgos en bloques y termina."""
+        job = SimulationJob(simulator, 1050, chunk_size=100)
+        job.start()
+        batches = _drain(job)
+        
+        assert [len(b) for b in batches] == [100] * 10 + [50]
+        assert job.completed == 1050
+        assert job.error is None
+        assert len(RiskBatch.concatenate(batches)) == 1050
+    
+    def test_cancel_stops_early(self, simulator):
+        """Al cancelar no se generan más bloques."""
+        job = SimulationJob(simulator, 10_000_000, chunk_size=1000)
+        job.cancel()
+        job.start()
+        _drain(job)
+        
+        assert job.cancelled
+        assert job.completed < 10_000_000
+    
+    def test_errors_are_reported(self, simulator):
+        """Los errores del hilo quedan disponibles para la GUI."""
+        job = SimulationJob(simulator, 10, chunk_size=0)
+        job.start()
+        _drain(job)
+        
+        assert isinstance(job.error, ValueError)
+    
+    def test_negative_total(self, simulator):
+        with pytest.raises(ValueError):
+            SimulationJob(simulator, -1)
@@ -0,0 +1,76 @@
+import numpy as np
+import pytest
+from src.simulator import RiskSimulator, RiskStatistics, RiskBatch
+
+
+class TestRiskStatistics:
+    """Pruebas del acumulador de estadísticas."""
+    
+    @pytest.fixture
+    def simulator(self):
+        return RiskSimulator()
+    
+    def test_empty(self):
+        """Un acumulador vacío no falla al consultarse."""
+        stats = RiskStatistics()
+        assert stats.count == 0
+        assert stats.mean == 0.0
+        assert stats.variance == 0.0
+        assert stats.max_priority == 0
+        assert stats.most_critical is None
+    
+    def test_matches_direct_computation(self, simulator):
+        """Los resultados coinciden con calcularlos sobre la lista completa."""
+        risks = simulator.run_sprint_simulation(500)
+        stats = RiskStatistics.from_risks(risks)
+        values = np.array([r["valor_prioridad"] for r in risks])
+        
+        assert stats.count == 500
+        assert stats.mean == pytest.approx(values.mean())
+        assert stats.variance == pytest.approx(values.var())
+        assert stats.max_priority == values.max()
+        assert sum(stats.type_counts.values()) == 500
+        assert stats.category_distribution()["alto"] == \
+            sum(1 for r in risks if r["categoria_prioridad"] == "alto") / 500
+        assert stats.histogram[1:].sum() == 500
+    
+    def test_batch_and_records_agree(self, simulator):
+        """La ruta vectorizada y la de registros dan el mismo resultado."""
+        batch = simulator.run_sprint_simulation_batch(3000)
+        from_batch = RiskStatistics(top_k=20).update(batch)
+        from_records = RiskStatistics(top_k=20).update(batch.to_records())
+        
+        assert from_batch.to_dict() == from_records.to_dict()
+    
+    def test_top_risks_keep_first_on_ties(self, simulator):
+        """Los más críticos se ordenan por prioridad y, ante empates, por llegada."""
+        batch = simulator.run_sprint_simulation_batch(2000)
+        stats = RiskStatistics(top_k=5).update(batch)
+        
+        order = sorted(range(len(batch)), key=lambda i: (-batch[i]["valor_prioridad"], i))[:5]
+        assert stats.top_risks == [dict(batch[i]) for i in order]
+    
+    def test_merge_is_exact(self, simulator):
+        """Combinar acumuladores parciales equivale a uno solo."""
+        batches = [simulator.run_sprint_simulation_batch(n) for n in (100, 1000, 1, 0, 700)]
+        single = RiskStatistics().update(RiskBatch.concatenate(batches))
+        
+        merged = RiskStatistics()
+        for batch in batches:
+            merged.merge(RiskStatistics().update(batch))
+        
+        assert merged.to_dict() == single.to_dict()
+    
+    def test_monte_carlo_statistics(self, simulator):
+        """Los agregados Monte Carlo incluyen estadísticas combinadas."""
+        result = simulator.run_monte_carlo(2100, 3, seed=5, max_workers=1)
+        stats = result.statistics
+        
+        assert stats.count == 6300
+        assert stats.mean == pytest.approx(result.priority_sum.sum() / 6300)
+        assert stats.max_priority == result.priority_max.max()
+        assert list(stats.category_counts) == list(result.category_counts.sum(axis=0))
+    
+    def test_invalid_top_k(self):
+        with pytest.raises(ValueError):
+            RiskStatistics(top_k=-1)
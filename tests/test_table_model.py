@@ -0,0 +1,67 @@
+import numpy as np
+import pytest
+from src.simulator import RiskSimulator
+from src.table_model import RiskTableModel
+
+
+class TestRiskTableModel:
+    """Pruebas del modelo de la tabla virtualizada."""
+    
+    @pytest.fixture
+    def batch(self):
+        return RiskSimulator().run_sprint_simulation_batch(5000)
+    
+    def test_empty_model(self):
+        """Sin datos no hay filas ni ventana."""
+        model = RiskTableModel()
+        assert len(model) == 0
+        assert model.window(0, 10) is None
+    
+    def test_window_in_original_order(self, batch):
+        """Sin orden ni filtro la ventana respeta el orden de simulación."""
+        model = RiskTableModel(batch)
+        
+        assert len(model) == len(batch)
+        assert model.window(100, 20).to_records() == batch[100:120].to_records()
+        assert len(model.window(len(batch) - 5, 20)) == 5
+    
+    def test_filter_by_category(self, batch):
+        """El filtro deja solo las filas de la categoría elegida."""
+        model = RiskTableModel(batch)
+        model.set_filter("alto")
+        
+        expected = int(np.sum(batch.column("categoria_prioridad") == "alto"))
+        assert len(model) == expected
+        assert all(r["categoria_prioridad"] == "alto" for r in model.window(0, len(model)))
+        
+        model.set_filter(None)
+        assert len(model) == len(batch)
+        with pytest.raises(ValueError):
+            model.set_filter("critico")
+    
+    @pytest.mark.parametrize("field", ["valor_prioridad", "descripcion", "tipo", "categoria_prioridad"])
+    def test_sort(self, batch, field):
+        """El orden coincide con ordenar las filas en Python."""
+        model = RiskTableModel(batch)
+        model.sort_by(field)
+        ascending = [r[field] for r in model.window(0, len(model))]
+        model.sort_by(field, descending=True)
+        descending = [r[field] for r in model.window(0, len(model))]
+        
+        key = (lambda v: ["bajo", "medio", "alto"].index(v)) if field == "categoria_prioridad" else None
+        assert ascending == sorted(ascending, key=key)
+        assert descending == sorted(descending, key=key, reverse=True)
+    
+    def test_sort_and_filter_survive_new_data(self, batch):
+        """Filtro y orden se mantienen al cambiar los datos de respaldo."""
+        model = RiskTableModel(batch)
+        model.set_filter("medio")
+        model.sort_by("valor_prioridad", descending=True)
+        model.set_batch(batch[:1000])
+        
+        values = [r["valor_prioridad"] for r in model.window(0, len(model))]
+        assert values == sorted(values, reverse=True)
+        assert all(31 <= v <= 70 for v in values)
+        
+        with pytest.raises(KeyError):
+            model.sort_by("inexistente")
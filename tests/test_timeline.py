@@ -0,0 +1,106 @@
+import time
+
+import numpy as np
+import pytest
+from src.cli import main
+from src.simulator import RiskSimulator
+from src.timeline import TimelineModel
+
+
+class TestTimelineModel:
+    """Pruebas del modelo de riesgos persistentes entre sprints."""
+    
+    @pytest.fixture
+    def simulator(self):
+        return RiskSimulator()
+    
+    def test_without_persistence_matches_independent_sprints(self, simulator):
+        """Sin persistencia cada sprint es independiente, como en run_monte_carlo."""
+        result = simulator.timelines(persistence=0.0).simulate(4000, 3, 5, seed=1)
+        
+        assert np.all(result.open_risks() == 5)
+        assert result.mean_priority_by_sprint() == pytest.approx([30.25] * 3, abs=0.5)
+        shares = result.category_counts.sum(axis=(0, 1)) / result.open_risks().sum()
+        assert shares == pytest.approx([0.61, 0.31, 0.08], abs=0.01)
+    
+    def test_open_risks_reach_steady_state(self, simulator):
+        """Con persistencia p los abiertos tienden a new_risks / (1 - p)."""
+        result = simulator.timelines(persistence=0.5).simulate(5000, 30, 4, seed=2)
+        
+        assert result.mean_open_by_sprint()[0] == 4
+        assert result.mean_open_by_sprint()[-1] == pytest.approx(8.0, rel=0.03)
+        assert result.dropped_risks.sum() == 0
+        # Lo que entra menos lo que sale es el cambio de riesgos abiertos
+        np.testing.assert_array_equal(
+            result.open_risks()[:, 1:] - result.open_risks()[:, :-1],
+            result.new_risks[:, 1:] - result.closed_risks[:, 1:]
+        )
+    
+    def test_mitigation_lowers_priority(self, simulator):
+        """Los riesgos persistentes mitigados bajan la prioridad promedio."""
+        model = simulator.timelines(persistence=0.9, probability_mitigation=0.5, impact_mitigation=0.5)
+        unmitigated = simulator.timelines(persistence=0.9, probability_mitigation=0.0,
+                                          impact_mitigation=0.0)
+        
+        mitigated_mean = model.simulate(2000, 20, 3, seed=3).mean_priority_by_sprint()[-1]
+        unmitigated_mean = unmitigated.simulate(2000, 20, 3, seed=3).mean_priority_by_sprint()[-1]
+        
+        assert unmitigated_mean == pytest.approx(30.25, abs=1.0)
+        assert mitigated_mean < unmitigated_mean / 2
+    
+    def test_type_correlation_widens_spread(self, simulator):
+        """La correlación no cambia la media pero aumenta la dispersión entre sprints."""
+        independent = simulator.timelines(persistence=0.0).simulate(5000, 2, 10, seed=4)
+        correlated = simulator.timelines(persistence=0.0, type_correlation=0.9,
+                                         cross_type_correlation=1.0).simulate(5000, 2, 10, seed=4)
+        
+        assert correlated.mean_priority_by_sprint() == pytest.approx(
+            independent.mean_priority_by_sprint(), abs=1.0)
+        assert correlated.priority_sum.std() > 2 * independent.priority_sum.std()
+    
+    def test_empirical_correlation_matches_parameters(self, simulator):
+        """La correlación medida entre dos riesgos es el parámetro, no su cuadrado."""
+        def correlations(model, seed):
+            new_type, probability, _ = model._sample_new_risks(np.random.default_rng(seed), 200_000, 2)
+            same = new_type[:, 0] == new_type[:, 1]
+            return (np.corrcoef(probability[same].T)[0, 1], np.corrcoef(probability[~same].T)[0, 1])
+        
+        same_type, cross_type = correlations(simulator.timelines(type_correlation=0.5), 8)
+        assert same_type == pytest.approx(0.5, abs=0.02)
+        assert cross_type == pytest.approx(0.0, abs=0.02)
+        
+        same_type, cross_type = correlations(
+            simulator.timelines(type_correlation=0.6, cross_type_correlation=0.5), 9)
+        assert same_type == pytest.approx(0.6, abs=0.02)
+        assert cross_type == pytest.approx(0.3, abs=0.02)
+    
+    def test_capacity_limit_drops_risks(self, simulator):
+        result = simulator.timelines(persistence=1.0, max_open_risks=6).simulate(10, 4, 2, seed=5)
+        
+        assert result.open_risks()[:, -1].tolist() == [6] * 10
+        assert result.dropped_risks.sum() == 10 * 2
+    
+    def test_reproducible_with_seed(self, simulator):
+        model = TimelineModel(simulator, type_correlation=0.3)
+        first, second = model.simulate(100, 10, seed=6), model.simulate(100, 10, seed=6)
+        
+        np.testing.assert_array_equal(first.type_counts, second.type_counts)
+        assert first.summary() == second.summary()
+    
+    def test_ten_thousand_timelines_in_seconds(self, simulator):
+        start = time.perf_counter()
+        result = simulator.timelines().simulate(10_000, 50, 5, seed=7)
+        
+        assert result.priority_sum.shape == (10_000, 50)
+        assert time.perf_counter() - start < 10
+    
+    @pytest.mark.parametrize("parameters", [
+        {"persistence": 1.5}, {"type_correlation": -0.1}, {"max_open_risks": 0}
+    ])
+    def test_invalid_parameters(self, simulator, parameters):
+        with pytest.raises(ValueError):
+            simulator.timelines(**parameters)
+    
+    def test_cli(self, capsys):
+        assert main(["evolucion", "--lineas", "200", "--sprints", "3", "--semilla", "1", "--json"]) == 0
+        assert "prob_algun_alto" in capsys.readouterr().out